@@ -0,0 +1,64 @@
+"""Benchmark loading the configuration of many tenants with load_many().
+
+Every tenant resolves its integration settings against the fake Stormpath
+API of tests/fake_api.py, slowed down by `--latency` seconds per request.
+The tenants are loaded one after another (like separate ConfigLoader.load()
+calls would) and with load_many().
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_bulk --tenants 100 --latency 0.01
+"""
+
+
+from argparse import ArgumentParser
+from time import time
+
+from stormpath_config.bulk import load_many
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import EnrichIntegrationFromRemoteConfigStrategy, \
+    ExtendConfigStrategy, \
+    LoadFileConfigStrategy
+
+from tests.fake_api import FakeAPI
+
+
+def base_loader():
+    return ConfigLoader([LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True)])
+
+
+def tenant_loader(tenant, api):
+    return ConfigLoader([
+        ExtendConfigStrategy(extend_with={
+            'client': {'apiKey': {'id': tenant, 'secret': 'secret'}},
+            'application': {'href': api.application_href(0)},
+        }),
+    ], validation_strategies=[
+        EnrichIntegrationFromRemoteConfigStrategy(api.client),
+    ])
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.01, help='seconds per API call')
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    tenants = ['tenant%d' % i for i in range(args.tenants)]
+    api = FakeAPI(latency=args.latency)
+
+    start = time()
+    for tenant in tenants:
+        tenant_loader(tenant, api).load(base_loader().load())
+    elapsed = time() - start
+    print('sequential loads:        %8.1f tenants/s' % (len(tenants) / elapsed))
+
+    loaders = dict((tenant, tenant_loader(tenant, api)) for tenant in tenants)
+    result = load_many(loaders, base_loader(), max_workers=args.workers)
+    print('load_many(%3d workers):  %8.1f tenants/s (%d errors)' % (
+        args.workers, result.tenants_per_second, len(result.errors)))
+
+
+if __name__ == '__main__':
+    main()
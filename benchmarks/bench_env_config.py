@@ -0,0 +1,74 @@
+"""Benchmark LoadEnvConfigStrategy on a large configuration.
+
+Compares the strategy with the FlatDict round trip it used to perform (one
+environ lookup per leaf of the configuration), on a synthetic configuration
+with 2,000 keys, with no, a few and a hundred STORMPATH_* variables set.
+The comparison needs the flatdict package.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_env_config
+"""
+
+
+from os import environ
+from timeit import repeat
+
+from stormpath_config.helpers import _extend_dict
+from stormpath_config.strategies import LoadEnvConfigStrategy
+from stormpath_config.strategies.load_env_config import _leaf_paths
+
+from .bench_parsers import synthetic_config
+
+
+def flatdict_process(prefix, aliases, config):
+    """The FlatDict based implementation, kept for comparison."""
+    from flatdict import FlatDict
+
+    config = FlatDict(config, delimiter='_')
+    environ_config = {}
+
+    for key in config.keys():
+        env_key = '_'.join([prefix, key.upper()])
+        env_key = aliases.get(env_key, env_key)
+        value = environ.get(env_key)
+
+        if value:
+            if isinstance(config[key], int):
+                value = int(value)
+
+            environ_config[key] = value
+
+    _extend_dict(config, environ_config)
+
+    return config.as_dict()
+
+
+def overrides(config, count):
+    """Return `count` environment variables overriding leaves of config."""
+    paths = sorted(_leaf_paths(config))[:count]
+
+    return dict(('_'.join(['STORMPATH'] + [key.upper() for key in path]), '1') for path in paths)
+
+
+def main():
+    config = synthetic_config(2000)
+    strategy = LoadEnvConfigStrategy('STORMPATH')
+
+    for count in (0, 3, 100):
+        variables = overrides(config, count)
+        environ.update(variables)
+        try:
+            print('%d overrides' % count)
+            for name, process in (
+                    ('FlatDict round trip', lambda: flatdict_process('STORMPATH', {}, config)),
+                    ('LoadEnvConfigStrategy', lambda: strategy.process(config))):
+                best = min(repeat(process, number=10, repeat=3)) / 10
+                print('    %-24s %10.3f ms' % (name, best * 1000))
+        finally:
+            for key in variables:
+                del environ[key]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark reading a configuration that is reloaded concurrently.
+
+Reader threads fetch the current configuration and read a value from it,
+while a writer thread keeps reloading the configuration.  Reads through
+ConfigHolder.get() are compared with reads guarded by a lock and with
+reads returning a deep copy, the usual ways of sharing a mutable
+configuration between threads.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_holder --readers 4 --seconds 2
+"""
+
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from threading import Event, Lock, Thread
+from time import sleep
+
+from stormpath_config.holder import ConfigHolder
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import LoadFileConfigStrategy
+
+
+def loader():
+    return ConfigLoader([LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True)], frozen=True)
+
+
+class LockedHolder(object):
+    """Shares a configuration by guarding reads and reloads with a lock."""
+    def __init__(self, loader, copy=False):
+        self.loader = loader
+        self.copy = copy
+        self._lock = Lock()
+        self._config = loader.reload()
+
+    def get(self):
+        with self._lock:
+            return deepcopy(self._config) if self.copy else self._config
+
+    def reload(self):
+        config = self.loader.reload()
+        with self._lock:
+            self._config = config
+
+
+def run(holder, readers, seconds):
+    stopped = Event()
+    counts = [0] * readers
+    reloads = [0]
+
+    def read(i):
+        count = 0
+        while not stopped.is_set():
+            for _ in range(100):
+                holder.get()['client']['baseUrl']
+            count += 100
+        counts[i] = count
+
+    def write():
+        while not stopped.is_set():
+            holder.reload()
+            reloads[0] += 1
+
+    threads = [Thread(target=read, args=(i,)) for i in range(readers)] + [Thread(target=write)]
+    for thread in threads:
+        thread.start()
+
+    sleep(seconds)
+    stopped.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts) / seconds, reloads[0] / seconds
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    holders = [
+        ('ConfigHolder.get()', ConfigHolder(loader())),
+        ('lock-guarded reads', LockedHolder(loader())),
+        ('deepcopy reads', LockedHolder(loader(), copy=True)),
+    ]
+    for name, holder in holders:
+        reads, reloads = run(holder, args.readers, args.seconds)
+        print('%-20s %12.0f reads/s %8.1f reloads/s' % (name, reads, reloads))
+
+
+if __name__ == '__main__':
+    main()
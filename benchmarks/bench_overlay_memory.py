@@ -0,0 +1,99 @@
+"""Benchmark the memory held by many tenant configurations.
+
+Builds the configuration of `--tenants` tenants on top of a base
+configuration (default_config.yml, plus a synthetic `web` section the size
+of the Stormpath integrations' defaults), once as fully materialized
+dictionaries and once as OverlayConfig views sharing the base.  Reports the
+memory allocated for them (tracemalloc) and the resident set size growth.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_overlay_memory --tenants 1000
+"""
+
+
+from argparse import ArgumentParser
+from copy import deepcopy
+import gc
+import os
+import tracemalloc
+
+from stormpath_config.helpers import _extend_dict
+from stormpath_config.overlay import OverlayConfig, ValuePool
+from stormpath_config.parsers import parse_config
+
+
+def base_config():
+    with open('tests/assets/default_config.yml', 'r') as f:
+        config = parse_config(f.read(), 'default_config.yml')
+
+    config['web'] = dict(
+        ('feature%d' % i, {
+            'enabled': i % 2 == 0,
+            'uri': '/feature%d' % i,
+            'nextUri': '/',
+            'view': 'feature%d' % i,
+            'form': {'fields': dict(('field%d' % j, {'enabled': True, 'label': 'Field %d' % j})
+                                    for j in range(5))},
+        }) for i in range(40))
+
+    return config
+
+
+def tenant_config(base, i):
+    return _extend_dict(deepcopy(base), {
+        'client': {'apiKey': {'id': 'ID%d' % i, 'secret': 'SECRET%d' % i}},
+        'application': {'name': 'Tenant %d' % i, 'href': 'https://api.stormpath.com/v1/applications/%d' % i},
+        'web': {'feature%d' % (i % 40): {'enabled': True}},
+    })
+
+
+def rss():
+    """Return the resident set size in bytes, or None if unavailable."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def measure(build):
+    gc.collect()
+    rss_before = rss()
+    tracemalloc.start()
+    configs = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    rss_after = rss()
+
+    return configs, allocated, (rss_after - rss_before) if rss_before is not None else None
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=1000)
+    args = parser.parse_args()
+
+    base = base_config()
+
+    def materialized():
+        return [tenant_config(base, i) for i in range(args.tenants)]
+
+    def overlays():
+        pool = ValuePool()
+        shared = pool.config(base)
+        return [OverlayConfig.from_config(shared, tenant_config(base, i), pool) for i in range(args.tenants)]
+
+    # Overlays go first, as the RSS doesn't shrink once materialized dicts
+    # have been freed.
+    for name, build in (('overlays', overlays), ('materialized dicts', materialized)):
+        configs, allocated, rss_growth = measure(build)
+        print('%-20s %8.2f MiB allocated, RSS +%s' % (
+            name, allocated / 1048576.0,
+            '%.2f MiB' % (rss_growth / 1048576.0) if rss_growth is not None else 'n/a'))
+        del configs
+
+
+if __name__ == '__main__':
+    main()
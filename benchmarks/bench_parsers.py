@@ -0,0 +1,76 @@
+"""Benchmark the configuration file parsers.
+
+Compares the pure Python YAML loader, the LibYAML backed loader (if
+available) and the json module on the default configuration file and on a
+synthetic configuration with 10,000 keys.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_parsers
+"""
+
+
+from json import dumps
+from timeit import repeat
+
+import yaml
+
+from stormpath_config.parsers import parse_config
+
+
+DEFAULT_CONFIG = 'tests/assets/default_config.yml'
+
+
+def synthetic_config(keys=10000, width=10):
+    """Build a nested configuration with `keys` leaves, `width` per node."""
+    config = {}
+    for i in range(keys):
+        node = config
+        path = []
+        n = i
+        while n >= width:
+            path.append('section%d' % (n % width))
+            n //= width
+        for part in path:
+            node = node.setdefault(part, {})
+        node['key%d' % i] = 'value%d' % i if i % 2 else i
+
+    return config
+
+
+def parsers():
+    candidates = [
+        ('yaml.SafeLoader', lambda data: yaml.load(data, Loader=yaml.SafeLoader)),
+    ]
+    if getattr(yaml, '__with_libyaml__', False):
+        candidates.append(('yaml.CSafeLoader', lambda data: yaml.load(data, Loader=yaml.CSafeLoader)))
+
+    return candidates
+
+
+def bench(label, data, candidates, number):
+    print('%s (%d bytes)' % (label, len(data)))
+    for name, parse in candidates:
+        best = min(repeat(lambda: parse(data), number=number, repeat=3)) / number
+        print('    %-24s %10.3f ms' % (name, best * 1000))
+
+
+def main():
+    with open(DEFAULT_CONFIG, 'r') as f:
+        default_yaml = f.read()
+
+    bench(DEFAULT_CONFIG, default_yaml,
+          parsers() + [('parse_config', lambda data: parse_config(data, DEFAULT_CONFIG))], 200)
+
+    config = synthetic_config()
+    synthetic_yaml = yaml.safe_dump(config, default_flow_style=False)
+    synthetic_json = dumps(config)
+
+    bench('synthetic 10k keys, YAML', synthetic_yaml,
+          parsers() + [('parse_config', lambda data: parse_config(data, 'synthetic.yml'))], 3)
+    bench('synthetic 10k keys, JSON', synthetic_json,
+          parsers() + [('parse_config', lambda data: parse_config(data, 'synthetic.json'))], 3)
+
+
+if __name__ == '__main__':
+    main()
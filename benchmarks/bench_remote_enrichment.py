@@ -0,0 +1,61 @@
+"""Benchmark the remote strategies against a slow API.
+
+Both strategies run against the fake Stormpath API of tests/fake_api.py,
+where every request sleeps for `--latency` seconds, like an HTTP round trip
+to the Stormpath API would.  EnrichIntegrationFromRemoteConfigStrategy is
+run with the remote settings fetched sequentially and concurrently, and
+EnrichClientFromRemoteConfigStrategy resolves an application by name among
+`--applications` applications.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.bench_remote_enrichment --latency 0.05 --applications 500
+"""
+
+
+from argparse import ArgumentParser
+from time import time
+
+from stormpath_config.strategies import EnrichClientFromRemoteConfigStrategy, \
+    EnrichIntegrationFromRemoteConfigStrategy
+
+from tests.fake_api import FakeAPI
+
+
+def bench(api, strategy, config, rounds):
+    api.reset()
+    start = time()
+    for _ in range(rounds):
+        strategy.process(dict((k, dict(v)) for k, v in config.items()))
+
+    return (time() - start) / rounds, api.requests // rounds
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds per API call')
+    parser.add_argument('--applications', type=int, default=100)
+    parser.add_argument('--account-store-mappings', type=int, default=3)
+    parser.add_argument('--page-size', type=int, default=25)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    api = FakeAPI(applications=args.applications, account_store_mappings=args.account_store_mappings,
+                  latency=args.latency, page_size=args.page_size)
+
+    print('latency per API call: %.1f ms' % (args.latency * 1000))
+    print('EnrichIntegrationFromRemoteConfigStrategy')
+    for max_workers in (None, 3):
+        strategy = EnrichIntegrationFromRemoteConfigStrategy(api.client, max_workers=max_workers)
+        elapsed, requests = bench(api, strategy, {'application': {'href': api.application_href(0)}}, args.rounds)
+        print('    max_workers=%-6s %8.1f ms per load, %d requests' % (max_workers, elapsed * 1000, requests))
+
+    print('EnrichClientFromRemoteConfigStrategy')
+    strategy = EnrichClientFromRemoteConfigStrategy(api.client)
+    name = 'Application %d' % (args.applications - 1)
+    elapsed, requests = bench(api, strategy, {'application': {'name': name}}, args.rounds)
+    print('    by name               %8.1f ms per load, %d requests' % (elapsed * 1000, requests))
+
+
+if __name__ == '__main__':
+    main()
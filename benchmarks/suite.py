@@ -0,0 +1,300 @@
+"""Benchmark suite for the configuration pipeline.
+
+Measures the best time of several runs and the peak memory allocated
+(tracemalloc, Python 3.4+) of:
+
+* ConfigLoader.load() with the default strategy stack,
+* _extend_dict() on deep and wide trees,
+* _load_properties() on large .properties files,
+* LoadEnvConfigStrategy with 100 to 10,000 environment variables,
+* parse_config() on synthetic YAML and JSON configurations of 1 KB to 10 MB.
+
+Results can be saved as a baseline, and later runs compared against it:
+every benchmark slower (or using more memory) than the baseline by more
+than the tolerance is reported as a regression, and the suite exits with
+status 1.  Baselines are machine specific, so record one on the machine the
+comparisons run on.
+
+Run it from the repository root:
+
+    $ python -m benchmarks.suite --save-baseline
+    $ python -m benchmarks.suite --tolerance 0.25
+    $ python -m benchmarks.suite --quick --filter parse
+"""
+
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from json import dump, dumps, load
+from os import environ, path
+import platform
+import shutil
+import sys
+import tempfile
+from timeit import default_timer
+
+import yaml
+
+from stormpath_config.helpers import _extend_dict, _load_properties
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.parsers import parse_config
+from stormpath_config.strategies import ExtendConfigStrategy, \
+    LoadAPIKeyConfigStrategy, \
+    LoadAPIKeyFromConfigStrategy, \
+    LoadEnvConfigStrategy, \
+    LoadFileConfigStrategy, \
+    ValidateClientConfigStrategy
+
+from .bench_parsers import synthetic_config
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+DEFAULT_BASELINE = path.join(path.dirname(__file__), 'baseline.json')
+
+KB = 1024
+MB = 1024 * KB
+
+
+class Benchmark(object):
+    """
+    A benchmark.
+
+    :param str name: The name results are recorded under.
+    :param run: The function measured.  It's called with the value returned
+        by `setup`, if any.
+    :param setup: A function called before every run, outside of the
+        measured time.
+    :param int repeat: The number of runs, of which the best time is kept.
+    """
+    def __init__(self, name, run, setup=None, repeat=5):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.repeat = repeat
+
+    def _call(self):
+        args = (self.setup(),) if self.setup is not None else ()
+        start = default_timer()
+        self.run(*args)
+        return default_timer() - start
+
+    def measure(self):
+        """
+        Return the best time of the runs, in seconds, and the peak memory
+        allocated by one run, in bytes (None without tracemalloc).
+        """
+        best = min(self._call() for _ in range(self.repeat))
+
+        peak = None
+        if tracemalloc is not None:
+            args = (self.setup(),) if self.setup is not None else ()
+            tracemalloc.start()
+            try:
+                self.run(*args)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        return {'time': best, 'peak_memory': peak}
+
+
+def default_loader():
+    """The default strategy stack, as used in test_edge_cases.py."""
+    client_config = {
+        'client': {
+            'apiKey': {
+                'id': 'CLIENT_CONFIG_API_KEY_ID',
+                'secret': 'CLIENT_CONFIG_API_KEY_SECRET',
+            }
+        }
+    }
+
+    return ConfigLoader([
+        LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True),
+        LoadAPIKeyConfigStrategy('i-do-not-exist'),
+        LoadFileConfigStrategy('i-do-not-exist'),
+        LoadAPIKeyConfigStrategy('i-do-not-exist'),
+        LoadFileConfigStrategy('i-do-not-exist'),
+        LoadEnvConfigStrategy(prefix='STORMPATH'),
+        ExtendConfigStrategy(extend_with=client_config),
+    ], [LoadAPIKeyFromConfigStrategy()], [ValidateClientConfigStrategy()])
+
+
+def deep_tree(depth, leaf):
+    tree = {'leaf': leaf}
+    for i in range(depth):
+        tree = {'level%d' % i: tree, 'leaf': leaf}
+
+    return tree
+
+
+def wide_tree(width, leaf):
+    return dict(('key%d' % i, {'value': leaf, 'other': i}) for i in range(width))
+
+
+def sized_config(size):
+    """Return a synthetic configuration whose JSON is about `size` bytes."""
+    return synthetic_config(keys=max(1, size // 28))
+
+
+def size_label(size):
+    return '%dMB' % (size // MB) if size >= MB else '%dKB' % (size // KB)
+
+
+class EnvironVariables(object):
+    """Sets `count` environment variables, a few of them STORMPATH_ ones."""
+    def __init__(self, count):
+        self.variables = dict(('BENCHMARK_VARIABLE_%d' % i, 'value%d' % i) for i in range(count))
+        self.variables['STORMPATH_CLIENT_APIKEY_ID'] = 'env api key id'
+        self.variables['STORMPATH_APPLICATION_NAME'] = 'env application name'
+
+    def __enter__(self):
+        self.saved = dict(environ)
+        environ.update(self.variables)
+
+    def __exit__(self, *exc_info):
+        environ.clear()
+        environ.update(self.saved)
+
+
+def benchmarks(workdir, quick=False):
+    """
+    Yield (name, factory) pairs.  Calling a factory builds the benchmark's
+    fixtures, and returns a (benchmark, context manager or None) pair, so
+    benchmarks skipped by --filter don't build theirs.
+    """
+    yield 'loader.load.default_stack', \
+        lambda: (Benchmark('loader.load.default_stack', lambda: default_loader().load(), repeat=20), None)
+
+    def extend_dict(name, build):
+        tree, extend_with = build('value'), build('other')
+        return Benchmark(name, lambda original: _extend_dict(original, extend_with),
+                         setup=lambda: deepcopy(tree)), None
+
+    for kind, build in (('deep', lambda leaf: deep_tree(200, leaf)), ('wide', lambda leaf: wide_tree(20000, leaf))):
+        name = 'helpers._extend_dict.%s' % kind
+        yield name, lambda name=name, build=build: extend_dict(name, build)
+
+    def load_properties(name, lines):
+        fname = path.join(workdir, 'apiKey%d.properties' % lines)
+        with open(fname, 'w') as f:
+            f.write('# A large properties file.\n')
+            for i in range(lines):
+                f.write('key.%d = value %d\n' % (i, i))
+
+        return Benchmark(name, lambda: _load_properties(fname)), None
+
+    for lines in (1000, 100000):
+        name = 'helpers._load_properties.%d_lines' % lines
+        yield name, lambda name=name, lines=lines: load_properties(name, lines)
+
+    def load_env(name, count):
+        config = default_loader().load()
+        strategy = LoadEnvConfigStrategy(prefix='STORMPATH')
+        return Benchmark(name, lambda: strategy.process(config), repeat=20), EnvironVariables(count)
+
+    for count in (100, 1000, 10000):
+        name = 'strategies.LoadEnvConfigStrategy.%d_variables' % count
+        yield name, lambda name=name, count=count: load_env(name, count)
+
+    def parse(name, size, fmt):
+        sized = sized_config(size)
+        data = dumps(sized) if fmt == 'json' else yaml.safe_dump(sized, default_flow_style=False)
+        file_path = 'synthetic.%s' % fmt
+        return Benchmark(name, lambda: parse_config(data, file_path), repeat=3 if size >= MB else 5), None
+
+    sizes = (KB, 100 * KB, MB) if quick else (KB, 100 * KB, MB, 10 * MB)
+    for size in sizes:
+        for fmt in ('json', 'yaml'):
+            name = 'parsers.parse_config.%s.%s' % (fmt, size_label(size))
+            yield name, lambda name=name, size=size, fmt=fmt: parse(name, size, fmt)
+
+
+def compare(results, baseline, tolerance):
+    """Return the (name, metric, baseline, result) tuples of regressions."""
+    regressions = []
+    for name, result in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        for metric in ('time', 'peak_memory'):
+            if result[metric] is None or not previous.get(metric):
+                continue
+
+            if result[metric] > previous[metric] * (1 + tolerance):
+                regressions.append((name, metric, previous[metric], result[metric]))
+
+    return regressions
+
+
+def format_metric(metric, value):
+    if value is None:
+        return 'n/a'
+
+    if metric == 'time':
+        return '%.3f ms' % (value * 1000)
+
+    return '%.1f KiB' % (value / 1024.0)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='The baseline file.')
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The slowdown, as a fraction of the baseline, reported as a regression.')
+    parser.add_argument('--filter', default='', help='Only run the benchmarks whose name contains this.')
+    parser.add_argument('--quick', action='store_true', help='Skip the 10 MB parsing benchmarks.')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    results = {}
+    try:
+        for name, factory in benchmarks(workdir, args.quick):
+            if args.filter not in name:
+                continue
+
+            benchmark, context = factory()
+            if context is not None:
+                with context:
+                    results[benchmark.name] = result = benchmark.measure()
+            else:
+                results[benchmark.name] = result = benchmark.measure()
+
+            print('%-52s %12s %14s' % (
+                benchmark.name, format_metric('time', result['time']),
+                format_metric('peak_memory', result['peak_memory'])))
+    finally:
+        shutil.rmtree(workdir)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            dump({'python': platform.python_version(), 'results': results}, f, indent=2, sort_keys=True)
+        print('Baseline saved to %s.' % args.baseline)
+        return
+
+    if not path.isfile(args.baseline):
+        print('No baseline at %s; run with --save-baseline to record one.' % args.baseline)
+        return
+
+    with open(args.baseline, 'r') as f:
+        baseline = load(f)
+
+    regressions = compare(results, baseline['results'], args.tolerance)
+    for name, metric, previous, result in regressions:
+        print('REGRESSION %s %s: %s -> %s' % (
+            name, metric, format_metric(metric, previous), format_metric(metric, result)))
+
+    if regressions:
+        sys.exit(1)
+
+    print('No regressions against %s (Python %s).' % (args.baseline, baseline.get('python')))
+
+
+if __name__ == '__main__':
+    main()
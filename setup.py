@@ -36,15 +36,14 @@ setup(
     zip_safe = False,
     keywords = ['stormpath', 'configuration'],
     install_requires = [
-        'flatdict>=1.2.0',
-        'path.py==8.1.2',
+        'futures>=3.0; python_version < "3"',
         'pyjavaproperties==0.6',
         'pyyaml>=3.11',
     ],
     extras_require = {
         'test': ['codacy-coverage', 'mock', 'pytest', 'pytest-cov', 'python-coveralls', 'stormpath'],
     },
-    packages = find_packages(exclude=['*.tests', '*.tests.*', 'tests.*', 'tests']),
+    packages = find_packages(exclude=['*.tests', '*.tests.*', 'tests.*', 'tests', 'benchmarks', 'benchmarks.*']),
     classifiers = [
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
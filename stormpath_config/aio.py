@@ -0,0 +1,97 @@
+"""Asynchronous configuration loading, available on Python 3.5+.
+
+Strategies can implement a `process_async(config, executor=None)` coroutine,
+which is passed the executor given to `load_async()`, if any, to run
+blocking work on.  Strategies that only implement `process(config)` are run
+on that executor, so file reads and API calls never block the event loop.
+"""
+
+
+import asyncio
+
+
+async def process_async(strategy, config, executor=None):
+    """
+    Process the configuration with a strategy without blocking the event loop.
+
+    :param obj strategy: The strategy to run.
+    :param dict config: The configuration to process.
+    :param executor: The executor synchronous strategies are run on.
+        Defaults to the event loop's default executor.
+    :rtype: dict
+    :returns: The processed configuration.
+    """
+    strategy_process_async = getattr(strategy, 'process_async', None)
+    if strategy_process_async is not None:
+        if executor is None:
+            return await strategy_process_async(config)
+
+        return await strategy_process_async(config, executor)
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, strategy.process, config)
+
+
+async def process_remote_async(strategy, config, executor=None):
+    """
+    Run one of the Enrich*FromRemoteConfigStrategy strategies asynchronously.
+
+    The client is created with the strategy's `async_client_factory` if it
+    has one, otherwise its `client_factory` is run on `executor`.  The API
+    calls themselves are made on `executor` too.  Defaults to the event
+    loop's default executor.
+    """
+    processed = strategy._process_locally(config)
+    if processed is not None:
+        return processed
+
+    loop = asyncio.get_event_loop()
+    if strategy.async_client_factory is not None:
+        client = await strategy.async_client_factory(config)
+    else:
+        client = await loop.run_in_executor(executor, strategy.client_factory, config)
+
+    return await loop.run_in_executor(executor, strategy._process_with_client, client, config)
+
+
+async def _process(loader, strategy, stage, config, executor):
+    """Process the configuration with a strategy, calling the instrumentation hooks."""
+    instrumentation = loader.instrumentation
+    if instrumentation is None:
+        return await process_async(strategy, config, executor)
+
+    state = instrumentation.before(strategy, stage, config)
+    try:
+        config = await process_async(strategy, config, executor)
+    except Exception:
+        instrumentation.after(strategy, stage, None, state)
+        raise
+
+    instrumentation.after(strategy, stage, config, state)
+
+    return config
+
+
+async def load_async(loader, executor=None):
+    """
+    Load the configuration of a `ConfigLoader` asynchronously.
+
+    This steps through the same pipeline as `ConfigLoader.load()`,
+    including dirty tracking of post processing strategies and
+    instrumentation.
+
+    :param obj loader: The `ConfigLoader` to load the configuration of.
+    :param executor: The executor synchronous strategies are run on.
+    :rtype: dict
+    :returns: The loaded configuration.
+    """
+    loader._start_load()
+    try:
+        steps = loader._steps(dict(), loader.load_strategies)
+        strategy, stage, config = next(steps)
+        while strategy is not None:
+            strategy, stage, config = steps.send(await _process(loader, strategy, stage, config, executor))
+
+        return loader._finish(config)
+    finally:
+        loader._finish_load()
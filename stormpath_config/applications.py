@@ -0,0 +1,151 @@
+"""An index of Stormpath Applications, used to resolve them without
+listing every Application of a tenant on every load."""
+
+
+from json import dump, load
+from os import chmod, fdopen, remove
+from os.path import abspath, dirname, expanduser, isfile
+from tempfile import mkstemp
+from threading import Lock
+import time
+
+from .cache import _default_file_mode, _replace
+
+
+class ApplicationIndex(object):
+    """
+    A name to href index of the Stormpath Applications of every tenant (API
+    key ID and base URL) it has seen, along with the tenant's default
+    Application.
+
+    Entries are built as Applications get resolved, expire after `ttl`
+    seconds, and can be persisted to a JSON file so they survive restarts.
+
+    :param float ttl: Number of seconds a tenant's entry stays valid.
+    :param str path: Path of the JSON file the index is persisted to.  The
+        index isn't persisted if not given.
+    :param timer: Callable returning the current time in seconds.  Defaults
+        to `time.time`, as timestamps are persisted.
+    """
+    def __init__(self, ttl=3600, path=None, timer=None):
+        self.ttl = ttl
+        self.path = abspath(expanduser(path)) if path else None
+        self.timer = timer if timer is not None else time.time
+        self._tenants = {}
+        self._lock = Lock()
+
+        if self.path and isfile(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self._tenants = load(f)
+            except (IOError, OSError, ValueError):
+                self._tenants = {}
+
+    def _tenant(self, config):
+        client = config.get('client') or {}
+        api_key = client.get('apiKey') or {}
+
+        return '%s %s' % (api_key.get('id'), client.get('baseUrl'))
+
+    def _entry(self, config):
+        tenant = self._tenant(config)
+        entry = self._tenants.get(tenant)
+        if entry is None or entry['built_at'] + self.ttl <= self.timer():
+            entry = self._tenants[tenant] = {
+                'built_at': self.timer(),
+                'names': {},
+                'complete': False,
+                'default': None,
+            }
+
+        return entry
+
+    def href(self, config, name):
+        """
+        Return the href of an Application, or None if it isn't indexed.
+        """
+        with self._lock:
+            return self._entry(config)['names'].get(name)
+
+    def is_complete(self, config):
+        """
+        Return whether every Application of the tenant is indexed.
+        """
+        with self._lock:
+            return self._entry(config)['complete']
+
+    def default(self, config):
+        """
+        Return the tenant's default Application.
+
+        :rtype: tuple or None
+        :returns: The (name, href) of the default Application, an empty
+            tuple if the tenant has none (or more than one candidate), or
+            None if it isn't known yet.
+        """
+        with self._lock:
+            default = self._entry(config)['default']
+
+        return tuple(default) if default is not None else None
+
+    def add(self, config, name, href, save=True):
+        """
+        Index an Application of the tenant.
+
+        :param bool save: Whether to persist the index.  Pass False when
+            indexing a batch of Applications, and save once afterwards
+            (e.g. with `set_default()`).
+        """
+        with self._lock:
+            names = self._entry(config)['names']
+            if names.get(name) == href:
+                return
+
+            names[name] = href
+            if save:
+                self._save()
+
+    def set_default(self, config, default, complete=False):
+        """
+        Record the tenant's default Application.
+
+        :param tuple default: The (name, href) of the default Application,
+            or an empty tuple if the tenant has none.
+        :param bool complete: Whether every Application of the tenant has
+            been indexed while looking for the default one.
+        """
+        with self._lock:
+            entry = self._entry(config)
+            entry['default'] = list(default)
+            entry['complete'] = entry['complete'] or complete
+            self._save()
+
+    def invalidate(self, config=None):
+        """
+        Drop the entry of the tenant in the given configuration, or every
+        entry if none is given.
+        """
+        with self._lock:
+            if config is None:
+                self._tenants.clear()
+            else:
+                self._tenants.pop(self._tenant(config), None)
+
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+
+        fd, tmp_path = mkstemp(dir=dirname(self.path))
+        try:
+            with fdopen(fd, 'w') as f:
+                dump(self._tenants, f)
+            chmod(tmp_path, _default_file_mode())
+            _replace(tmp_path, self.path)
+        except Exception:
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            raise
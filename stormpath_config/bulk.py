@@ -0,0 +1,80 @@
+"""Loading the configuration of many tenants at once."""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from time import time
+
+from .overlay import OverlayConfig, ValuePool
+
+
+class BulkLoadResult(object):
+    """
+    The outcome of `load_many()`.
+
+    :param dict configs: The loaded configuration of every tenant that
+        loaded successfully.
+    :param dict errors: The exception raised while loading the
+        configuration of every tenant that failed.
+    :param float elapsed: Number of seconds it took to load every tenant.
+    """
+    def __init__(self, configs, errors, elapsed):
+        self.configs = configs
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def tenants_per_second(self):
+        tenants = len(self.configs) + len(self.errors)
+        if not self.elapsed:
+            return float(tenants)
+
+        return tenants / self.elapsed
+
+
+def load_many(loaders, base_loader=None, max_workers=8, overlay=False):
+    """
+    Load the configuration of many tenants.
+
+    The layers every tenant has in common (default configuration, shared
+    files, environment variables, ...) are loaded once by `base_loader`, and
+    every tenant's loader starts from a copy of that configuration.  The
+    tenant loaders, including their remote strategies, run concurrently on
+    a thread pool of `max_workers` threads.
+
+    :param dict loaders: A `ConfigLoader` for every tenant, keyed by tenant.
+    :param base_loader: A `ConfigLoader` for the layers shared by every
+        tenant.  Tenants start from an empty configuration if not given.
+    :param int max_workers: Maximum number of tenants loaded concurrently.
+    :param bool overlay: If enabled, every configuration is returned as an
+        `OverlayConfig` sharing the base configuration, instead of a fully
+        materialized dictionary.
+    :rtype: BulkLoadResult
+    :returns: The configuration or error of every tenant.
+    """
+    start = time()
+    base_config = base_loader.load() if base_loader is not None else {}
+
+    if overlay:
+        pool = ValuePool()
+        shared_config = pool.config(base_config)
+
+    def load(tenant):
+        config = loaders[tenant].load(deepcopy(base_config))
+        if overlay:
+            config = OverlayConfig.from_config(shared_config, config, pool)
+
+        return config
+
+    configs = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = dict((tenant, executor.submit(load, tenant)) for tenant in loaders)
+
+        for tenant, future in futures.items():
+            try:
+                configs[tenant] = future.result()
+            except Exception as e:
+                errors[tenant] = e
+
+    return BulkLoadResult(configs, errors, time() - start)
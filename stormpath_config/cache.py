@@ -0,0 +1,315 @@
+"""Caches used to speed up configuration loading."""
+
+
+from collections import OrderedDict
+from hashlib import sha1, sha256
+import marshal
+from os import fdopen, listdir, makedirs, remove, utime
+from os.path import abspath, expanduser, getmtime, isdir, join
+import sys
+from tempfile import mkstemp
+from threading import Lock
+import os
+import time
+
+from . import log
+from .helpers import _file_fingerprint
+
+
+# os.replace() overwrites the destination on every platform, but only
+# exists on Python 3.
+_replace = getattr(os, 'replace', os.rename)
+
+# A clock that doesn't jump with the system time, where available.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+def _default_file_mode():
+    """
+    Return the mode open() creates files with, given the process umask.
+
+    mkstemp() creates files readable by their owner only; files meant to be
+    shared, like the application index, are given this mode before being
+    renamed into place.  The umask is read from /proc, since reading it with
+    os.umask() means briefly changing it for every thread of the process.
+    Where /proc isn't available, mkstemp()'s owner only mode is kept.
+    """
+    global _file_mode
+    if _file_mode is None:
+        _file_mode = 0o600
+        try:
+            with open('/proc/self/status', 'r') as f:
+                for line in f:
+                    if line.startswith('Umask:'):
+                        _file_mode = 0o666 & ~int(line.split()[1], 8)
+                        break
+        except (IOError, OSError, ValueError):
+            pass
+
+    return _file_mode
+
+
+_file_mode = None
+
+# Identifies the format of ParsedFileCache entries, which marshal may change
+# between interpreter versions.
+_ENTRY_FORMAT = (1, marshal.version, tuple(sys.version_info[:2]))
+_DIGEST_SIZE = sha256().digest_size
+
+
+class ParsedFileCache(object):
+    """
+    An on-disk cache of parsed configuration files.
+
+    Every entry is keyed by the absolute path of the source file and stores
+    the file's fingerprint (modification time and size, plus a hash of its
+    contents if `hash_contents` is set) next to the parsed tree.  As long as
+    the fingerprint matches, the parsed tree is read from the cache instead
+    of parsing the file again, which also works across process restarts.
+
+    Entries are serialized with the marshal module, prefixed with a SHA256
+    digest, so reading a corrupt or truncated entry is a cache miss, and no
+    entry can run code when it's read.  Files holding values marshal can't
+    serialize, like YAML dates, aren't cached.  The parsed configuration
+    still comes from the cache directory, so it must only be writable by the
+    user the service runs as: anyone who can write to it can change the
+    configuration, including the API key.
+
+    :param str cache_dir: Directory in which the cache entries are stored.
+        It's created on first write, readable by its owner only.
+    :param int max_entries: Maximum number of entries kept in the cache
+        directory.  When exceeded, the least recently used entries are
+        evicted.
+    :param bool hash_contents: Whether to include a SHA1 hash of the file's
+        contents in the fingerprint.  This catches changes that keep the
+        modification time and size intact, at the cost of reading the file.
+    """
+    suffix = '.parsed'
+
+    def __init__(self, cache_dir, max_entries=64, hash_contents=False):
+        self.cache_dir = abspath(expanduser(cache_dir))
+        self.max_entries = max_entries
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, file_path):
+        """
+        Compute the fingerprint of a file.
+
+        :param str file_path: The absolute path of the file.
+        :rtype: tuple
+        :returns: The modification time and size of the file, and optionally
+            a hash of its contents.
+        """
+        fingerprint = _file_fingerprint(file_path)
+        if fingerprint is None:
+            raise IOError('File "%s" doesn\'t exist.' % file_path)
+
+        if self.hash_contents:
+            with open(file_path, 'rb') as f:
+                fingerprint += (sha1(f.read()).hexdigest(),)
+
+        return fingerprint
+
+    def _entry_path(self, file_path):
+        return join(self.cache_dir, sha1(file_path.encode('utf-8')).hexdigest() + self.suffix)
+
+    def get(self, file_path, parse):
+        """
+        Return the parsed contents of a file, parsing it only on a cache miss.
+
+        :param str file_path: The absolute path of the file.
+        :param parse: Callable that takes the file path and returns the
+            parsed contents of the file.
+        :returns: The parsed contents of the file.
+        """
+        fingerprint = self.fingerprint(file_path)
+        entry_path = self._entry_path(file_path)
+
+        entry = self._load(entry_path)
+        if entry is not None and entry[0] == fingerprint:
+            value = entry[1]
+            self.hits += 1
+            try:
+                utime(entry_path, None)
+            except OSError:
+                pass
+
+            return value
+
+        self.misses += 1
+        value = parse(file_path)
+        try:
+            payload = marshal.dumps((_ENTRY_FORMAT, fingerprint, value))
+        except ValueError:
+            # The parsed tree holds values marshal doesn't support.
+            return value
+
+        try:
+            self._store(entry_path, sha256(payload).digest() + payload)
+        except (IOError, OSError) as e:
+            log.warning('Unable to cache the parsed contents of "%s" in "%s": %s', file_path, self.cache_dir, e)
+
+        return value
+
+    def _load(self, entry_path):
+        """Return the (fingerprint, value) pair of an entry, or None."""
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+
+        payload = data[_DIGEST_SIZE:]
+        if sha256(payload).digest() != data[:_DIGEST_SIZE]:
+            return None
+
+        try:
+            entry_format, fingerprint, value = marshal.loads(payload)
+        except Exception:
+            return None
+
+        if entry_format != _ENTRY_FORMAT:
+            return None
+
+        return fingerprint, value
+
+    def _store(self, entry_path, data):
+        if not isdir(self.cache_dir):
+            try:
+                makedirs(self.cache_dir, 0o700)
+            except OSError:
+                if not isdir(self.cache_dir):
+                    raise
+
+        # Write to a temporary file first and rename it into place, so
+        # concurrently booting workers never read a half-written entry.
+        fd, tmp_path = mkstemp(dir=self.cache_dir)
+        try:
+            with fdopen(fd, 'wb') as f:
+                f.write(data)
+            _replace(tmp_path, entry_path)
+        except Exception:
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._evict()
+
+    def _entries(self):
+        if not isdir(self.cache_dir):
+            return []
+
+        return [join(self.cache_dir, name) for name in listdir(self.cache_dir) if name.endswith(self.suffix)]
+
+    def _evict(self):
+        entries = self._entries()
+        if len(entries) <= self.max_entries:
+            return
+
+        def last_used(entry_path):
+            try:
+                return getmtime(entry_path)
+            except OSError:
+                return 0
+
+        entries.sort(key=last_used)
+        for entry_path in entries[:len(entries) - self.max_entries]:
+            try:
+                remove(entry_path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        for entry_path in self._entries():
+            try:
+                remove(entry_path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """
+        Return the cache statistics.
+
+        :rtype: dict
+        :returns: The number of hits and misses seen by this cache instance,
+            and the number of entries currently stored on disk.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries())}
+
+
+class TTLCache(object):
+    """
+    An in-process cache whose entries expire after a time to live.
+
+    Once the cache holds `max_entries` entries, the least recently used one
+    is evicted to make room for a new one.  The cache is safe to share
+    between threads.
+
+    :param float ttl: Number of seconds an entry stays valid.
+    :param int max_entries: Maximum number of entries kept in the cache.
+    :param timer: Callable returning the current time in seconds, used to
+        expire entries.  Defaults to a monotonic clock.
+    """
+    def __init__(self, ttl=300, max_entries=128, timer=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timer = timer if timer is not None else _monotonic
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for a key.
+
+        :param key: The key to look up.
+        :param default: The value returned if the key isn't cached, or its
+            entry expired.
+        :returns: The cached value, or default.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= self.timer():
+                self.misses += 1
+                return default
+
+            # Re-insert the entry to mark it as the most recently used one.
+            self._entries[key] = entry
+            self.hits += 1
+
+            return entry[1]
+
+    def set(self, key, value):
+        """
+        Cache a value for a key.
+
+        :param key: The key to cache the value for.
+        :param value: The value to cache.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self.timer() + self.ttl, value)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """
+        Remove a key from the cache, or every key if none is given.
+
+        :param key: The key to remove.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
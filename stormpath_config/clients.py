@@ -0,0 +1,47 @@
+"""Sharing Stormpath clients between strategies."""
+
+
+from threading import Lock
+
+
+class ClientProvider(object):
+    """
+    Builds Stormpath clients through a factory, once per distinct API key
+    and base URL, and hands out the same client afterwards.
+
+    A provider can be used anywhere a `client_factory` is expected.  Sharing
+    one between the remote strategies of a pipeline (which `ConfigLoader`
+    does for its `client_provider`) means a single client, along with its
+    HTTP session and pooled connections, is used for a whole load, and is
+    kept for every following reload.
+
+    :param client_factory: Callable that takes the configuration and returns
+        a new Stormpath client.
+    """
+    def __init__(self, client_factory):
+        self.client_factory = client_factory
+        self.created = 0
+        self._clients = {}
+        self._lock = Lock()
+
+    def _key(self, config):
+        client = config.get('client') or {}
+        api_key = client.get('apiKey') or {}
+
+        return (api_key.get('id'), api_key.get('secret'), client.get('baseUrl'))
+
+    def __call__(self, config):
+        key = self._key(config)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self.client_factory(config)
+                self.created += 1
+
+        return client
+
+    def clear(self):
+        """Forget every client built so far."""
+        with self._lock:
+            self._clients.clear()
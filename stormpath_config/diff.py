@@ -0,0 +1,195 @@
+"""Structural differences between configurations, and subscriptions to them.
+
+`diff_configs()` compares two configurations returned by a `ConfigLoader`,
+skipping the subtrees they share.  With `frozen=True`, a reload keeps the
+identity of every subtree that didn't change, so comparing two consecutive
+configurations only walks the paths that changed.
+
+`Subscriptions` builds on it to call a function only when the subtree at a
+given key path, e.g. 'web.social', changed, so components can be
+re-initialized selectively after a reload.
+"""
+
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+from threading import Lock
+
+from . import log
+from .helpers import _diff, _get_path
+
+
+_MISSING = object()
+
+
+def _related(path, prefix):
+    """
+    Return whether a dotted key path is a prefix, is under it, or contains
+    it.
+    """
+    return path == prefix or path.startswith(prefix + '.') or prefix.startswith(path + '.')
+
+
+class ConfigDiff(object):
+    """
+    The differences between two configurations, keyed by dotted key path.
+
+    Subtrees that were added or removed are reported once, at their path.
+    A diff is true if the configurations differ.
+
+    :param dict added: The added values.
+    :param dict removed: The removed values.
+    :param dict changed: The (old, new) pairs of the changed values.
+    """
+    def __init__(self, added=None, removed=None, changed=None):
+        self.added = added if added is not None else {}
+        self.removed = removed if removed is not None else {}
+        self.changed = changed if changed is not None else {}
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return 'ConfigDiff(added=%r, removed=%r, changed=%r)' % (self.added, self.removed, self.changed)
+
+    @property
+    def paths(self):
+        """The sorted paths of every difference."""
+        return sorted(set(self.added) | set(self.removed) | set(self.changed))
+
+    def affects(self, prefix):
+        """
+        Return whether the subtree at a dotted key path changed.
+
+        :param str prefix: The dotted key path, e.g. 'web.social'.
+        :rtype: bool
+        """
+        return any(_related(path, prefix) for path in self.paths)
+
+    def under(self, prefix):
+        """
+        Return the differences affecting the subtree at a dotted key path.
+
+        :param str prefix: The dotted key path, e.g. 'web.social'.
+        :rtype: ConfigDiff
+        """
+        def select(differences):
+            return dict((path, value) for path, value in differences.items() if _related(path, prefix))
+
+        return ConfigDiff(select(self.added), select(self.removed), select(self.changed))
+
+
+def diff_configs(old, new, prefix=None):
+    """
+    Compare two configurations.
+
+    Subtrees that are the same object in both configurations are skipped
+    without being compared.
+
+    :param dict old: The previous configuration, or None if there's none.
+    :param dict new: The new configuration.
+    :param str prefix: If given, only the subtrees at this dotted key path
+        are compared.
+    :rtype: ConfigDiff
+    """
+    if not prefix:
+        return ConfigDiff(*_diff(old if old is not None else {}, new))
+
+    old_value = _get_path(old, prefix, _MISSING)
+    new_value = _get_path(new, prefix, _MISSING)
+    if old_value is new_value:
+        return ConfigDiff()
+
+    if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+        return ConfigDiff(*_diff(old_value, new_value, prefix + '.'))
+
+    if old_value is _MISSING:
+        return ConfigDiff(added={prefix: new_value})
+
+    if new_value is _MISSING:
+        return ConfigDiff(removed={prefix: old_value})
+
+    if type(old_value) is not type(new_value) or old_value != new_value:
+        return ConfigDiff(changed={prefix: (old_value, new_value)})
+
+    return ConfigDiff()
+
+
+class Subscriptions(object):
+    """
+    Functions to call when subtrees of a configuration change.
+
+    Notifying doesn't take a lock: subscribing replaces the list of
+    subscriptions rather than modifying it.
+    """
+    def __init__(self):
+        self._subscriptions = ()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, prefix, callback):
+        """
+        Call a function when the subtree at a dotted key path changes.
+
+        :param str prefix: The dotted key path, e.g. 'client.apiKey'.  The
+            whole configuration if empty.
+        :param callback: A function called with the new configuration and
+            the `ConfigDiff` of the subtree.
+        :returns: The callback.
+        """
+        with self._lock:
+            self._subscriptions += ((prefix, callback),)
+
+        return callback
+
+    def unsubscribe(self, prefix, callback):
+        """
+        Stop calling a function subscribed with `subscribe()`.
+
+        :raises ValueError: If the function isn't subscribed to the prefix.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            subscriptions.remove((prefix, callback))
+            self._subscriptions = tuple(subscriptions)
+
+    def notify(self, old, new):
+        """
+        Call the functions subscribed to the subtrees that differ between two
+        configurations.
+
+        Each prefix is compared once, however many functions subscribed to
+        it.  A function that raises is logged, and doesn't prevent the others
+        from being called.
+
+        :param dict old: The previous configuration, or None if there's none.
+        :param dict new: The new configuration.
+        :rtype: int
+        :returns: The number of functions called.
+        """
+        if old is new:
+            return 0
+
+        diffs = {}
+        called = 0
+        for prefix, callback in self._subscriptions:
+            diff = diffs.get(prefix)
+            if diff is None:
+                diff = diffs[prefix] = diff_configs(old, new, prefix)
+
+            if not diff:
+                continue
+
+            called += 1
+            try:
+                callback(new, diff)
+            except Exception:
+                log.exception('Handling a change of the configuration at "%s" failed.', prefix)
+
+        return called
@@ -0,0 +1,164 @@
+"""Immutable, structurally shared configurations."""
+
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+from .paths import PathIndex, PathLookupMixin
+
+
+class FrozenConfig(PathLookupMixin, Mapping):
+    """
+    An immutable configuration dictionary.
+
+    Nested dictionaries are frozen too, and lists become tuples.  Since a
+    frozen configuration never changes, it can be shared between threads and
+    kept as a snapshot without copying it.  `merge()` and `freeze()` create
+    new nodes only along the paths that changed, so unchanged subtrees keep
+    their identity.
+
+    Dotted key paths can be looked up with `get_path()` and
+    `iter_prefix()`; the `PathIndex` answering them is built on first use.
+
+    Use `freeze()` to create one.
+    """
+    __slots__ = ('_data', '_hash', '_path_index')
+
+    def __init__(self, data=None):
+        self._data = data if data is not None else {}
+        self._hash = None
+        self._path_index = None
+
+    @property
+    def path_index(self):
+        if self._path_index is None:
+            self._path_index = PathIndex(self)
+
+        return self._path_index
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+
+        return self._hash
+
+    def __repr__(self):
+        return 'FrozenConfig(%r)' % self._data
+
+    def merge(self, extend_with):
+        """
+        Return this configuration extended with another one, following the
+        same rules as `_extend_dict()`.
+
+        Only the nodes along the changed paths are created; everything else
+        is shared with this configuration, which is returned as is if
+        nothing changed.
+
+        :param dict extend_with: The configuration with which to extend.
+        :rtype: FrozenConfig
+        """
+        changes = {}
+        for key, value in extend_with.items():
+            current = self._data.get(key)
+            if key in self._data and isinstance(value, Mapping) and isinstance(current, FrozenConfig):
+                value = current.merge(value)
+            else:
+                value = freeze(value, current)
+
+            if key not in self._data or value is not current:
+                changes[key] = value
+
+        if not changes:
+            return self
+
+        data = dict(self._data)
+        data.update(changes)
+
+        return FrozenConfig(data)
+
+    def thaw(self):
+        """
+        Return a mutable copy of this configuration.
+
+        :rtype: dict
+        """
+        return thaw(self)
+
+
+def freeze(value, previous=None):
+    """
+    Return an immutable version of a configuration value.
+
+    Nodes of `previous` (a value frozen earlier) that are equal to the
+    corresponding parts of `value` are reused, so subtrees that didn't
+    change between two loads keep their identity.
+
+    :param value: The value to freeze.
+    :param previous: A previously frozen version of the value.
+    :returns: A `FrozenConfig` for dictionaries, a tuple for lists, and the
+        value itself for everything else.
+    """
+    if isinstance(value, FrozenConfig):
+        return value
+
+    if isinstance(value, Mapping):
+        if not isinstance(previous, FrozenConfig):
+            previous = None
+
+        data = {}
+        unchanged = previous is not None and len(previous) == len(value)
+        for key, item in value.items():
+            previous_item = previous._data.get(key) if previous is not None else None
+            data[key] = frozen_item = freeze(item, previous_item)
+            if unchanged and (frozen_item is not previous_item or key not in previous._data):
+                unchanged = False
+
+        return previous if unchanged else FrozenConfig(data)
+
+    if isinstance(value, (list, tuple)):
+        if not isinstance(previous, tuple):
+            previous = ()
+
+        items = tuple(
+            freeze(item, previous[i] if i < len(previous) else None)
+            for i, item in enumerate(value))
+        if len(items) == len(previous) and all(a is b for a, b in zip(items, previous)):
+            return previous
+
+        return items
+
+    if previous is not None and type(previous) is type(value) and previous == value:
+        return previous
+
+    return value
+
+
+def thaw(value):
+    """
+    Return a mutable copy of a frozen configuration value.
+
+    :param value: The frozen value.
+    :returns: A dict for `FrozenConfig`s, a list for tuples, and the value
+        itself for everything else.
+    """
+    if isinstance(value, FrozenConfig):
+        return dict((key, thaw(item)) for key, item in value.items())
+
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+
+    return value
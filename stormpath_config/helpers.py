@@ -2,6 +2,11 @@
 
 
 from codecs import open as copen
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+from os import stat
 from os.path import isfile
 
 
@@ -48,6 +53,87 @@ def _extend_dict(original, extend_with):
     return original
 
 
+def _get_path(config, path, default=None):
+    """
+    Look up a value in a nested dictionary by its dotted key path.
+
+    :param dict config: The dictionary to look the value up in.
+    :param str path: The dotted key path, e.g. 'client.apiKey.id'.
+    :param default: The value returned if the path doesn't exist.
+    :returns: The value at the given path, or default.
+    """
+    value = config
+    for key in path.split('.'):
+        if not isinstance(value, Mapping) or key not in value:
+            return default
+
+        value = value[key]
+
+    return value
+
+
+def _file_fingerprint(fname):
+    """
+    Compute a cheap fingerprint of a file, used to tell whether it changed.
+
+    :param str fname: The file name to fingerprint.
+    :rtype: tuple or None
+    :returns: The modification time and size of the file, or None if the
+        file doesn't exist.
+    """
+    try:
+        st = stat(fname)
+    except (IOError, OSError):
+        return None
+
+    return (getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size)
+
+
+def _diff(original, changed, prefix=''):
+    """
+    Compare two nested dictionaries.
+
+    Subtrees that are the same object in both dictionaries are skipped
+    without being compared.  Frozen configurations are compared like
+    dictionaries.
+
+    :param dict original: The original dictionary.
+    :param dict changed: The changed dictionary.
+    :param str prefix: The dotted key path of the compared dictionaries.
+    :rtype: tuple
+    :returns: Three dictionaries, keyed by dotted key path: the added
+        values, the removed values, and the (old, new) pairs of the changed
+        values.
+    """
+    added, removed, modified = {}, {}, {}
+    if original is changed:
+        return added, removed, modified
+
+    for key, value in changed.items():
+        path = prefix + key
+        if key not in original:
+            added[path] = value
+            continue
+
+        old = original[key]
+        if old is value:
+            continue
+
+        if isinstance(old, Mapping) and isinstance(value, Mapping):
+            nested = _diff(old, value, path + '.')
+            added.update(nested[0])
+            removed.update(nested[1])
+            modified.update(nested[2])
+        elif type(old) is not type(value) or old != value:
+            modified[path] = (old, value)
+
+    for key, value in original.items():
+        if key not in changed:
+            removed[prefix + key] = value
+
+    return added, removed, modified
+
+
 def to_camel_case(s):
     """
     Convert a string to camelCase.
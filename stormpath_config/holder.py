@@ -0,0 +1,82 @@
+"""Lock-free access to a configuration that is reloaded concurrently."""
+
+
+from threading import Lock
+
+from .diff import Subscriptions
+
+
+class ConfigHolder(object):
+    """
+    Holds the current configuration of a `ConfigLoader`.
+
+    Readers get the current configuration with `get()`, a single attribute
+    read that never blocks.  `reload()` builds the new configuration off to
+    the side and then swaps it in with a single assignment, so readers see
+    either the old or the new configuration, never a partially built one.
+    Configurations are never modified once published, so readers still
+    using an old one can keep using it safely; they must not modify it
+    either (use a loader with `frozen=True` to enforce that).
+
+    Reloads are serialized, and should all go through the holder: pass
+    `publish` as the callback of a `ConfigWatcher` only if nothing else
+    reloads the holder's loader.
+
+    Functions subscribed with `subscribe()` are called when a published
+    configuration changed the subtree they subscribed to.  They're called by
+    the publishing thread, in publishing order, and mustn't publish or
+    reload the holder themselves.
+
+    :param obj loader: The `ConfigLoader` producing the configurations.
+    :param dict config: The initial configuration.  Loaded with the loader
+        if not given.
+    """
+    def __init__(self, loader, config=None):
+        self.loader = loader
+        self.version = 0
+        self.subscriptions = Subscriptions()
+        self._lock = Lock()
+        self._config = config if config is not None else loader.reload()
+
+    def get(self):
+        """
+        Return the current configuration.
+
+        :rtype: dict
+        """
+        return self._config
+
+    def publish(self, config):
+        """
+        Make a configuration the current one.
+
+        :param dict config: The new configuration, which mustn't be modified
+            afterwards.
+        """
+        with self._lock:
+            self._swap(config)
+
+    def subscribe(self, prefix, callback):
+        """
+        Call a function when a published configuration changed the subtree at
+        a dotted key path.  See `Subscriptions.subscribe()`.
+        """
+        return self.subscriptions.subscribe(prefix, callback)
+
+    def _swap(self, config):
+        old, self._config = self._config, config
+        self.version += 1
+        self.subscriptions.notify(old, config)
+
+    def reload(self):
+        """
+        Reload the configuration with `ConfigLoader.reload()`, and publish it.
+
+        :rtype: dict
+        :returns: The new configuration.
+        """
+        with self._lock:
+            config = self.loader.reload()
+            self._swap(config)
+
+        return config
@@ -0,0 +1,177 @@
+"""Per strategy timing and allocation instrumentation of ConfigLoader.
+
+A `ConfigLoader` created with an `instrumentation` object calls its hooks
+around every strategy it runs:
+
+* `start_load()` before the first strategy of a load,
+* `before(strategy, stage, config)` before each strategy, returning a value
+  that is handed back to
+* `after(strategy, stage, config, state)` once the strategy returned, or
+  with a `config` of None if it raised,
+* `finish_load()` once the load is over, whether it succeeded or not.
+
+`stage` is one of 'load', 'post_processing' and 'validation'.
+`LoadProfiler` implements these hooks; any object with the same methods can
+be used instead.  Without instrumentation, the loader runs the strategies
+directly.
+"""
+
+
+from copy import deepcopy
+import time
+
+from .helpers import _diff
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+
+_wall_clock = getattr(time, 'perf_counter', time.time)
+_cpu_clock = getattr(time, 'process_time', time.clock if hasattr(time, 'clock') else time.time)
+
+
+class StrategyTiming(object):
+    """
+    The measurements of one strategy run.
+
+    :param obj strategy: The strategy.
+    :param str stage: 'load', 'post_processing' or 'validation'.
+    :param float wall_time: The elapsed time, in seconds.
+    :param float cpu_time: The CPU time used by the process, in seconds.
+    :param int allocated: The net number of bytes allocated, or None if
+        allocations weren't traced.
+    :param int keys_changed: The number of added, removed and changed key
+        paths, or None if changes weren't counted.
+    :param bool failed: Whether the strategy raised.
+    """
+    __slots__ = ('strategy', 'stage', 'wall_time', 'cpu_time', 'allocated', 'keys_changed', 'failed')
+
+    def __init__(self, strategy, stage, wall_time, cpu_time, allocated=None, keys_changed=None, failed=False):
+        self.strategy = strategy
+        self.stage = stage
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.allocated = allocated
+        self.keys_changed = keys_changed
+        self.failed = failed
+
+    @property
+    def name(self):
+        return type(self.strategy).__name__
+
+    def as_dict(self):
+        """
+        Return the measurements as a dictionary, e.g. to forward them to a
+        metrics system.
+
+        :rtype: dict
+        """
+        return {
+            'strategy': self.name,
+            'stage': self.stage,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'allocated': self.allocated,
+            'keys_changed': self.keys_changed,
+            'failed': self.failed,
+        }
+
+    def __repr__(self):
+        return 'StrategyTiming(%s, %s, %.6fs)' % (self.name, self.stage, self.wall_time)
+
+
+class LoadReport(object):
+    """
+    The measurements of every strategy run by one load, in the order they
+    ran.
+    """
+    def __init__(self):
+        self.timings = []
+        self.wall_time = None
+        self.cpu_time = None
+
+    def slowest(self, count=5):
+        """
+        Return the strategy runs that took the most wall time.
+
+        :param int count: The number of runs to return.
+        :rtype: list
+        """
+        return sorted(self.timings, key=lambda timing: timing.wall_time, reverse=True)[:count]
+
+    def as_dicts(self):
+        """
+        Return the measurements of every strategy run as dictionaries.
+
+        :rtype: list
+        """
+        return [timing.as_dict() for timing in self.timings]
+
+
+class LoadProfiler(object):
+    """
+    Instrumentation measuring every strategy a `ConfigLoader` runs.
+
+    The report of the last load is kept in `report`, including the timing of
+    the strategy that made a failed load raise.
+
+    :param callback: A function called with the `StrategyTiming` of every
+        strategy run, as soon as it's measured.
+    :param bool trace_allocations: If enabled, the net memory allocated by
+        each strategy is measured with tracemalloc (Python 3.4+), which is
+        started for the duration of the load if it isn't already tracing.
+        Tracing slows the load down noticeably.
+    :param bool count_changes: If enabled, the key paths each strategy
+        added, removed or changed are counted, which copies the
+        configuration before every strategy.
+    """
+    def __init__(self, callback=None, trace_allocations=False, count_changes=True):
+        self.callback = callback
+        self.trace_allocations = trace_allocations and tracemalloc is not None
+        self.count_changes = count_changes
+        self.report = None
+        self._started_tracing = False
+        self._load_start = None
+
+    def start_load(self):
+        self.report = LoadReport()
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._load_start = (_wall_clock(), _cpu_clock())
+
+    def before(self, strategy, stage, config):
+        snapshot = deepcopy(config) if self.count_changes and isinstance(config, dict) else None
+        allocated = tracemalloc.get_traced_memory()[0] if self.trace_allocations else None
+
+        return snapshot, allocated, _wall_clock(), _cpu_clock()
+
+    def after(self, strategy, stage, config, state):
+        wall_time, cpu_time = _wall_clock(), _cpu_clock()
+        snapshot, allocated, wall_start, cpu_start = state
+
+        if allocated is not None:
+            allocated = tracemalloc.get_traced_memory()[0] - allocated
+
+        keys_changed = None
+        if snapshot is not None and isinstance(config, dict):
+            keys_changed = sum(len(paths) for paths in _diff(snapshot, config))
+
+        timing = StrategyTiming(strategy, stage, wall_time - wall_start, cpu_time - cpu_start,
+                                allocated, keys_changed, failed=config is None)
+        self.report.timings.append(timing)
+
+        if self.callback is not None:
+            self.callback(timing)
+
+    def finish_load(self):
+        wall_start, cpu_start = self._load_start
+        self.report.wall_time = _wall_clock() - wall_start
+        self.report.cpu_time = _cpu_clock() - cpu_start
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
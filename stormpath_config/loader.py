@@ -1,18 +1,83 @@
 """Configuration Loader."""
 
 
+from copy import deepcopy
+from itertools import chain
+
+from .clients import ClientProvider
+from .frozen import freeze
+from .helpers import _get_path
+from .paths import IndexedConfig, PathIndex
+
+
+_MISSING = object()
+
+
+def _fingerprint(strategy):
+    """
+    Return the fingerprint of a strategy's external input, or None if the
+    strategy can't tell whether its input changed.
+    """
+    fingerprint = getattr(strategy, 'fingerprint', None)
+    if fingerprint is None:
+        return None
+
+    return fingerprint()
+
+
+def _watched_values(strategy, config):
+    """
+    Return the values at the key paths a post processing strategy watches,
+    or None if the strategy doesn't declare any.
+    """
+    watched_paths = getattr(strategy, 'watched_paths', None)
+    if watched_paths is None:
+        return None
+
+    values = []
+    for path in watched_paths:
+        value = _get_path(config, path, _MISSING)
+        values.append(value if value is _MISSING else deepcopy(value))
+
+    return values
+
+
 class ConfigLoader(object):
     """
     Represents a configuration loader that loads configuration through a list
-    of strategies.
+    of strategies.  Strategies implementing `start_load()` have it called
+    before every load, to reset state they keep for the duration of a load.
 
     :param list load_strategies: List of Strategies that load configuration data.
     :param post_processing_strategies: List of Strategies that will be performed
         after each load strategy.
     :param validation_strategies: List of strategies that will be performed after
         the load and post processing strategies are finished.
+    :param bool dirty_tracking: If enabled, post processing strategies that
+        declare `watched_paths` (a list of dotted key paths) are only
+        performed after load strategies that changed one of those paths.
+        The number of performed and skipped post processing strategies is
+        kept in `stats`.
+    :param client_provider: A `ClientProvider` (or a client factory, which
+        is wrapped in one) that is handed to every strategy of the pipeline
+        that has a `client_factory` of None, so remote strategies share one
+        client per API key and base URL across loads.
+    :param bool frozen: If enabled, the loaded configuration is returned as
+        an immutable `FrozenConfig`.  Subtrees that didn't change since the
+        previous load keep their identity.
+    :param bool index_paths: If enabled, a `PathIndex` of the loaded
+        configuration is built, and the configuration is returned as an
+        `IndexedConfig` (or a `FrozenConfig`) supporting `get_path()` and
+        `iter_prefix()` lookups.  Combined with `frozen`, reloads only index
+        the subtrees that changed.
+    :param instrumentation: An object whose hooks are called around every
+        strategy run, such as a `LoadProfiler` measuring their wall time,
+        CPU time, allocations and changed keys.  See the
+        `stormpath_config.instrumentation` module.
     """
-    def __init__(self, load_strategies=None, post_processing_strategies=None, validation_strategies=None):
+    def __init__(self, load_strategies=None, post_processing_strategies=None, validation_strategies=None,
+                 dirty_tracking=False, client_provider=None, frozen=False, index_paths=False,
+                 instrumentation=None):
         if load_strategies is None:
             load_strategies = []
 
@@ -25,17 +90,212 @@ class ConfigLoader(object):
         self.load_strategies = load_strategies
         self.post_processing_strategies = post_processing_strategies
         self.validation_strategies = validation_strategies
+        self.dirty_tracking = dirty_tracking
+        self.frozen = frozen
+        self.index_paths = index_paths
+        self.instrumentation = instrumentation
+        self.stats = {}
+        self._last_frozen = None
+        self._last_path_index = None
+
+        if client_provider is not None and not isinstance(client_provider, ClientProvider):
+            client_provider = ClientProvider(client_provider)
+
+        self.client_provider = client_provider
+        if client_provider is not None:
+            for strategy in chain(load_strategies, post_processing_strategies, validation_strategies):
+                if getattr(strategy, 'client_factory', False) is None:
+                    strategy.client_factory = client_provider
+
+        # Layers recorded by reload(): a (strategy, fingerprint, snapshot)
+        # tuple per load strategy, and the fingerprint of the post
+        # processing strategies they were computed with.
+        self._layers = []
+        self._post_processing_fingerprint = None
 
-    def load(self):
-        config = dict()
+    def _start_load(self):
+        self.stats = {'post_processing_runs': 0, 'post_processing_skipped': 0}
+        for strategy in chain(self.load_strategies, self.post_processing_strategies, self.validation_strategies):
+            start_load = getattr(strategy, 'start_load', None)
+            if start_load is not None:
+                start_load()
 
-        for strategy in self.load_strategies:
+        if self.instrumentation is not None:
+            self.instrumentation.start_load()
+
+    def _process(self, strategy, stage, config):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return strategy.process(config)
+
+        state = instrumentation.before(strategy, stage, config)
+        try:
             config = strategy.process(config)
+        except Exception:
+            instrumentation.after(strategy, stage, None, state)
+            raise
+
+        instrumentation.after(strategy, stage, config, state)
+
+        return config
+
+    def _steps(self, config, load_strategies, layer_done=None):
+        """
+        Step through the pipeline, without running the strategies.
+
+        This is a generator yielding a (strategy, stage, config) tuple for
+        every strategy to run, and expecting the configuration it returned
+        to be sent back.  It finally yields (None, None, config) with the
+        validated configuration.  Running the strategies is left to the
+        caller, so `load()`, `reload()` and `load_async()` share the same
+        pipeline.
+
+        :param dict config: The configuration to start from.
+        :param list load_strategies: The load strategies to run.
+        :param layer_done: A function called with each load strategy and
+            the configuration it and the post processing strategies
+            produced.
+        """
+        post_processing_strategies = self.post_processing_strategies
+        for strategy in load_strategies:
+            if self.dirty_tracking:
+                watched = [_watched_values(s, config) for s in post_processing_strategies]
+            else:
+                watched = [None] * len(post_processing_strategies)
+
+            config = yield strategy, 'load', config
+
+            for post_processing_strategy, values in zip(post_processing_strategies, watched):
+                if values is not None and values == _watched_values(post_processing_strategy, config):
+                    self.stats['post_processing_skipped'] += 1
+                    continue
 
-            for strategy in self.post_processing_strategies:
-                config = strategy.process(config)
+                config = yield post_processing_strategy, 'post_processing', config
+                self.stats['post_processing_runs'] += 1
+
+            if layer_done is not None:
+                layer_done(strategy, config)
 
         for strategy in self.validation_strategies:
-            config = strategy.process(config)
+            config = yield strategy, 'validation', config
+
+        yield None, None, config
+
+    def _run(self, steps):
+        """Run the strategies of the pipeline steps from `_steps()`."""
+        strategy, stage, config = next(steps)
+        while strategy is not None:
+            strategy, stage, config = steps.send(self._process(strategy, stage, config))
+
+        return config
+
+    def _finish(self, config):
+        if self.frozen:
+            config = self._last_frozen = freeze(config, self._last_frozen)
+
+        if self.index_paths:
+            if self.frozen:
+                if config._path_index is None:
+                    config._path_index = PathIndex(config, self._last_path_index)
+                self._last_path_index = config._path_index
+            else:
+                # Plain dictionaries can be modified in place, so sharing an
+                # object with the previous configuration doesn't mean it's
+                # unchanged: index it from scratch.
+                config = IndexedConfig(config, PathIndex(config))
 
         return config
+
+    def _finish_load(self):
+        if self.instrumentation is not None:
+            self.instrumentation.finish_load()
+
+    def _post_processing_fingerprints(self):
+        fingerprints = tuple(_fingerprint(strategy) for strategy in self.post_processing_strategies)
+        if None in fingerprints:
+            return None
+
+        return fingerprints
+
+    def load(self, config=None):
+        """
+        Load the configuration.
+
+        :param dict config: The configuration to start from, which is
+            modified in place.  Loading starts from an empty configuration
+            if not given.
+        :rtype: dict
+        :returns: The loaded configuration.
+        """
+        self._start_load()
+        try:
+            if config is None:
+                config = dict()
+
+            return self._finish(self._run(self._steps(config, self.load_strategies)))
+        finally:
+            self._finish_load()
+
+    def load_async(self, executor=None):
+        """
+        Load the configuration without blocking the event loop, available on
+        Python 3.5+.
+
+        Strategies implementing a `process_async()` coroutine are awaited,
+        the others are run on `executor` (the event loop's default executor
+        if not given).
+
+        :rtype: coroutine
+        :returns: A coroutine returning the loaded configuration.
+        """
+        from .aio import load_async
+
+        return load_async(self, executor)
+
+    def reload(self):
+        """
+        Load the configuration, recomputing only the layers whose input
+        changed since the previous reload().
+
+        Every load strategy that implements `fingerprint()` describes its
+        external input (file stat, environment variables, the extending
+        object).  The configuration produced by each layer is kept, so
+        reloading resumes from the last layer that precedes the first
+        changed one.  Strategies without a fingerprint are always run, and
+        so is every layer after them.  Validation strategies always run.
+
+        The first call loads the configuration from scratch.
+
+        :rtype: dict
+        :returns: The loaded configuration.
+        """
+        self._start_load()
+        try:
+            return self._reload()
+        finally:
+            self._finish_load()
+
+    def _reload(self):
+        fingerprints = [_fingerprint(strategy) for strategy in self.load_strategies]
+        post_processing_fingerprint = self._post_processing_fingerprints()
+
+        start = 0
+        if post_processing_fingerprint is not None and \
+                post_processing_fingerprint == self._post_processing_fingerprint:
+            for layer, strategy, fingerprint in zip(self._layers, self.load_strategies, fingerprints):
+                if fingerprint is None or layer[0] is not strategy or layer[1] != fingerprint:
+                    break
+
+                start += 1
+
+        del self._layers[start:]
+        config = deepcopy(self._layers[-1][2]) if self._layers else dict()
+
+        layer_fingerprints = iter(fingerprints[start:])
+
+        def layer_done(strategy, config):
+            self._layers.append((strategy, next(layer_fingerprints), deepcopy(config)))
+            if len(self._layers) == len(self.load_strategies):
+                self._post_processing_fingerprint = self._post_processing_fingerprints()
+
+        return self._finish(self._run(self._steps(config, self.load_strategies[start:], layer_done)))
@@ -0,0 +1,217 @@
+"""Configurations that share their common layers in memory.
+
+An `OverlayConfig` is a read-only view made of a base configuration, shared
+between many configurations (typically the defaults every tenant starts
+from), and an overlay holding only the values that differ from it.  Lists are
+returned as tuples, and the dictionaries they hold as read-only views, so a
+tenant can't modify what other tenants share.
+"""
+
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+try:
+    from sys import intern
+except ImportError:  # Python 2
+    pass
+
+
+class _Removed(object):
+    """Marks a key of the base configuration removed in the overlay."""
+    def __repr__(self):
+        return '<removed>'
+
+
+_REMOVED = _Removed()
+_MISSING = object()
+
+
+class ValuePool(object):
+    """
+    Interns the keys and deduplicates the leaf values of configurations, so
+    equal strings and numbers of many configurations are stored once.
+    """
+    def __init__(self):
+        self._values = {}
+
+    def key(self, key):
+        if isinstance(key, str):
+            return intern(key)
+
+        return self.value(key)
+
+    def value(self, value):
+        if isinstance(value, list):
+            value = tuple(_read_only(self.config(item)) for item in value)
+
+        try:
+            return self._values.setdefault((type(value), value), value)
+        except TypeError:
+            # Unhashable leaves, like tuples of dicts, are kept as they are.
+            return value
+
+    def config(self, config):
+        """
+        Return a copy of a configuration with its keys interned, its leaf
+        values deduplicated, and its lists turned into tuples (of read-only
+        views, for the dictionaries they hold).
+        """
+        if not isinstance(config, dict):
+            return self.value(config)
+
+        return dict((self.key(k), self.config(v)) for k, v in config.items())
+
+
+def _read_only(value):
+    """Return a read-only version of a value found in a plain dictionary."""
+    if isinstance(value, dict):
+        return OverlayConfig(value)
+
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+
+    return value
+
+
+def _materialize(value):
+    if isinstance(value, OverlayConfig):
+        return value.to_dict()
+
+    if isinstance(value, (list, tuple)):
+        return [_materialize(item) for item in value]
+
+    return value
+
+
+def _overlay(base, config, pool):
+    """Compute the overlay that turns the base configuration into config."""
+    overlay = {}
+
+    for key, value in config.items():
+        base_value = base.get(key, _REMOVED)
+        if base_value is value:
+            continue
+
+        if isinstance(value, list):
+            value = pool.value(value)
+            if isinstance(base_value, list):
+                base_value = pool.value(base_value)
+
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            nested = _overlay(base_value, value, pool)
+            if nested:
+                overlay[pool.key(key)] = nested
+        elif base_value is _REMOVED or type(base_value) is not type(value) or base_value != value:
+            # Replaced dicts are stored wrapped, to tell them apart from
+            # nested overlays.
+            if isinstance(value, dict):
+                value = OverlayConfig(pool.config(value))
+            else:
+                value = pool.value(value)
+
+            overlay[pool.key(key)] = value
+
+    for key in base:
+        if key not in config:
+            overlay[pool.key(key)] = _REMOVED
+
+    return overlay
+
+
+class OverlayConfig(Mapping):
+    """
+    A read-only configuration made of a shared base configuration and an
+    overlay of the values that differ from it.
+
+    Nested dictionaries are returned as `OverlayConfig` views too, so
+    lookups resolve through the overlay first and fall back to the base.
+    Lists are returned as tuples, and the dictionaries in them as
+    `OverlayConfig` views as well.  The base configuration must not be
+    modified once it's shared.
+
+    :param dict base: The shared base configuration.
+    :param dict overlay: The values that differ from the base, as computed
+        by `from_config()`.
+    """
+    __slots__ = ('_base', '_overlay')
+
+    def __init__(self, base, overlay=None):
+        self._base = base
+        self._overlay = overlay if overlay is not None else {}
+
+    @classmethod
+    def from_config(cls, base, config, pool=None):
+        """
+        Build a view of a fully loaded configuration on top of a base one.
+
+        :param dict base: The shared base configuration.
+        :param dict config: The configuration to represent.
+        :param ValuePool pool: The pool used to intern keys and deduplicate
+            the values of the overlay.  Share one between configurations to
+            deduplicate their values too.
+        :rtype: OverlayConfig
+        """
+        return cls(base, _overlay(base, config, pool if pool is not None else ValuePool()))
+
+    def __getitem__(self, key):
+        value = self._overlay.get(key, _MISSING)
+        if value is _REMOVED:
+            raise KeyError(key)
+
+        if value is _MISSING:
+            # The base may be a plain dictionary, whose dictionaries and
+            # lists must not be handed out.
+            return _read_only(self._base[key])
+
+        if isinstance(value, dict):
+            return OverlayConfig(self._base[key], value)
+
+        return value
+
+    def __contains__(self, key):
+        value = self._overlay.get(key, _MISSING)
+        if value is not _MISSING:
+            return value is not _REMOVED
+
+        return key in self._base
+
+    def __iter__(self):
+        for key in self._base:
+            if self._overlay.get(key) is not _REMOVED:
+                yield key
+
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, OverlayConfig):
+            other = other.to_dict()
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+
+        return self.to_dict() == dict(other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'OverlayConfig(%r)' % self.to_dict()
+
+    def to_dict(self):
+        """
+        Materialize the configuration as a plain nested dictionary, with
+        lists rather than tuples.
+
+        :rtype: dict
+        """
+        return dict((key, _materialize(value)) for key, value in self.items())
@@ -0,0 +1,95 @@
+"""Parsers for JSON and YAML configuration files."""
+
+
+from json import loads
+from os.path import splitext
+
+
+# The YAML loader, imported by the first parse_yaml() call, as importing
+# PyYAML is slow.
+SafeLoader = None
+
+JSON = 'json'
+YAML = 'yaml'
+
+_EXTENSIONS = {
+    '.json': JSON,
+    '.yaml': YAML,
+    '.yml': YAML,
+}
+
+
+def detect_format(file_path=None, data=None):
+    """
+    Detect the format of a configuration file.
+
+    The file extension is used when it's a known one, otherwise the contents
+    are sniffed: anything that starts with a JSON object or array is treated
+    as JSON, everything else as YAML.
+
+    :param str file_path: The path of the configuration file.
+    :param str data: The contents of the configuration file.
+    :rtype: str
+    :returns: Either `JSON` or `YAML`.
+    """
+    if file_path:
+        fmt = _EXTENSIONS.get(splitext(file_path)[1].lower())
+        if fmt is not None:
+            return fmt
+
+    if data and data.lstrip()[:1] in ('{', '['):
+        return JSON
+
+    return YAML
+
+
+def parse_json(data):
+    """
+    Parse JSON configuration data with the (C accelerated) json module.
+
+    :param str data: The JSON data to parse.
+    :returns: The parsed configuration.
+    """
+    return loads(data)
+
+
+def parse_yaml(data):
+    """
+    Parse YAML configuration data with the safe loader, using LibYAML
+    bindings when they are available.
+
+    :param str data: The YAML data to parse.
+    :returns: The parsed configuration.
+    """
+    global SafeLoader
+    from yaml import load
+
+    if SafeLoader is None:
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+    return load(data, Loader=SafeLoader)
+
+
+def parse_config(data, file_path=None):
+    """
+    Parse configuration data with the fastest parser for its format.
+
+    JSON is a subset of YAML, so JSON-looking data that the json module
+    rejects (single quoted strings, comments, ...) is parsed as YAML
+    instead.
+
+    :param str data: The configuration data to parse.
+    :param str file_path: The path the data was read from, used to detect
+        its format.
+    :returns: The parsed configuration.
+    """
+    if detect_format(file_path, data) == JSON:
+        try:
+            return parse_json(data)
+        except ValueError:
+            pass
+
+    return parse_yaml(data)
@@ -0,0 +1,111 @@
+"""Dotted key path lookups on loaded configurations."""
+
+
+from bisect import bisect_left
+from itertools import islice
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+
+_MISSING = object()
+
+
+class PathIndex(object):
+    """
+    A flat index of every dotted key path of a configuration, e.g.
+    'web.login.enabled', to the value at that path.
+
+    Looking up a path is a single dictionary lookup, and the paths under a
+    prefix are found through a sorted list of every path.
+
+    :param dict config: The configuration to index.
+    :param PathIndex previous: The index of a previous version of the
+        configuration.  Subtrees that are the very same objects in both
+        versions (as unchanged subtrees of frozen configurations are) have
+        their entries copied over instead of being indexed again.
+    """
+    def __init__(self, config, previous=None):
+        self._paths = {}
+        self._index(config, '', previous)
+        self._sorted_paths = sorted(self._paths)
+
+    def _index(self, config, prefix, previous):
+        for key, value in config.items():
+            path = prefix + key
+            self._paths[path] = value
+
+            if isinstance(value, Mapping) and value:
+                if previous is not None and previous._paths.get(path, _MISSING) is value:
+                    self._paths.update(previous.iter_prefix(path))
+                else:
+                    self._index(value, path + '.', previous)
+
+    def get(self, path, default=None):
+        """
+        Return the value at a dotted key path.
+
+        :param str path: The dotted key path, e.g. 'web.oauth2.enabled'.
+        :param default: The value returned if the path doesn't exist.
+        """
+        return self._paths.get(path, default)
+
+    def iter_prefix(self, prefix):
+        """
+        Iterate over every path under a prefix, in sorted order.
+
+        :param str prefix: The dotted key path prefix, e.g. 'web.social'.
+        :returns: An iterator of (path, value) tuples.
+        """
+        prefix += '.'
+        start = bisect_left(self._sorted_paths, prefix)
+
+        for path in islice(self._sorted_paths, start, None):
+            if not path.startswith(prefix):
+                break
+
+            yield path, self._paths[path]
+
+    def __contains__(self, path):
+        return path in self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+
+class PathLookupMixin(object):
+    """
+    Adds dotted key path lookups, answered by the `path_index` attribute,
+    to a configuration.
+    """
+    __slots__ = ()
+
+    def get_path(self, path, default=None):
+        """
+        Return the value at a dotted key path, e.g. 'web.oauth2.enabled'.
+        """
+        return self.path_index.get(path, default)
+
+    def iter_prefix(self, prefix):
+        """
+        Iterate over the (path, value) tuples of every path under a prefix,
+        e.g. 'web.social'.
+        """
+        return self.path_index.iter_prefix(prefix)
+
+
+class IndexedConfig(PathLookupMixin, dict):
+    """
+    A configuration dictionary with a `PathIndex` built when it's created.
+
+    The index isn't updated when the configuration is modified afterwards.
+
+    :param dict config: The configuration.
+    :param PathIndex path_index: The index of the configuration.  Built from
+        the configuration if not given.
+    """
+    def __init__(self, config, path_index=None):
+        super(IndexedConfig, self).__init__(config)
+        self.path_index = path_index if path_index is not None else PathIndex(self)
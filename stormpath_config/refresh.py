@@ -0,0 +1,161 @@
+"""Background refresh of the settings retrieved from the Stormpath API.
+
+Remote settings, like the OAuth policy TTLs and the social providers, rarely
+change, so a `BackgroundRefresher` serves the last settings it retrieved
+without any API calls, and retrieves them again in a background thread every
+`interval` seconds (stale-while-revalidate).  When they changed, `callback`
+is called, typically `ConfigHolder.reload`, to publish a new configuration
+built with them.
+"""
+
+
+from copy import deepcopy
+from random import uniform
+from threading import Event, Lock, Thread
+
+from . import log
+
+
+class BackgroundRefresher(object):
+    """
+    A validation strategy running remote strategies in the background.
+
+    The first time a configuration is processed, and whenever it differs
+    from the previous one (e.g. after a configuration file changed), the
+    remote strategies are run in the calling thread.  Otherwise their last
+    output is returned right away.
+
+    After the first run, a daemon thread runs the remote strategies again
+    every `interval` seconds, randomly shortened or lengthened by up to
+    `jitter` times the interval so processes started together don't all
+    call the API at once.  If the output changed, it's kept and `callback`
+    is called without arguments; if running the strategies fails, the
+    failure is logged and the last output keeps being served.
+
+    :param strategies: The remote strategy to run, or a list of them, e.g.
+        `EnrichClientFromRemoteConfigStrategy` and
+        `EnrichIntegrationFromRemoteConfigStrategy`.
+    :param float interval: The seconds between two refreshes.
+    :param float jitter: The maximum fraction of the interval a refresh is
+        moved by.
+    :param callback: A function called after a refresh changed the output.
+    """
+    def __init__(self, strategies, interval=300.0, jitter=0.1, callback=None):
+        if not isinstance(strategies, (list, tuple)):
+            strategies = [strategies]
+
+        self.strategies = list(strategies)
+        self.interval = interval
+        self.jitter = jitter
+        self.callback = callback
+        self.refreshes = 0
+        self.failures = 0
+
+        self._lock = Lock()
+        self._input = None
+        self._output = None
+        self._stopped = Event()
+        self._thread = None
+
+    @property
+    def client_factory(self):
+        """
+        None if a remote strategy has no client factory, so a `ConfigLoader`
+        hands its client provider to the remote strategies.
+        """
+        for strategy in self.strategies:
+            if getattr(strategy, 'client_factory', False) is None:
+                return None
+
+        return False
+
+    @client_factory.setter
+    def client_factory(self, client_factory):
+        for strategy in self.strategies:
+            if getattr(strategy, 'client_factory', False) is None:
+                strategy.client_factory = client_factory
+
+    def _run_strategies(self, config):
+        for strategy in self.strategies:
+            config = strategy.process(config)
+
+        return config
+
+    def process(self, config):
+        with self._lock:
+            config_input, output = self._input, self._output
+
+        if output is not None and config_input == config:
+            return deepcopy(output)
+
+        config_input = deepcopy(config)
+        config = self._run_strategies(config)
+
+        with self._lock:
+            self._input, self._output = config_input, deepcopy(config)
+
+        self.start()
+
+        return config
+
+    def refresh(self):
+        """
+        Run the remote strategies again on the last processed configuration.
+
+        :rtype: bool
+        :returns: Whether the output changed, in which case `callback` was
+            called.
+        """
+        with self._lock:
+            config_input, previous = self._input, self._output
+
+        if config_input is None:
+            return False
+
+        output = self._run_strategies(deepcopy(config_input))
+
+        with self._lock:
+            # Discard the output if a different configuration was processed
+            # in the meantime.
+            if self._input is not config_input or output == previous:
+                return False
+
+            self._output = output
+
+        if self.callback is not None:
+            self.callback()
+
+        return True
+
+    def _delay(self):
+        return self.interval * (1 + uniform(-self.jitter, self.jitter))
+
+    def _run(self):
+        while not self._stopped.wait(self._delay()):
+            try:
+                self.refresh()
+            except Exception:
+                self.failures += 1
+                log.exception('Refreshing the remote configuration failed; keeping the previous one.')
+                continue
+
+            self.refreshes += 1
+
+    def start(self):
+        """
+        Start refreshing in the background, unless already started or
+        stopped.  Called by the first `process()`.
+        """
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+
+            self._thread = Thread(target=self._run, name='stormpath-config-refresher')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stop refreshing, and wait for the background thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,315 @@
+"""Bounded, failure tolerant runs of the remote strategies.
+
+A `ResilientStrategy` wraps a remote strategy so loading never waits for
+the Stormpath API longer than a time budget.  Failures (including running
+out of time) are counted by a `CircuitBreaker`, which stops calling the API
+altogether for a while once it failed repeatedly.  Whenever the strategy
+can't be run, the settings it last retrieved successfully, kept by a
+`LastKnownGood` store that can be persisted to disk, are used instead, and
+the configuration is marked as degraded.
+"""
+
+
+from copy import deepcopy
+from json import dump, load
+from os import chmod, fdopen, remove
+from os.path import abspath, dirname, expanduser, isfile
+from tempfile import mkstemp
+from threading import Event, Lock, Thread
+
+from . import log
+from .cache import _monotonic, _replace
+from .helpers import _extend_dict
+
+
+_MISSING = object()
+
+# The configuration key set on configurations built with last known good
+# settings.
+DEGRADED_KEY = 'remoteConfigDegraded'
+
+
+class RemoteConfigTimeout(Exception):
+    """Raised when a remote strategy runs out of time."""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a remote strategy isn't run because its circuit is open."""
+
+
+class RemoteConfigUnavailable(Exception):
+    """
+    Raised when a remote strategy can't be run, and there are no last known
+    good settings to use instead.
+    """
+
+
+def _enrichment(original, enriched):
+    """
+    Return the values a strategy added or changed, as a nested dictionary
+    that extends the original configuration into the enriched one.
+    """
+    fragment = {}
+    for key, value in enriched.items():
+        old = original.get(key, _MISSING)
+        if isinstance(old, dict) and isinstance(value, dict):
+            nested = _enrichment(old, value)
+            if nested:
+                fragment[key] = nested
+        elif old is _MISSING or type(old) is not type(value) or old != value:
+            fragment[key] = value
+
+    return fragment
+
+
+class CircuitBreaker(object):
+    """
+    Stops calling a failing service until it has had time to recover.
+
+    The circuit opens after `failure_threshold` consecutive failures.  Once
+    `reset_timeout` seconds passed, a single call is let through: the
+    circuit closes if it succeeds, and opens again if it fails.  A breaker
+    can be shared between strategies and loaders, and is safe to share
+    between threads.
+
+    :param int failure_threshold: The number of consecutive failures that
+        open the circuit.
+    :param float reset_timeout: The seconds the circuit stays open.
+    :param timer: Callable returning the current time in seconds.  Defaults
+        to a monotonic clock.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=3, reset_timeout=30.0, timer=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timer = timer if timer is not None else _monotonic
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._lock = Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and self._opened_at + self.reset_timeout <= self.timer():
+                return self.HALF_OPEN
+
+            return self._state
+
+    def allow(self):
+        """
+        Return whether a call may be made.
+
+        :rtype: bool
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and self._opened_at + self.reset_timeout <= self.timer():
+                # Let a single trial call through.
+                self._state = self.HALF_OPEN
+                return True
+
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self.timer()
+
+
+class LastKnownGood(object):
+    """
+    The settings remote strategies last retrieved successfully, optionally
+    persisted to a JSON file so they survive restarts.
+
+    The file is replaced atomically whenever the settings change.  Failing
+    to write it is logged, and doesn't fail the load.
+
+    :param str path: Path of the JSON file the settings are persisted to.
+        They're only kept in memory if not given.
+    :param int mode: The permissions of the file.  The settings include
+        secrets, like the social providers' client secrets, so it's only
+        readable by its owner by default; pass e.g. 0o640 to share it with
+        workers running as other users.
+    """
+    def __init__(self, path=None, mode=None):
+        self.path = abspath(expanduser(path)) if path else None
+        self.mode = mode
+        self._entries = {}
+        self._lock = Lock()
+
+        if self.path and isfile(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self._entries = load(f)
+            except (IOError, OSError, ValueError):
+                self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the settings stored for a key, or None.
+
+        :rtype: dict
+        """
+        return self._entries.get(key)
+
+    def set(self, key, enrichment):
+        """
+        Store the settings for a key.
+
+        :param str key: The key, see `ResilientStrategy`.
+        :param dict enrichment: The values the strategy added to the
+            configuration.
+        """
+        with self._lock:
+            if self._entries.get(key) == enrichment:
+                return
+
+            self._entries[key] = enrichment
+            try:
+                self._save()
+            except (IOError, OSError, TypeError, ValueError) as e:
+                log.warning('Unable to persist the last known good remote configuration to "%s": %s',
+                            self.path, e)
+
+    def _save(self):
+        if not self.path:
+            return
+
+        fd, tmp_path = mkstemp(dir=dirname(self.path))
+        try:
+            with fdopen(fd, 'w') as f:
+                dump(self._entries, f)
+            if self.mode is not None:
+                chmod(tmp_path, self.mode)
+            _replace(tmp_path, self.path)
+        except Exception:
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+class ResilientStrategy(object):
+    """
+    Runs a remote strategy within a time budget, falling back to its last
+    known good settings.
+
+    The strategy runs in a separate thread, on a copy of the configuration.
+    If it doesn't finish within `timeout` seconds it's abandoned (it keeps
+    running in the background, but its result is ignored), and if it raises
+    or the circuit breaker is open, it isn't waited for at all.  In all
+    those cases, the values the strategy added to the configuration the
+    last time it succeeded for the same Application and API key are used
+    instead, and `remoteConfigDegraded` is set to True in the
+    configuration.
+
+    :param strategy: The remote strategy, e.g. an
+        `EnrichIntegrationFromRemoteConfigStrategy`.
+    :param float timeout: The seconds the strategy may run for, or None to
+        wait for it however long it takes.
+    :param CircuitBreaker breaker: The circuit breaker counting the
+        strategy's failures.  A new one is created if not given; pass the
+        same one to every strategy calling the same API to share it.
+    :param LastKnownGood last_known_good: The store of the last known good
+        settings.  Kept in memory if not given.
+    :raises RemoteConfigUnavailable: If the strategy can't be run, and no
+        last known good settings exist.
+    """
+    def __init__(self, strategy, timeout=10.0, breaker=None, last_known_good=None):
+        self.strategy = strategy
+        self.timeout = timeout
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.last_known_good = last_known_good if last_known_good is not None else LastKnownGood()
+        self.fallbacks = 0
+
+    @property
+    def client_factory(self):
+        return getattr(self.strategy, 'client_factory', False)
+
+    @client_factory.setter
+    def client_factory(self, client_factory):
+        self.strategy.client_factory = client_factory
+
+    def _key(self, config):
+        application = config.get('application') or {}
+        api_key = (config.get('client') or {}).get('apiKey') or {}
+
+        return '%s %s %s' % (type(self.strategy).__name__, application.get('href') or application.get('name'),
+                             api_key.get('id'))
+
+    def _run(self, config):
+        if self.timeout is None:
+            return self.strategy.process(config)
+
+        done = Event()
+        result = {}
+
+        def run():
+            try:
+                result['config'] = self.strategy.process(config)
+            except Exception as e:
+                result['error'] = e
+            finally:
+                done.set()
+
+        thread = Thread(target=run, name='stormpath-config-remote')
+        thread.daemon = True
+        thread.start()
+
+        if not done.wait(self.timeout):
+            raise RemoteConfigTimeout('%s took longer than %s seconds.' % (type(self.strategy).__name__, self.timeout))
+
+        if 'error' in result:
+            raise result['error']
+
+        return result['config']
+
+    def _fall_back(self, key, config, error):
+        enrichment = self.last_known_good.get(key)
+        if enrichment is None:
+            raise RemoteConfigUnavailable('%s failed, and no last known good configuration exists: %s' % (
+                type(self.strategy).__name__, error))
+
+        log.warning('%s failed; using the last known good configuration: %s', type(self.strategy).__name__, error)
+        self.fallbacks += 1
+
+        config = _extend_dict(config, deepcopy(enrichment))
+        config[DEGRADED_KEY] = True
+
+        return config
+
+    def process(self, config):
+        if config.get('skipRemoteConfig'):
+            return config
+
+        key = self._key(config)
+        if not self.breaker.allow():
+            return self._fall_back(key, config, CircuitOpenError('The circuit is open.'))
+
+        try:
+            enriched = self._run(deepcopy(config))
+        except Exception as e:
+            self.breaker.record_failure()
+            return self._fall_back(key, config, e)
+
+        self.breaker.record_success()
+        self.last_known_good.set(key, _enrichment(config, enriched))
+
+        return enriched
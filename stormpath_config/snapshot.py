@@ -0,0 +1,176 @@
+"""Snapshots of fully resolved configurations.
+
+A snapshot is written once, e.g. when building a container image, by
+running a `ConfigLoader` with the complete pipeline (files, environment,
+remote enrichment).  Workers then load it with `LoadSnapshotStrategy`,
+which reads the resolved configuration back in a single read, without
+parsing any configuration file or calling the Stormpath API.
+
+The snapshot file starts with a magic string and a header holding the
+snapshot format version, the interpreter the snapshot was written by and a
+SHA256 digest of the payload, which is the configuration serialized with
+the marshal module.  Snapshots are only read by the interpreter version
+that wrote them, since marshal's format may change between versions.
+"""
+
+
+from hashlib import sha256
+import marshal
+from os import chmod, fdopen, remove
+from os.path import abspath, dirname, expanduser
+import platform
+import struct
+from tempfile import mkstemp
+
+from .cache import _replace
+from .frozen import FrozenConfig
+
+
+MAGIC = b'STORMPATH-CONFIG-SNAPSHOT\n'
+VERSION = 1
+
+# Format version, marshal version, interpreter tag length, payload length.
+_HEADER = struct.Struct('>HHHQ')
+_DIGEST_SIZE = sha256().digest_size
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot can't be written or read."""
+
+
+def _interpreter():
+    return ('%s-%s.%s' % ((platform.python_implementation(),) + platform.python_version_tuple()[:2])).lower()
+
+
+def _plain(value):
+    """Convert a configuration into the builtin types marshal supports."""
+    if isinstance(value, (dict, FrozenConfig)):
+        return dict((key, _plain(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+
+    return value
+
+
+def dumps(config):
+    """
+    Serialize a configuration as a snapshot.
+
+    :param dict config: The resolved configuration.
+    :rtype: bytes
+    :raises SnapshotError: If the configuration holds values that can't be
+        serialized, like datetimes.
+    """
+    try:
+        payload = marshal.dumps(_plain(config))
+    except ValueError as e:
+        raise SnapshotError('The configuration can\'t be snapshotted: %s' % e)
+
+    interpreter = _interpreter().encode('ascii')
+
+    return b''.join([
+        MAGIC,
+        _HEADER.pack(VERSION, marshal.version, len(interpreter), len(payload)),
+        interpreter,
+        sha256(payload).digest(),
+        payload,
+    ])
+
+
+def loads(data):
+    """
+    Deserialize a snapshot, checking its version and integrity.
+
+    :param bytes data: The snapshot.
+    :rtype: dict
+    :returns: The resolved configuration.
+    :raises SnapshotError: If the snapshot is corrupt, or was written by a
+        different snapshot format or interpreter version.
+    """
+    if not data.startswith(MAGIC):
+        raise SnapshotError('Not a configuration snapshot.')
+
+    offset = len(MAGIC)
+    try:
+        version, marshal_version, interpreter_size, payload_size = _HEADER.unpack_from(data, offset)
+    except struct.error:
+        raise SnapshotError('The snapshot is truncated.')
+
+    if version != VERSION:
+        raise SnapshotError('Unsupported snapshot version %d (expected %d).' % (version, VERSION))
+
+    offset += _HEADER.size
+    interpreter = data[offset:offset + interpreter_size].decode('ascii', 'replace')
+    if interpreter != _interpreter() or marshal_version != marshal.version:
+        raise SnapshotError('The snapshot was written by %s, and can\'t be read by %s.' % (
+            interpreter, _interpreter()))
+
+    offset += interpreter_size
+    digest = data[offset:offset + _DIGEST_SIZE]
+    payload = data[offset + _DIGEST_SIZE:]
+    if len(payload) != payload_size or sha256(payload).digest() != digest:
+        raise SnapshotError('The snapshot is corrupt.')
+
+    return marshal.loads(payload)
+
+
+def write_snapshot(config, file_path, mode=None):
+    """
+    Write a configuration snapshot to a file.
+
+    The file is replaced atomically, so workers never read a half-written
+    snapshot.
+
+    :param dict config: The resolved configuration.
+    :param str file_path: The path of the snapshot file.
+    :param int mode: The permissions of the file.  The snapshot holds the
+        API key secret, so it's only readable by its owner by default; pass
+        e.g. 0o640 for workers running as another user to read a snapshot
+        built by root.
+    """
+    file_path = abspath(expanduser(file_path))
+    data = dumps(config)
+
+    fd, tmp_path = mkstemp(dir=dirname(file_path))
+    try:
+        with fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            chmod(tmp_path, mode)
+        _replace(tmp_path, file_path)
+    except Exception:
+        try:
+            remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_snapshot(file_path):
+    """
+    Read a configuration snapshot from a file.
+
+    :param str file_path: The path of the snapshot file.
+    :rtype: dict
+    :returns: The resolved configuration.
+    :raises SnapshotError: See `loads()`.
+    """
+    with open(abspath(expanduser(file_path)), 'rb') as f:
+        return loads(f.read())
+
+
+def build_snapshot(loader, file_path, mode=None):
+    """
+    Load a configuration and write it as a snapshot.
+
+    :param obj loader: The `ConfigLoader` resolving the configuration.
+    :param str file_path: The path of the snapshot file.
+    :param int mode: See `write_snapshot()`.
+    :rtype: dict
+    :returns: The loaded configuration.
+    """
+    config = loader.load()
+    write_snapshot(config, file_path, mode)
+
+    return config
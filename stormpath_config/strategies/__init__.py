@@ -1,11 +1,69 @@
-from .debug_config import DebugConfigStrategy
-from .enrich_client_from_remote_config import EnrichClientFromRemoteConfigStrategy
-from .enrich_integration_config import EnrichIntegrationConfigStrategy
-from .enrich_integration_from_remote_config import EnrichIntegrationFromRemoteConfigStrategy
-from .extend_config import ExtendConfigStrategy
-from .load_apikey_config import LoadAPIKeyConfigStrategy
-from .load_apikey_from_config import LoadAPIKeyFromConfigStrategy
-from .load_env_config import LoadEnvConfigStrategy
-from .load_file_config import LoadFileConfigStrategy
-from .load_file_path import LoadFilePathStrategy
-from .validate_client_config import ValidateClientConfigStrategy
+"""Configuration strategies.
+
+On Python 3.7+, each strategy's module is only imported when the strategy
+is first accessed, so processes that don't use the file or remote
+strategies don't pay for importing them.
+"""
+
+
+import sys
+
+
+_STRATEGY_MODULES = {
+    'DebugConfigStrategy': 'debug_config',
+    'DebugState': 'debug_config',
+    'EnrichClientFromRemoteConfigStrategy': 'enrich_client_from_remote_config',
+    'EnrichIntegrationConfigStrategy': 'enrich_integration_config',
+    'EnrichIntegrationFromRemoteConfigStrategy': 'enrich_integration_from_remote_config',
+    'ExtendConfigStrategy': 'extend_config',
+    'LoadAPIKeyConfigStrategy': 'load_apikey_config',
+    'LoadAPIKeyFromConfigStrategy': 'load_apikey_from_config',
+    'LoadEnvConfigStrategy': 'load_env_config',
+    'LoadFileConfigStrategy': 'load_file_config',
+    'LoadFilePathStrategy': 'load_file_path',
+    'LoadSnapshotStrategy': 'load_snapshot',
+    'ValidateClientConfigStrategy': 'validate_client_config',
+}
+
+__all__ = [
+    'DebugConfigStrategy',
+    'DebugState',
+    'EnrichClientFromRemoteConfigStrategy',
+    'EnrichIntegrationConfigStrategy',
+    'EnrichIntegrationFromRemoteConfigStrategy',
+    'ExtendConfigStrategy',
+    'LoadAPIKeyConfigStrategy',
+    'LoadAPIKeyFromConfigStrategy',
+    'LoadEnvConfigStrategy',
+    'LoadFileConfigStrategy',
+    'LoadFilePathStrategy',
+    'LoadSnapshotStrategy',
+    'ValidateClientConfigStrategy',
+]
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        module = _STRATEGY_MODULES.get(name)
+        if module is None:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+        value = globals()[name] = getattr(__import__(module, globals(), None, [name], 1), name)
+
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    from .debug_config import DebugConfigStrategy, DebugState
+    from .enrich_client_from_remote_config import EnrichClientFromRemoteConfigStrategy
+    from .enrich_integration_config import EnrichIntegrationConfigStrategy
+    from .enrich_integration_from_remote_config import EnrichIntegrationFromRemoteConfigStrategy
+    from .extend_config import ExtendConfigStrategy
+    from .load_apikey_config import LoadAPIKeyConfigStrategy
+    from .load_apikey_from_config import LoadAPIKeyFromConfigStrategy
+    from .load_env_config import LoadEnvConfigStrategy
+    from .load_file_config import LoadFileConfigStrategy
+    from .load_file_path import LoadFilePathStrategy
+    from .load_snapshot import LoadSnapshotStrategy
+    from .validate_client_config import ValidateClientConfigStrategy
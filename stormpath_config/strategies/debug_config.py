@@ -1,7 +1,30 @@
+from copy import deepcopy
 from json import dumps
-from logging import getLogger
+from logging import DEBUG, getLogger
 
 from .. import log
+from ..helpers import _diff
+
+
+def _dumps(value, indent=None):
+    # Leaves such as datetimes are logged as strings.
+    return dumps(value, sort_keys=True, indent=indent, separators=(',', ': '), default=str)
+
+
+class DebugState(object):
+    """
+    The configurations logged by the previous diff mode sections of a
+    pipeline, per logger.
+
+    Share one between the DebugConfigStrategy instances of a `ConfigLoader`
+    so each section is diffed against the previous one.  It's cleared when a
+    load starts, so sections are never diffed against another load's.
+    """
+    def __init__(self):
+        self.sections = {}
+
+    def clear(self):
+        self.sections.clear()
 
 
 class DebugConfigStrategy(object):
@@ -13,20 +36,58 @@ class DebugConfigStrategy(object):
 
     If no logger is supplied, the 'python-config' logger will be used by
     default.
+
+    Nothing is serialized unless the logger has DEBUG enabled.  In diff
+    mode, only the key paths that changed since the previous diff mode
+    section of the same load, logged to the same logger and recorded in the
+    same `DebugState`, are logged.
     """
-    def __init__(self, logger=None, section=None):
+    def __init__(self, logger=None, section=None, diff=False, state=None):
         self.section = section
+        self.diff = diff
+        self.state = state if state is not None else DebugState()
         if logger is None:
             self.log = log
         else:
             self.log = getLogger(logger)
 
+    def _format_diff(self, previous, config):
+        added, removed, changed = _diff(previous, config)
+
+        lines = []
+        for path, value in added.items():
+            lines.append('+ %s: %s' % (path, _dumps(value)))
+        for path in removed:
+            lines.append('- %s' % path)
+        for path, (old, new) in changed.items():
+            lines.append('~ %s: %s -> %s' % (path, _dumps(old), _dumps(new)))
+
+        if not lines:
+            return 'no changes\n'
+
+        return ''.join('%s\n' % line for line in sorted(lines, key=lambda line: line[2:]))
+
+    def start_load(self):
+        """Forget the sections logged by the previous load."""
+        self.state.clear()
+
     def process(self, config):
+        if not self.log.isEnabledFor(DEBUG):
+            return config
+
         message = ''
         if self.section is not None:
             message = '%s:\n' % self.section
 
-        message = "%s%s\n" % (message, dumps(config, sort_keys=True, indent=4, separators=(',', ': ')))
+        previous = self.state.sections.get(self.log.name) if self.diff else None
+        if previous is not None:
+            message = '%s%s' % (message, self._format_diff(previous, config))
+        else:
+            message = "%s%s\n" % (message, _dumps(config, indent=4))
+
+        if self.diff:
+            self.state.sections[self.log.name] = deepcopy(config)
+
         self.log.debug(message)
 
         return config
@@ -17,70 +17,174 @@ def _resolve_application_by_href(client, config, href):
     return app.name
 
 
-def _resolve_application_by_name(client, config, name):
+_NOT_FOUND_MESSAGE = ('The provided application could not be found. '
+    'The provided application name was: "%s".')
+
+_NO_DEFAULT_MESSAGE = """Could not automatically resolve a Stormpath Application.
+    Please specify your Stormpath Application in your configuration."""
+
+
+def _resolve_application_by_name(client, config, name, index=None):
     """
     Finds and returns an Application object given an Application name.  Will
     return an error if no Application is found.
+
+    If an `ApplicationIndex` is given, it's looked up first, and the
+    resolved Application is added to it.  Names missing from the index are
+    always queried, even if it lists every Application, since they may have
+    been created or renamed since.
     """
+    if index is not None:
+        href = index.href(config, name)
+        if href is not None:
+            return href
+
     try:
         app = client.applications.query(name=name)[0]
     except IndexError:
-        raise Exception('The provided application could not be found. '
-            'The provided application name was: "%s".' % name)
+        raise Exception(_NOT_FOUND_MESSAGE % name)
     except Exception as e:
         raise Exception('Exception was raised while trying to resolve an application. '
             'The provided application name was: "%s". '
-            'Exception message was: "%s".' % (name, e.message))
+            'Exception message was: "%s".' % (name, e))
+
+    if index is not None:
+        index.add(config, name, app.href)
 
     return app.href
 
 
-def _resolve_default_application(client, config):
+def _resolve_default_application(client, config, index=None):
     """
     If there are only two Applications and one of them is the Stormpath
     Application, then use the other one as default.
+
+    If an `ApplicationIndex` is given, the outcome is recorded in it and
+    the Applications aren't listed again until it expires.
     """
     default_app = None
-    message = """Could not automatically resolve a Stormpath Application.
-    Please specify your Stormpath Application in your configuration."""
+    message = _NO_DEFAULT_MESSAGE
+
+    if index is not None:
+        default = index.default(config)
+        if default == ():
+            raise Exception(message)
+        elif default is not None:
+            return default
 
     for app in client.applications:
+        # The index is saved once, when the default is recorded.
+        if index is not None:
+            index.add(config, app.name, app.href, save=False)
+
         if app.name != 'Stormpath':
             # Check if we have already found non-Stormpath app.
             # If there is more than one non-Stormpath app, we can't
-            # resolve any of them as default application.
+            # resolve any of them as default application, so there's
+            # no need to list the remaining ones.
             if default_app is not None:
+                if index is not None:
+                    index.set_default(config, ())
+
                 raise Exception(message)
 
             default_app = app
 
-    if default_app is None:
+    default = (default_app.name, default_app.href) if default_app is not None else ()
+    if index is not None:
+        index.set_default(config, default, complete=True)
+
+    if not default:
         raise Exception(message)
 
-    return (default_app.name, default_app.href)
+    return default
 
 
 class EnrichClientFromRemoteConfigStrategy(object):
     """Retrieves Stormpath settings from the API service, and ensures
     the local configuration object properly reflects these settings.
+
+    `async_client_factory` is a coroutine function used by `process_async()`
+    to create the client without blocking the event loop.
+
+    If `client_factory` is left out, the strategy uses the `client_provider`
+    of the `ConfigLoader` it's part of.
+
+    If an `ApplicationIndex` is supplied, Applications resolved by name, and
+    the default Application, are looked up in it before querying the API.
     """
-    def __init__(self, client_factory):
+    def __init__(self, client_factory=None, async_client_factory=None, application_index=None):
         self.client_factory = client_factory
-
-    def process(self, config):
+        self.async_client_factory = async_client_factory
+        self.application_index = application_index
+
+    def _process_locally(self, config):
+        """
+        Process the configuration if it doesn't require any API calls.
+
+        :returns: The processed configuration, or None if a client is
+            needed to process it.
+        :raises Exception: If the `ApplicationIndex` knows the default
+            Application can't be resolved.
+        """
         if config.get('skipRemoteConfig'):
             return config
 
+        index = self.application_index
         application = config.get('application', {})
-        client = self.client_factory(config)
+        href, name = application.get('href'), application.get('name')
+
+        if index is None or href:
+            return None
 
+        if name:
+            href = index.href(config, name)
+            if href is None:
+                return None
+
+            config['application']['href'] = href
+        else:
+            default = index.default(config)
+            if default == ():
+                raise Exception(_NO_DEFAULT_MESSAGE)
+
+            if default is None:
+                return None
+
+            config['application']['name'], config['application']['href'] = default
+
+        return config
+
+    def process(self, config):
+        processed = self._process_locally(config)
+        if processed is not None:
+            return processed
+
+        return self._process_with_client(self.client_factory(config), config)
+
+    def process_async(self, config, executor=None):
+        """
+        Coroutine version of `process()`, available on Python 3.5+.
+
+        The client is created with `async_client_factory` if there is one,
+        and the API calls are made on `executor`, or the event loop's
+        default executor if not given.
+        """
+        from ..aio import process_remote_async
+
+        return process_remote_async(self, config, executor)
+
+    def _process_with_client(self, client, config):
+        application = config.get('application', {})
         href, name = application.get('href'), application.get('name')
 
         if href:
             config['application']['name'] = _resolve_application_by_href(client, config, href)
         elif name:
-            config['application']['href'] = _resolve_application_by_name(client, config, name)
+            config['application']['href'] = _resolve_application_by_name(
+                client, config, name, self.application_index)
         else:
-            config['application']['name'], config['application']['href'] = _resolve_default_application(client, config)
+            config['application']['name'], config['application']['href'] = _resolve_default_application(
+                client, config, self.application_index)
 
         return config
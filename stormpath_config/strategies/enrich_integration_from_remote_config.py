@@ -1,3 +1,4 @@
+from copy import deepcopy
 from datetime import timedelta
 
 from ..helpers import _extend_dict, to_camel_case
@@ -155,28 +156,138 @@ def _enrich_with_social_providers(application, config):
     return social_config
 
 
+def _enrich_with_default_directory_policies(application, config):
+    """
+    Given a Stormpath Application, and a fully populated Stormpath
+    configuration, retrieve the policies of the Application's default
+    Account Store.
+
+    :param obj application: The Stormpath Application.
+    :param dict config: The fully populated Stormpath configuration.
+    :rtype: dict or None
+    :returns: The Directory Policies as a dict, or None.
+    """
+    return _enrich_with_directory_policies(_resolve_directory(application), config)
+
+
 class EnrichIntegrationFromRemoteConfigStrategy(object):
     """Retrieves Stormpath settings from the API service, and ensures
     the local configuration object properly reflects these settings.
+
+    If a `TTLCache` is supplied, the settings retrieved for an application
+    href and API key ID are kept in it, and loading the configuration again
+    before they expire doesn't make any API calls.
+
+    If `max_workers` is greater than one, the OAuth policy, social providers
+    and directory policies are retrieved concurrently on a thread pool of
+    that size, instead of one after another.
+
+    `async_client_factory` is a coroutine function used by `process_async()`
+    to create the client without blocking the event loop.
+
+    If `client_factory` is left out, the strategy uses the `client_provider`
+    of the `ConfigLoader` it's part of.
     """
-    def __init__(self, client_factory):
+    def __init__(self, client_factory=None, cache=None, max_workers=None, async_client_factory=None):
         self.client_factory = client_factory
-
-    def process(self, config):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.async_client_factory = async_client_factory
+
+    def _cache_key(self, config):
+        return (
+            config['application']['href'],
+            config.get('client', {}).get('apiKey', {}).get('id'),
+        )
+
+    def invalidate(self, config=None):
+        """
+        Drop the cached settings for the application and API key in the
+        given configuration, or every cached setting if none is given.
+        """
+        if self.cache is None:
+            return
+
+        self.cache.invalidate(self._cache_key(config) if config is not None else None)
+
+    def _fetch(self, client, config):
+        application = _resolve_application(client, config)
+        fetchers = [
+            _enrich_with_oauth_policy,
+            _enrich_with_social_providers,
+            _enrich_with_default_directory_policies,
+        ]
+
+        if not self.max_workers or self.max_workers < 2:
+            return tuple(fetch(application, config) for fetch in fetchers)
+
+        # Each fetcher makes its own API calls, so they can overlap.  The
+        # results are still returned (and merged) in the same order.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(fetchers))) as executor:
+            futures = [executor.submit(fetch, application, config) for fetch in fetchers]
+
+            return tuple(future.result() for future in futures)
+
+    def _process_locally(self, config):
+        """
+        Process the configuration if it doesn't require any API calls.
+
+        :returns: The processed configuration, or None if a client is
+            needed to process it.
+        """
         if config.get('skipRemoteConfig'):
             return config
 
-        client = self.client_factory(config)
-
-        if 'href' in config.get('application', {}):
-            application = _resolve_application(client, config)
-            config['application']['oAuthPolicy'] = _enrich_with_oauth_policy(application, config)
-            social_config = _enrich_with_social_providers(application, config)
-            if social_config:
-                _extend_dict(config, social_config)
-            directory = _resolve_directory(application)
-            policy_config = _enrich_with_directory_policies(directory, config)
-            if policy_config:
-                _extend_dict(config, policy_config)
+        if self.cache is not None and 'href' in config.get('application', {}):
+            fragments = self.cache.get(self._cache_key(config))
+            if fragments is not None:
+                return self._apply(fragments, config)
+
+        return None
+
+    def _process_with_client(self, client, config):
+        if 'href' not in config.get('application', {}):
+            return config
+
+        fragments = self._fetch(client, config)
+        if self.cache is not None:
+            self.cache.set(self._cache_key(config), fragments)
+
+        return self._apply(fragments, config)
+
+    def process(self, config):
+        processed = self._process_locally(config)
+        if processed is not None:
+            return processed
+
+        return self._process_with_client(self.client_factory(config), config)
+
+    def process_async(self, config, executor=None):
+        """
+        Coroutine version of `process()`, available on Python 3.5+.
+
+        The client is created with `async_client_factory` if there is one,
+        and the API calls are made on `executor`, or the event loop's
+        default executor if not given.
+        """
+        from ..aio import process_remote_async
+
+        return process_remote_async(self, config, executor)
+
+    def _apply(self, fragments, config):
+        # The fragments end up referenced from the config, so copy the
+        # cached ones to keep them intact.
+        if self.cache is not None:
+            fragments = deepcopy(fragments)
+
+        oauth_policy, social_config, policy_config = fragments
+
+        config['application']['oAuthPolicy'] = oauth_policy
+        if social_config:
+            _extend_dict(config, social_config)
+        if policy_config:
+            _extend_dict(config, policy_config)
 
         return config
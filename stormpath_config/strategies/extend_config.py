@@ -6,6 +6,16 @@ class ExtendConfigStrategy(object):
     def __init__(self, extend_with):
         self.extend_with = extend_with
 
+    def fingerprint(self):
+        """
+        Return the configuration this strategy extends with.
+
+        Replacing `extend_with` with a different configuration is detected,
+        but modifying it in place isn't: the fingerprint is the object
+        itself, so assign a new dictionary for reload() to pick it up.
+        """
+        return self.extend_with
+
     def process(self, config=None):
         if config is None:
             config = {}
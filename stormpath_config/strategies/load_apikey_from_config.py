@@ -1,3 +1,4 @@
+from ..helpers import _file_fingerprint
 from .load_apikey_config import LoadAPIKeyConfigStrategy
 
 
@@ -5,6 +6,17 @@ class LoadAPIKeyFromConfigStrategy(object):
     """Represents a strategy that loads an API key specified in config
     into the configuration.
     """
+    watched_paths = ('client.apiKey.file',)
+
+    def __init__(self):
+        self.loaded_files = set()
+
+    def fingerprint(self):
+        """Return the fingerprints of every API key file loaded so far."""
+        return tuple(sorted(
+            (api_key_file, _file_fingerprint(api_key_file))
+            for api_key_file in self.loaded_files))
+
     def process(self, config=None):
         if config is None:
             config = {}
@@ -12,6 +24,7 @@ class LoadAPIKeyFromConfigStrategy(object):
         api_key_file = config.get('client', {}).get('apiKey', {}).get('file')
         if api_key_file:
             lakcs = LoadAPIKeyConfigStrategy(api_key_file, True)
+            self.loaded_files.add(lakcs.file_path)
             config = lakcs.process(config)
             del config['client']['apiKey']['file']
 
@@ -1,38 +1,144 @@
 from os import environ
 
-from flatdict import FlatDict
 
-from ..helpers import _extend_dict
+def _leaf_paths(config, path=()):
+    """Yield the key path of every leaf of a nested dictionary."""
+    for key, value in config.items():
+        if isinstance(value, dict) and value:
+            for leaf_path in _leaf_paths(value, path + (key,)):
+                yield leaf_path
+        else:
+            yield path + (key,)
+
+
+def _matching_leaf_paths(config, name, path=()):
+    """
+    Yield the key path of every leaf of a nested dictionary whose upper
+    cased keys, joined with underscores, are the given name.  Only the
+    branches whose keys are a prefix of the name are walked.
+    """
+    for key, value in config.items():
+        upper_key = key.upper()
+        if name == upper_key:
+            if not isinstance(value, dict) or not value:
+                yield path + (key,)
+        elif name.startswith(upper_key + '_') and isinstance(value, dict):
+            for leaf_path in _matching_leaf_paths(value, name[len(upper_key) + 1:], path + (key,)):
+                yield leaf_path
+
+
+def _is_leaf(config, path):
+    """Return whether a key path leads to a leaf of a nested dictionary."""
+    for key in path:
+        if not isinstance(config, dict) or key not in config:
+            return False
+        config = config[key]
+
+    return not isinstance(config, dict) or not config
 
 
 class LoadEnvConfigStrategy(object):
     """Represents a strategy that loads configuration variables from
     the environment into the configuration.
+
+    Every leaf of the configuration can be set by an environment variable
+    named after its key path, e.g. STORMPATH_CLIENT_APIKEY_ID for
+    client.apiKey.id, unless an alias maps that name to another one.
+
+    The environment is scanned once per load for the variables starting
+    with the prefix (or named by an alias), so the configuration is returned
+    as is when none are set.  The key paths these variables map to are
+    cached, and only rebuilt from the whole configuration when a cached path
+    no longer leads to a leaf.  A variable that isn't cached, like one that
+    doesn't match any leaf, is looked up by only walking the branches whose
+    keys prefix its name.
     """
 
     def __init__(self, prefix, aliases=None):
         self.prefix = prefix
         self.aliases = aliases if aliases is not None else {}
+        self._paths = {}
+
+    def _scan(self):
+        """Return the set environment variables this strategy could read."""
+        prefix = self.prefix + '_'
+        aliases = set(self.aliases.values())
+
+        return dict(
+            (key, value) for key, value in environ.items()
+            if key.startswith(prefix) or key in aliases)
+
+    def _build_paths(self, config):
+        """Map every variable name to the key paths of the leaves it sets."""
+        paths = {}
+        for path in _leaf_paths(config):
+            env_key = '_'.join([self.prefix] + [key.upper() for key in path])
+            env_key = self.aliases.get(env_key, env_key)
+            paths.setdefault(env_key, []).append(path)
+
+        return paths
+
+    def _find_paths(self, config, env_key):
+        """Return the key paths of the leaves a variable sets."""
+        names = [name for name, alias in self.aliases.items() if alias == env_key]
+        if env_key not in self.aliases:
+            names.append(env_key)
+
+        prefix = self.prefix + '_'
+        paths = []
+        for name in names:
+            if name.startswith(prefix):
+                paths.extend(_matching_leaf_paths(config, name[len(prefix):]))
+
+        return paths
+
+    def fingerprint(self):
+        """Return the environment variables this strategy could read."""
+        return tuple(sorted(self._scan().items()))
 
     def process(self, config=None):
         if config is None:
             config = {}
 
-        config = FlatDict(config, delimiter='_')
-        environ_config = {}
+        variables = [(key, value) for key, value in self._scan().items() if value]
+        if not variables:
+            return config
 
-        for key in config.keys():
-            env_key = '_'.join([self.prefix, key.upper()])
-            env_key = self.aliases.get(env_key, env_key)
-            value = environ.get(env_key)
+        matches = []
+        rebuilt = False
+        for env_key, value in variables:
+            paths = self._paths.get(env_key)
+            if not rebuilt and paths is not None and not all(_is_leaf(config, path) for path in paths):
+                # The configuration changed shape.
+                self._paths = self._build_paths(config)
+                rebuilt = True
+                paths = self._paths.get(env_key)
+
+            if paths is None and not rebuilt:
+                paths = self._find_paths(config, env_key)
+                if paths:
+                    self._paths[env_key] = paths
+
+            matches.extend((path, value) for path in paths or ())
+
+        if not matches:
+            return config
 
-            if value:
-                if isinstance(config[key], int):
-                    value = int(value)
+        # Copy the dictionaries along the written paths only, so the given
+        # configuration isn't modified.
+        config = dict(config)
+        copied = set()
+        for path, value in matches:
+            node = config
+            for i, key in enumerate(path[:-1]):
+                if path[:i + 1] not in copied:
+                    node[key] = dict(node[key])
+                    copied.add(path[:i + 1])
+                node = node[key]
 
-                environ_config[key] = value
+            if isinstance(node[path[-1]], int):
+                value = int(value)
 
-        _extend_dict(config, environ_config)
-        config = config.as_dict()
+            node[path[-1]] = value
 
         return config
@@ -1,18 +1,31 @@
-from yaml import load
-
 from ..helpers import _extend_dict
+from ..parsers import parse_config
 from .load_file_path import LoadFilePathStrategy
 
 
+def _parse_file(file_path):
+    with open(file_path, 'r') as f:
+        return parse_config(f.read(), file_path)
+
+
 class LoadFileConfigStrategy(LoadFilePathStrategy):
     """Represents a strategy that loads configuration from either a
     JSON or YAML file into the configuration.
+
+    If a `ParsedFileCache` is supplied, the parsed file is stored in it
+    and files that haven't changed since are never parsed again.
     """
+    def __init__(self, file_path, must_exist=False, cache=None):
+        super(LoadFileConfigStrategy, self).__init__(file_path, must_exist)
+        self.cache = cache
+
     def _process_file_path(self, config):
-        f = open(self.file_path, 'r')
         try:
-            loaded_config = load(f.read())
+            if self.cache is not None:
+                loaded_config = self.cache.get(self.file_path, _parse_file)
+            else:
+                loaded_config = _parse_file(self.file_path)
         except Exception as e:
-            raise Exception('Error parsing file "%s".\nDetails: %s' % (self.file_path, e.message))
+            raise Exception('Error parsing file "%s".\nDetails: %s' % (self.file_path, e))
 
         return _extend_dict(config, loaded_config)
@@ -1,4 +1,6 @@
-from path import Path
+from os.path import abspath, exists, expanduser, expandvars, normpath
+
+from ..helpers import _file_fingerprint
 
 
 class LoadFilePathStrategy(object):
@@ -6,10 +8,14 @@ class LoadFilePathStrategy(object):
     file.
     """
     def __init__(self, file_path, must_exist=False):
-        self._file_path = Path(file_path).expand()
-        self.file_path = self._file_path.abspath()
+        self._file_path = normpath(expanduser(expandvars(file_path)))
+        self.file_path = abspath(self._file_path)
         self.must_exist = must_exist
 
+    def fingerprint(self):
+        """Return the fingerprint of the file this strategy loads."""
+        return (self.file_path, _file_fingerprint(self.file_path))
+
     def _process_file_path(self, config):
         raise NotImplementedError('Subclasses must implement this method.')
 
@@ -23,7 +29,7 @@ class LoadFilePathStrategy(object):
 
             return config
 
-        if not self._file_path.exists():
+        if not exists(self._file_path):
             if self.must_exist:
                 raise Exception('Config file "' + self.file_path + '" doesn\'t exist.')
 
@@ -0,0 +1,24 @@
+from ..helpers import _extend_dict
+from ..snapshot import read_snapshot
+from .load_file_path import LoadFilePathStrategy
+
+
+class LoadSnapshotStrategy(LoadFilePathStrategy):
+    """Represents a strategy that loads a fully resolved configuration
+    snapshot, written by `stormpath_config.snapshot.write_snapshot()`, into
+    the configuration.
+
+    The snapshot is read in a single read and isn't parsed, so it's meant
+    to replace the file and remote strategies of a pipeline.  Strategies
+    placed after it, like LoadEnvConfigStrategy, can still override it.
+    """
+    def _process_file_path(self, config):
+        try:
+            snapshot = read_snapshot(self.file_path)
+        except Exception as e:
+            raise Exception('Error loading snapshot "%s".\nDetails: %s' % (self.file_path, e))
+
+        if not config:
+            return snapshot
+
+        return _extend_dict(config, snapshot)
@@ -0,0 +1,320 @@
+"""Hot reloading of configurations when their files change.
+
+A `ConfigWatcher` watches every file a `ConfigLoader`'s strategies read or
+would read (the files of LoadFilePathStrategy subclasses, whether they
+exist or not, and the API key files loaded by LoadAPIKeyFromConfigStrategy)
+and reloads the configuration in a background thread when one of them
+changes.  Readers only ever access the last published configuration, so
+serving a request never touches the file system.
+
+On Linux, changes are received from inotify; elsewhere, or if inotify isn't
+available, the files are polled.
+"""
+
+
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+import errno
+from itertools import chain
+import os
+from os.path import isdir, split
+from select import select
+import struct
+import sys
+from threading import Event, Thread
+
+from . import log
+from .cache import _monotonic
+from .helpers import _file_fingerprint
+
+
+# inotify(7) constants.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+               IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT = struct.Struct('iIII')
+
+# How often blocked backends check whether the watcher was stopped.
+_STOP_CHECK_INTERVAL = 0.5
+
+
+def _source_files(loader):
+    """Return the absolute paths of every file a loader's strategies read."""
+    files = set()
+    for strategy in chain(loader.load_strategies, loader.post_processing_strategies, loader.validation_strategies):
+        file_path = getattr(strategy, 'file_path', None)
+        if file_path:
+            files.add(file_path)
+
+        files.update(getattr(strategy, 'loaded_files', ()))
+
+    return files
+
+
+def _encode(name):
+    if isinstance(name, bytes):
+        return name
+
+    return name.encode(sys.getfilesystemencoding())
+
+
+class PollingBackend(object):
+    """
+    Detects file changes by comparing their modification times and sizes
+    every `interval` seconds.
+    """
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._fingerprints = {}
+
+    def _scan(self):
+        return dict((path, _file_fingerprint(path)) for path in self._fingerprints)
+
+    def watch(self, paths):
+        self._fingerprints = dict((path, _file_fingerprint(path)) for path in paths)
+
+    def wait(self, stopped, timeout=None):
+        """
+        Wait for a change.
+
+        :param Event stopped: Set when the watcher is stopped.
+        :param float timeout: The seconds to wait for, forever if None.
+        :rtype: bool
+        :returns: Whether a watched file changed.
+        """
+        deadline = None if timeout is None else _monotonic() + timeout
+        while True:
+            step = self.interval if deadline is None else min(self.interval, deadline - _monotonic())
+            if step < 0 or stopped.wait(step):
+                return False
+
+            fingerprints = self._scan()
+            if fingerprints != self._fingerprints:
+                self._fingerprints = fingerprints
+                return True
+
+            if deadline is not None and _monotonic() >= deadline:
+                return False
+
+    def close(self):
+        pass
+
+
+class InotifyBackend(object):
+    """
+    Detects file changes with Linux's inotify.
+
+    The parent directory of every file is watched rather than the file
+    itself, so files that are created later or replaced by a rename are
+    still noticed.  For a directory that doesn't exist, its nearest
+    existing ancestor is watched instead.
+
+    :raises OSError: If inotify isn't available.
+    """
+    def __init__(self):
+        library = find_library('c')
+        if not sys.platform.startswith('linux') or library is None:
+            raise OSError(errno.ENOSYS, 'inotify is not available.')
+
+        self._libc = CDLL(library, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available.')
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(get_errno(), 'inotify_init1() failed.')
+
+        # The names of the watched entries of every watched directory, by
+        # watch descriptor.
+        self._names = {}
+
+    def watch(self, paths):
+        targets = {}
+        for path in paths:
+            directory, name = split(path)
+            while directory and not isdir(directory):
+                directory, name = split(directory)
+
+            targets.setdefault(directory, set()).add(_encode(name))
+
+        names = {}
+        for directory, directory_names in targets.items():
+            wd = self._libc.inotify_add_watch(self._fd, _encode(directory), _WATCH_MASK)
+            if wd < 0:
+                log.warning('Unable to watch "%s" for configuration changes: %s.', directory,
+                            os.strerror(get_errno()))
+                continue
+
+            names.setdefault(wd, set()).update(directory_names)
+
+        for wd in set(self._names) - set(names):
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+        self._names = names
+
+    def _read_events(self):
+        try:
+            data = os.read(self._fd, 65536)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return False
+            raise
+
+        changed = False
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, size = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + size].rstrip(b'\0')
+            offset += _EVENT.size + size
+
+            if mask & IN_Q_OVERFLOW:
+                changed = True
+            elif wd in self._names and (mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF) or
+                                        name in self._names[wd]):
+                changed = True
+
+        return changed
+
+    def wait(self, stopped, timeout=None):
+        """See `PollingBackend.wait()`."""
+        deadline = None if timeout is None else _monotonic() + timeout
+        while not stopped.is_set():
+            step = _STOP_CHECK_INTERVAL
+            if deadline is not None:
+                step = min(step, deadline - _monotonic())
+                if step <= 0:
+                    return False
+
+            if select([self._fd], [], [], step)[0] and self._read_events():
+                return True
+
+        return False
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class ConfigWatcher(object):
+    """
+    Reloads a `ConfigLoader`'s configuration when its files change.
+
+    `start()` loads the configuration and starts a daemon thread that waits
+    for changes to the files the loader's strategies read.  Once the files
+    stopped changing for `debounce` seconds, the configuration is reloaded
+    with `ConfigLoader.reload()`, so only the layers whose input changed are
+    recomputed, and published: it becomes the `config` attribute and is
+    handed to `callback`.  A reload that fails is logged, and the previous
+    configuration is kept.
+
+    The watcher's thread is the only one that should use the loader once
+    the watcher is started.
+
+    :param obj loader: The `ConfigLoader` to reload.
+    :param callback: A function called with every configuration loaded.
+    :param float debounce: The seconds without changes to wait for before
+        reloading, so a burst of changes causes a single reload.
+    :param bool use_inotify: Whether to use inotify where available.  The
+        files are polled otherwise.
+    :param float poll_interval: The seconds between two polls of the files.
+    """
+    def __init__(self, loader, callback=None, debounce=0.2, use_inotify=True, poll_interval=1.0):
+        self.loader = loader
+        self.callback = callback
+        self.debounce = debounce
+        self.config = None
+        self.reloads = 0
+        self.files = set()
+
+        self._backend = None
+        if use_inotify:
+            try:
+                self._backend = InotifyBackend()
+            except OSError as e:
+                log.debug('Polling configuration files, as inotify is unavailable: %s', e)
+
+        if self._backend is None:
+            self._backend = PollingBackend(poll_interval)
+
+        self._stopped = Event()
+        self._thread = None
+
+    @property
+    def backend(self):
+        return self._backend
+
+    def _load(self):
+        # Watching starts before loading, so changes made while loading
+        # trigger a reload.
+        self._backend.watch(self.files)
+        config = self.loader.reload()
+
+        files = _source_files(self.loader)
+        if files != self.files:
+            self.files = files
+            self._backend.watch(files)
+
+        self.config = config
+        if self.callback is not None:
+            self.callback(config)
+
+        return config
+
+    def _reload(self):
+        try:
+            self._load()
+        except Exception:
+            log.exception('Reloading the configuration failed; keeping the previous one.')
+            return
+
+        self.reloads += 1
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if not self._backend.wait(self._stopped):
+                continue
+
+            while self._backend.wait(self._stopped, self.debounce):
+                pass
+
+            if not self._stopped.is_set():
+                self._reload()
+
+    def start(self):
+        """
+        Load the configuration, and start watching its files.
+
+        :rtype: dict
+        :returns: The loaded configuration.
+        """
+        self.files = _source_files(self.loader)
+        config = self._load()
+
+        self._thread = Thread(target=self._run, name='stormpath-config-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+        return config
+
+    def stop(self):
+        """Stop watching, and wait for the watcher's thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._backend.close()
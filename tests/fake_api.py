@@ -0,0 +1,255 @@
+"""An offline stand-in for the Stormpath API.
+
+`FakeAPI` holds the resources of one tenant (N applications, each with M
+account store mappings) and hands out clients that behave like the parts of
+the Stormpath SDK the remote strategies use: links to other resources are
+fetched on first access, collections are iterated page by page, and every
+fetch counts as one request and can be slowed down by a fixed latency.
+
+It doesn't depend on the stormpath package, so the remote strategies can be
+tested and benchmarked without it:
+
+    api = FakeAPI(applications=100, account_store_mappings=10, latency=0.01, page_size=25)
+    strategy = EnrichIntegrationFromRemoteConfigStrategy(api.client)
+    strategy.process({'application': {'href': api.application_href(0)}})
+    api.requests
+"""
+
+
+from datetime import datetime, timedelta
+from threading import Lock
+from time import sleep
+
+
+BASE_URL = 'https://api.stormpath.com/v1'
+SOCIAL_PROVIDERS = ('google', 'facebook', 'github', 'linkedin')
+
+
+class FakeAPIError(Exception):
+    """An error response of the fake API."""
+    def __init__(self, message, status):
+        super(FakeAPIError, self).__init__(message)
+        self.message = message
+        self.status = status
+
+
+class Resource(dict):
+    """
+    A fetched resource.  Its properties are available as items and as
+    attributes, and its links are fetched when they're first accessed.
+    """
+    def __init__(self, api, properties, links=None):
+        super(Resource, self).__init__(properties)
+        self._api = api
+        self._links = links or {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        links = self._links
+        if name in links:
+            value = self._api.get(links[name])
+            setattr(self, name, value)
+            return value
+
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class Collection(object):
+    """A collection resource, fetched one page per request."""
+    def __init__(self, api, href):
+        self._api = api
+        self.href = href
+
+    def __iter__(self):
+        offset = 0
+        while True:
+            items, size = self._api.page(self.href, offset)
+            for item in items:
+                yield item
+
+            offset += len(items)
+            if not items or offset >= size:
+                break
+
+    def get(self, href):
+        return self._api.get(href)
+
+    def query(self, **criteria):
+        # The API filters collections itself, and returns the matching
+        # items one page at a time.
+        items = []
+        offset = 0
+        while True:
+            page, size = self._api.page(self.href, offset, criteria)
+            items.extend(page)
+
+            offset += len(page)
+            if not page or offset >= size:
+                return items
+
+
+class Client(object):
+    """A client of the fake API."""
+    def __init__(self, api):
+        self._api = api
+
+    @property
+    def applications(self):
+        return Collection(self._api, self._api.applications_href)
+
+
+class FakeAPI(object):
+    """
+    The resources of a Stormpath tenant, served with a configurable latency.
+
+    The tenant has the 'Stormpath' administration application plus
+    `applications` applications named 'Application 0', 'Application 1', ...
+    Every application has `account_store_mappings` mappings: the first one,
+    also the default account store mapping, is a Stormpath directory, and
+    the others are social directories, cycling through `social_providers`.
+
+    :param int applications: The number of applications.
+    :param int account_store_mappings: The number of account store mappings
+        of every application.
+    :param float latency: The seconds every request takes.
+    :param int page_size: The number of items per collection page.
+    :param tuple social_providers: The provider ids of social directories.
+    """
+    def __init__(self, applications=1, account_store_mappings=3, latency=0.0, page_size=25,
+                 social_providers=SOCIAL_PROVIDERS):
+        self.latency = latency
+        self.page_size = page_size
+        self.requests = 0
+        self.requested = []
+        self._lock = Lock()
+        self._resources = {}
+        self._collections = {}
+
+        self.applications_href = '%s/tenants/tenant/applications' % BASE_URL
+        self._collections[self.applications_href] = [self._add_application('Stormpath', 'admin', 0, ())]
+        for i in range(applications):
+            self._collections[self.applications_href].append(
+                self._add_application('Application %d' % i, str(i), account_store_mappings, social_providers))
+
+    def _add(self, href, properties, links=None):
+        properties = dict(properties, href=href)
+        self._resources[href] = (properties, links or {})
+        return href
+
+    def _add_application(self, name, key, account_store_mappings, social_providers):
+        now = datetime(2016, 1, 1)
+        href = '%s/applications/%s' % (BASE_URL, key)
+
+        oauth_policy = self._add('%s/oAuthPolicies/%s' % (BASE_URL, key), {
+            'access_token_ttl': timedelta(hours=1),
+            'refresh_token_ttl': timedelta(days=60),
+            'created_at': now,
+            'modified_at': now,
+        })
+
+        mappings = []
+        for i in range(account_store_mappings):
+            provider_id = social_providers[(i - 1) % len(social_providers)] if i else 'stormpath'
+            directory_key = '%s-%d' % (key, i)
+
+            provider = self._add('%s/directories/%s/provider' % (BASE_URL, directory_key), dict({
+                'provider_id': provider_id,
+                'created_at': now,
+                'modified_at': now,
+            }, **({'client_id': 'id', 'client_secret': 'secret'} if i else {})))
+            strength = self._add('%s/passwordPolicies/%s/strength' % (BASE_URL, directory_key), {
+                'min_symbol': 0,
+                'min_upper_case': 1,
+                'min_length': 8,
+                'min_numeric': 1,
+                'min_lower_case': 1,
+                'min_diacritic': 0,
+                'max_length': 100,
+            })
+            password_policy = self._add('%s/passwordPolicies/%s' % (BASE_URL, directory_key), {
+                'reset_email_status': 'ENABLED',
+            }, {'strength': strength})
+            account_creation_policy = self._add('%s/accountCreationPolicies/%s' % (BASE_URL, directory_key), {
+                'verification_email_status': 'DISABLED',
+            })
+            directory = self._add('%s/directories/%s' % (BASE_URL, directory_key), {
+                'name': 'Directory %s' % directory_key,
+            }, {
+                'provider': provider,
+                'password_policy': password_policy,
+                'account_creation_policy': account_creation_policy,
+            })
+            mappings.append(self._add('%s/accountStoreMappings/%s' % (BASE_URL, directory_key), {
+                'list_index': i,
+            }, {'account_store': directory}))
+
+        links = {'oauth_policy': oauth_policy}
+        if mappings:
+            links['default_account_store_mapping'] = mappings[0]
+
+        self._collections['%s/accountStoreMappings' % href] = mappings
+
+        return self._add(href, {'name': name}, links)
+
+    def _request(self, href):
+        with self._lock:
+            self.requests += 1
+            self.requested.append(href)
+
+        if self.latency:
+            sleep(self.latency)
+
+    def _resource(self, href):
+        properties, links = self._resources[href]
+        resource = Resource(self, properties, links)
+        mappings_href = '%s/accountStoreMappings' % href
+        if mappings_href in self._collections:
+            resource.account_store_mappings = Collection(self, mappings_href)
+
+        return resource
+
+    def application_href(self, i):
+        """Return the href of the i-th application (not counting 'Stormpath')."""
+        return '%s/applications/%d' % (BASE_URL, i)
+
+    def get(self, href):
+        """Fetch a resource, in one request."""
+        self._request(href)
+        if href not in self._resources:
+            raise FakeAPIError('The requested resource does not exist.', 404)
+
+        return self._resource(href)
+
+    def page(self, href, offset, criteria=None):
+        """
+        Fetch a page of a collection, in one request.
+
+        :returns: The items of the page, and the size of the (filtered)
+            collection.
+        """
+        self._request('%s?offset=%d&limit=%d' % (href, offset, self.page_size))
+
+        items = [self._resource(item_href) for item_href in self._collections[href]]
+        if criteria:
+            items = [item for item in items if all(item.get(k) == v for k, v in criteria.items())]
+
+        return items[offset:offset + self.page_size], len(items)
+
+    def update(self, href, **properties):
+        """Change properties of a resource, as seen by later fetches."""
+        self._resources[href][0].update(properties)
+
+    def client(self, config=None):
+        """Return a client, e.g. as the client_factory of a strategy."""
+        return Client(self)
+
+    def reset(self):
+        """Reset the request counters."""
+        with self._lock:
+            self.requests = 0
+            self.requested = []
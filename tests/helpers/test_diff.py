@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from stormpath_config.helpers import _diff
+
+
+class DiffTest(TestCase):
+    def test_diff(self):
+        original = {'client': {'apiKey': {'id': 'id', 'secret': 'secret'}}, 'ttl': 1, 'key': ['value']}
+        changed = {'client': {'apiKey': {'id': 'other', 'secret': 'secret'}}, 'ttl': True, 'new': {'a': 1}}
+
+        added, removed, modified = _diff(original, changed)
+
+        self.assertEqual(added, {'new': {'a': 1}})
+        self.assertEqual(removed, {'key': ['value']})
+        self.assertEqual(modified, {'client.apiKey.id': ('id', 'other'), 'ttl': (1, True)})
+
+    def test_diff_skips_shared_subtrees(self):
+        class Unequal(dict):
+            def __eq__(self, other):
+                raise AssertionError('compared')
+
+        shared = Unequal(a=1)
+
+        self.assertEqual(_diff({'shared': shared}, {'shared': shared}), ({}, {}, {}))
+        self.assertEqual(_diff(shared, shared), ({}, {}, {}))
+
+    def test_diff_frozen_configs(self):
+        from stormpath_config.frozen import freeze
+
+        original = freeze({'web': {'social': {'google': {'enabled': False}}, 'basePath': '/'}})
+        changed = original.merge({'web': {'social': {'google': {'enabled': True}}}})
+
+        self.assertEqual(_diff(original, changed), ({}, {}, {'web.social.google.enabled': (False, True)}))
@@ -0,0 +1,15 @@
+from unittest import TestCase
+
+from stormpath_config.helpers import _get_path
+
+
+class GetPathTest(TestCase):
+    def test_get_path(self):
+        config = {'client': {'apiKey': {'id': 'id', 'file': None}}, 'key': ['value']}
+
+        self.assertEqual(_get_path(config, 'client.apiKey.id'), 'id')
+        self.assertEqual(_get_path(config, 'client.apiKey'), {'id': 'id', 'file': None})
+        self.assertIsNone(_get_path(config, 'client.apiKey.file', 'default'))
+        self.assertEqual(_get_path(config, 'client.apiKey.secret', 'default'), 'default')
+        self.assertEqual(_get_path(config, 'key.0', 'default'), 'default')
+        self.assertIsNone(_get_path(config, 'application.name'))
@@ -1,12 +1,14 @@
 """Tests for the DebugConfigStrategy class."""
 
 
-from logging import getLogger
+from datetime import timedelta
+from logging import DEBUG, INFO, getLogger
 from unittest import TestCase
 
 from mock import patch
 
-from stormpath_config.strategies import DebugConfigStrategy
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import DebugConfigStrategy, DebugState, ExtendConfigStrategy
 
 
 class DebugConfigStrategyTest(TestCase):
@@ -28,6 +30,8 @@ class DebugConfigStrategyTest(TestCase):
 
     def test_debug_config_strategy_with_custom_logger(self):
         logger = getLogger('my.custom.logger')
+        logger.setLevel(DEBUG)
+        self.addCleanup(logger.setLevel, 0)
 
         with patch.object(logger, 'debug') as log_mock:
             dcs = DebugConfigStrategy(logger='my.custom.logger', section='sec')
@@ -35,3 +39,73 @@ class DebugConfigStrategyTest(TestCase):
 
             log_mock.assert_called_with('sec:\n{\n    "abc": "123"\n}\n')
             self.assertEqual(config, {'abc': '123'})
+
+    def test_debug_config_strategy_with_debug_disabled(self):
+        logger = getLogger('my.custom.logger')
+        logger.setLevel(INFO)
+        self.addCleanup(logger.setLevel, 0)
+
+        with patch.object(logger, 'debug') as log_mock, \
+                patch('stormpath_config.strategies.debug_config.dumps') as dumps_mock:
+            config = DebugConfigStrategy(logger='my.custom.logger').process({'abc': '123'})
+
+            self.assertEqual(config, {'abc': '123'})
+            self.assertFalse(dumps_mock.called)
+            self.assertFalse(log_mock.called)
+
+    def test_debug_config_strategy_with_unserializable_values(self):
+        with patch('stormpath_config.strategies.debug_config.log') as log_mock:
+            DebugConfigStrategy().process({'ttl': timedelta(seconds=300)})
+
+            log_mock.debug.assert_called_with('{\n    "ttl": "0:05:00"\n}\n')
+
+    def test_debug_config_strategy_diff(self):
+        logger = getLogger('my.diff.logger')
+        logger.setLevel(DEBUG)
+        self.addCleanup(logger.setLevel, 0)
+
+        state = DebugState()
+        with patch.object(logger, 'debug') as log_mock:
+            DebugConfigStrategy(logger='my.diff.logger', section='first', diff=True, state=state).process(
+                {'abc': '123', 'client': {'apiKey': {'id': 'id', 'secret': 'secret'}}})
+            log_mock.assert_called_with(
+                'first:\n{\n    "abc": "123",\n    "client": {\n        "apiKey": {\n'
+                '            "id": "id",\n            "secret": "secret"\n        }\n    }\n}\n')
+
+            DebugConfigStrategy(logger='my.diff.logger', section='second', diff=True, state=state).process(
+                {'client': {'apiKey': {'id': 'other', 'secret': 'secret'}}, 'new': [1]})
+            log_mock.assert_called_with(
+                'second:\n- abc\n~ client.apiKey.id: "id" -> "other"\n+ new: [1]\n')
+
+            DebugConfigStrategy(logger='my.diff.logger', section='third', diff=True, state=state).process(
+                {'client': {'apiKey': {'id': 'other', 'secret': 'secret'}}, 'new': [1]})
+            log_mock.assert_called_with('third:\nno changes\n')
+
+    def test_debug_config_strategy_diff_per_load(self):
+        logger = getLogger('my.diff.logger')
+        logger.setLevel(DEBUG)
+        self.addCleanup(logger.setLevel, 0)
+
+        def loader(tenant):
+            state = DebugState()
+            return ConfigLoader([
+                ExtendConfigStrategy({'tenant': tenant}),
+                DebugConfigStrategy(logger='my.diff.logger', section='loaded', diff=True, state=state),
+                ExtendConfigStrategy({'extra': True}),
+                DebugConfigStrategy(logger='my.diff.logger', section='extended', diff=True, state=state),
+            ])
+
+        first, second = loader('first'), loader('second')
+        with patch.object(logger, 'debug') as log_mock:
+            first.load()
+            second.load()
+            first.load()
+
+        self.assertEqual([c[0][0] for c in log_mock.call_args_list], [
+            'loaded:\n{\n    "tenant": "first"\n}\n',
+            'extended:\n+ extra: true\n',
+            'loaded:\n{\n    "tenant": "second"\n}\n',
+            'extended:\n+ extra: true\n',
+            'loaded:\n{\n    "tenant": "first"\n}\n',
+            'extended:\n+ extra: true\n',
+        ])
@@ -1,8 +1,40 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
+from stormpath_config.applications import ApplicationIndex
 from stormpath_config.strategies import EnrichClientFromRemoteConfigStrategy
 
-from ..base import Application, Client
+from ..base import Application, Applications, Client
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+
+class CountingApplications(Applications):
+    def __init__(self, client):
+        super(CountingApplications, self).__init__(client.apps)
+        self.client = client
+
+    def query(self, name):
+        self.client.queries += 1
+        return super(CountingApplications, self).query(name)
+
+    def __iter__(self):
+        for app in self.apps:
+            self.client.listed += 1
+            yield app
+
+
+class CountingClient(Client):
+    def __init__(self, apps):
+        super(CountingClient, self).__init__(apps)
+        self.listed = 0
+        self.queries = 0
+
+    @property
+    def applications(self):
+        return CountingApplications(self)
 
 
 class EnrichClientFromRemoteConfigStrategyTest(TestCase):
@@ -110,3 +142,73 @@ class EnrichClientFromRemoteConfigStrategyTest(TestCase):
             'href': 'https://api.stormpath.com/v1/applications/a',
             'name': 'My named application',
         })
+
+    @skipIf(asyncio is None, 'asyncio is not available.')
+    def test_enrich_client_from_remote_config_async(self):
+        loop = asyncio.new_event_loop()
+        factory_calls = []
+
+        def _create_client_from_config(config):
+            factory_calls.append(config)
+            future = loop.create_future()
+            future.set_result(Client([self.stormpath_app, self.application]))
+            return future
+
+        config = {'application': {}}
+        ecfrcs = EnrichClientFromRemoteConfigStrategy(
+            client_factory=None, async_client_factory=_create_client_from_config)
+
+        try:
+            loop.run_until_complete(ecfrcs.process_async(config))
+        finally:
+            loop.close()
+
+        self.assertEqual(len(factory_calls), 1)
+        self.assertEqual(config['application'], {
+            'href': 'https://api.stormpath.com/v1/applications/a',
+            'name': 'My named application',
+        })
+
+    def test_enrich_client_from_remote_config_with_application_index(self):
+        clients = []
+
+        def _create_client_from_config(config):
+            clients.append(CountingClient([self.stormpath_app, self.application]))
+            return clients[-1]
+
+        index = ApplicationIndex()
+        ecfrcs = EnrichClientFromRemoteConfigStrategy(
+            client_factory=_create_client_from_config, application_index=index)
+
+        for _ in range(2):
+            config = ecfrcs.process({'application': {}})
+            self.assertEqual(config['application'], {
+                'href': 'https://api.stormpath.com/v1/applications/a',
+                'name': 'My named application',
+            })
+
+        config = ecfrcs.process({'application': {'name': 'Stormpath'}})
+        self.assertEqual(config['application']['href'], 'https://api.stormpath.com/v1/applications/stormpath')
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(clients[0].listed, 2)
+
+        # Unknown names are queried even though every application was listed,
+        # as they may have been created since.
+        with self.assertRaises(Exception):
+            ecfrcs.process({'application': {'name': 'invalid'}})
+        self.assertEqual(len(clients), 2)
+
+    def test_enrich_client_from_remote_config_index_stops_on_ambiguity(self):
+        another = Application('Another application', 'https://api.stormpath.com/v1/applications/b')
+        client = CountingClient([self.application, another, self.stormpath_app])
+        index = ApplicationIndex()
+        ecfrcs = EnrichClientFromRemoteConfigStrategy(
+            client_factory=lambda config: client, application_index=index)
+
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                ecfrcs.process({'application': {}})
+
+        self.assertEqual(client.listed, 2)
+        self.assertEqual(index.default({'application': {}}), ())
+        self.assertFalse(index.is_complete({'application': {}}))
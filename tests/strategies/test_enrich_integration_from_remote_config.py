@@ -1,9 +1,15 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
+from stormpath_config.cache import TTLCache
 from stormpath_config.strategies import EnrichIntegrationFromRemoteConfigStrategy
 
 from ..base import Application, Client
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class EnrichIntegrationFromRemoteConfigStrategyTest(TestCase):
     def setUp(self):
@@ -66,3 +72,77 @@ class EnrichIntegrationFromRemoteConfigStrategyTest(TestCase):
             'forgotPassword': {'enabled': True},
             'verifyEmail': {'enabled': False},
         })
+
+    def test_enrich_integration_from_remote_config_with_cache(self):
+        clients = []
+
+        def _create_client_from_config(config):
+            clients.append(Client([self.application]))
+            return clients[-1]
+
+        def _config():
+            return {
+                'application': {'href': 'https://api.stormpath.com/v1/applications/a'},
+                'client': {'apiKey': {'id': 'id', 'secret': 'secret'}},
+            }
+
+        ecfrcs = EnrichIntegrationFromRemoteConfigStrategy(
+            client_factory=_create_client_from_config, cache=TTLCache(ttl=60))
+        first = ecfrcs.process(_config())
+        first['web']['social']['google']['clientId'] = 'mutated'
+        second = ecfrcs.process(_config())
+
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(second['web']['social']['google']['clientId'], 'id')
+        self.assertEqual(second['application']['oAuthPolicy']['accessTokenTtl'], 3600.0)
+        self.assertEqual(second['passwordPolicy']['minLength'], 8)
+
+        ecfrcs.invalidate(_config())
+        ecfrcs.process(_config())
+        self.assertEqual(len(clients), 2)
+
+        other_key = _config()
+        other_key['client']['apiKey']['id'] = 'other id'
+        ecfrcs.process(other_key)
+        self.assertEqual(len(clients), 3)
+
+    def test_enrich_integration_from_remote_config_skip_remote_config(self):
+        def _create_client_from_config(config):
+            raise AssertionError('The client should not be created.')
+
+        config = {'skipRemoteConfig': True, 'application': {'href': 'https://api.stormpath.com/v1/applications/a'}}
+        ecfrcs = EnrichIntegrationFromRemoteConfigStrategy(client_factory=_create_client_from_config)
+
+        self.assertEqual(ecfrcs.process(config), config)
+
+    def test_enrich_integration_from_remote_config_concurrently(self):
+        def _create_client_from_config(config):
+            return Client([self.application])
+
+        def _config():
+            return {'application': {'href': 'https://api.stormpath.com/v1/applications/a'}}
+
+        sequential = EnrichIntegrationFromRemoteConfigStrategy(client_factory=_create_client_from_config)
+        concurrent = EnrichIntegrationFromRemoteConfigStrategy(
+            client_factory=_create_client_from_config, max_workers=3)
+
+        self.assertEqual(concurrent.process(_config()), sequential.process(_config()))
+
+    @skipIf(asyncio is None, 'asyncio is not available.')
+    def test_enrich_integration_from_remote_config_async(self):
+        loop = asyncio.new_event_loop()
+
+        def _create_client_from_config(config):
+            return Client([self.application])
+
+        def _config():
+            return {'application': {'href': 'https://api.stormpath.com/v1/applications/a'}}
+
+        ecfrcs = EnrichIntegrationFromRemoteConfigStrategy(client_factory=_create_client_from_config)
+
+        try:
+            config = loop.run_until_complete(ecfrcs.process_async(_config()))
+        finally:
+            loop.close()
+
+        self.assertEqual(config, ecfrcs.process(_config()))
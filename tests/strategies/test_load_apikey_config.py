@@ -1,7 +1,6 @@
 from unittest import TestCase
 
 from mock import patch
-from path import Path
 
 from stormpath_config.strategies import LoadAPIKeyConfigStrategy, LoadFileConfigStrategy
 
@@ -29,7 +28,7 @@ class LoadAPIKeyConfigStrategyTest(TestCase):
     def test_load_empty_api_key_config_must_exist_no_home_env(self):
         path = '~/tests/assets/empty_apiKey.properties'
 
-        with patch.object(Path, 'abspath', return_value=path):
+        with patch('stormpath_config.strategies.load_file_path.abspath', return_value=path):
             lapcs = LoadAPIKeyConfigStrategy(path, must_exist=True)
             try:
                 lapcs.process()
@@ -32,3 +32,58 @@ class LoadEnvConfigStrategyTest(TestCase):
         self.assertEqual(config['client']['cacheManager']['defaultTti'], 301)
         self.assertEqual(config['key'], ['value1', 'value2', 'value3'])
         self.assertEqual(config['application']['name'], 'env application name')
+
+    @patch.dict(environ, {'OTHER_CLIENT_APIKEY_ID': 'other api key id'}, clear=True)
+    def test_no_variables_returns_config_as_is(self):
+        config = {'client': {'apiKey': {'id': 'api key id'}}}
+
+        self.assertIs(LoadEnvConfigStrategy('STORMPATH').process(config), config)
+
+    @patch.dict(environ, {'STORMPATH_CLIENT_APIKEY_ID': 'env api key id'})
+    def test_only_written_paths_are_copied(self):
+        config = {
+            'client': {'apiKey': {'id': 'api key id'}, 'cacheManager': {'defaultTtl': 300}},
+            'application': {'name': 'App Name'},
+        }
+
+        processed = LoadEnvConfigStrategy('STORMPATH').process(config)
+
+        self.assertEqual(processed['client']['apiKey']['id'], 'env api key id')
+        self.assertEqual(config['client']['apiKey']['id'], 'api key id')
+        self.assertIs(processed['client']['cacheManager'], config['client']['cacheManager'])
+        self.assertIs(processed['application'], config['application'])
+
+    @patch.dict(environ, {'STORMPATH_APPLICATION_NAME': 'env application name'})
+    def test_key_paths_follow_config_shape(self):
+        lecs = LoadEnvConfigStrategy('STORMPATH')
+
+        config = lecs.process({'application': {'name': 'App Name'}})
+        self.assertEqual(config, {'application': {'name': 'env application name'}})
+
+        config = lecs.process({'application': 'App'})
+        self.assertEqual(config, {'application': 'App'})
+
+        config = lecs.process({'application_name': 'App Name'})
+        self.assertEqual(config, {'application_name': 'env application name'})
+
+    @patch.dict(environ, {
+        'STORMPATH_UNRELATED': 'y',
+        'STORMPATH_APPLICATION_NAME': 'env application name',
+        'STORMPATH_ALIAS': 'env api key secret',
+        'STORMPATH_CLIENT_APIKEY_SECRET': 'aliased away',
+    })
+    def test_unmatched_variables_dont_rebuild_paths(self):
+        lecs = LoadEnvConfigStrategy('STORMPATH', {'STORMPATH_CLIENT_APIKEY_SECRET': 'STORMPATH_ALIAS'})
+
+        with patch.object(lecs, '_build_paths', wraps=lecs._build_paths) as build_paths:
+            for _ in range(5):
+                config = lecs.process({
+                    'application': {'name': 'App Name'},
+                    'client': {'apiKey': {'secret': 'api key secret'}},
+                })
+
+        self.assertEqual(config, {
+            'application': {'name': 'env application name'},
+            'client': {'apiKey': {'secret': 'env api key secret'}},
+        })
+        self.assertFalse(build_paths.called)
@@ -1,5 +1,8 @@
+from shutil import rmtree
+from tempfile import mkdtemp
 from unittest import TestCase
 
+from stormpath_config.cache import ParsedFileCache
 from stormpath_config.strategies import LoadFileConfigStrategy
 
 
@@ -38,3 +41,17 @@ class LoadFileConfigStrategyTest(TestCase):
         self.assertEqual(config['client']['connectionTimeout'], None)
         self.assertEqual(config['application']['name'], 'MY_JSON_APP')
         self.assertEqual(config['key'], 'value')
+
+    def test_load_file_config_from_cache(self):
+        tmp_dir = mkdtemp()
+        try:
+            cache = ParsedFileCache(tmp_dir)
+            LoadFileConfigStrategy('tests/assets/stormpath.yml', cache=cache).process()
+            config = LoadFileConfigStrategy('tests/assets/stormpath.yml', cache=cache).process()
+        finally:
+            rmtree(tmp_dir)
+
+        self.assertEqual(config['client']['cacheManager']['defaultTtl'], 301)
+        self.assertEqual(config['application']['name'], 'MY_APP')
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
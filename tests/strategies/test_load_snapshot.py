@@ -0,0 +1,46 @@
+from os import environ
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.snapshot import write_snapshot
+from stormpath_config.strategies import LoadEnvConfigStrategy, LoadSnapshotStrategy
+
+
+class LoadSnapshotStrategyTest(TestCase):
+    def setUp(self):
+        self.dir = mkdtemp()
+        self.addCleanup(rmtree, self.dir)
+        self.path = join(self.dir, 'config.snapshot')
+        self.config = {'client': {'apiKey': {'id': 'id', 'secret': 'secret'}}, 'application': {'name': 'My app'}}
+        write_snapshot(self.config, self.path)
+
+    def test_load_snapshot(self):
+        config = LoadSnapshotStrategy(self.path).process({'key': 'value', 'application': {'href': None}})
+
+        self.assertEqual(config['client'], self.config['client'])
+        self.assertEqual(config['application'], {'name': 'My app', 'href': None})
+        self.assertEqual(config['key'], 'value')
+
+    def test_load_missing_snapshot(self):
+        self.assertEqual(LoadSnapshotStrategy(join(self.dir, 'missing')).process({'a': 1}), {'a': 1})
+
+        with self.assertRaises(Exception):
+            LoadSnapshotStrategy(join(self.dir, 'missing'), must_exist=True).process()
+
+    def test_load_invalid_snapshot(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot')
+
+        with self.assertRaises(Exception):
+            LoadSnapshotStrategy(self.path).process()
+
+    @patch.dict(environ, {'STORMPATH_APPLICATION_NAME': 'env application name'})
+    def test_env_overrides(self):
+        loader = ConfigLoader([LoadSnapshotStrategy(self.path, must_exist=True), LoadEnvConfigStrategy('STORMPATH')])
+
+        self.assertEqual(loader.load()['application']['name'], 'env application name')
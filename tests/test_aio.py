@@ -0,0 +1,123 @@
+"""Tests for asynchronous configuration loading."""
+
+
+from os import environ
+from unittest import TestCase, skipIf
+
+from mock import patch
+
+from stormpath_config.instrumentation import LoadProfiler
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import EnrichIntegrationFromRemoteConfigStrategy, \
+    ExtendConfigStrategy, \
+    LoadAPIKeyFromConfigStrategy, \
+    LoadEnvConfigStrategy, \
+    LoadFileConfigStrategy, \
+    ValidateClientConfigStrategy
+
+from .fake_api import FakeAPI
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+
+class AsyncStrategy(object):
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+    def process(self, config):
+        raise AssertionError('process_async() should be used instead.')
+
+    def process_async(self, config, executor=None):
+        config[self.key] = self.value
+        future = asyncio.Future()
+        future.set_result(config)
+        return future
+
+
+@skipIf(asyncio is None, 'asyncio is not available.')
+class LoadAsyncTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def loader(self, **kwargs):
+        return ConfigLoader([
+            LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True),
+            LoadFileConfigStrategy('tests/assets/apiKeyFile.yml'),
+            LoadEnvConfigStrategy(prefix='STORMPATH'),
+            ExtendConfigStrategy(extend_with={'application': {'name': 'CLIENT_CONFIG_APP'}}),
+        ], [LoadAPIKeyFromConfigStrategy()], [ValidateClientConfigStrategy()], **kwargs)
+
+    @patch.dict(environ, {'STORMPATH_CLIENT_BASEURL': 'https://env.example.com'})
+    def test_load_async_matches_load(self):
+        config = self.run_async(self.loader().load_async())
+
+        self.assertEqual(config, self.loader().load())
+        self.assertEqual(config['client']['baseUrl'], 'https://env.example.com')
+        self.assertEqual(config['client']['apiKey']['id'], 'API_KEY_PROPERTIES_ID')
+
+    def test_load_async_with_dirty_tracking(self):
+        cl = self.loader(dirty_tracking=True)
+        config = self.run_async(cl.load_async())
+
+        self.assertEqual(config, self.loader().load())
+        self.assertEqual(cl.stats, {'post_processing_runs': 2, 'post_processing_skipped': 2})
+
+    def test_load_async_awaits_async_strategies(self):
+        cl = ConfigLoader([AsyncStrategy('a', 1)], [AsyncStrategy('b', 2)], [AsyncStrategy('c', 3)])
+
+        self.assertEqual(self.run_async(cl.load_async()), {'a': 1, 'b': 2, 'c': 3})
+
+    def test_load_async_with_instrumentation(self):
+        profiler = LoadProfiler()
+        cl = ConfigLoader([AsyncStrategy('a', 1)], [AsyncStrategy('b', 2)], [AsyncStrategy('c', 3)],
+                          instrumentation=profiler)
+        self.run_async(cl.load_async())
+
+        self.assertEqual([(t.name, t.stage, t.keys_changed) for t in profiler.report.timings], [
+            ('AsyncStrategy', 'load', 1),
+            ('AsyncStrategy', 'post_processing', 1),
+            ('AsyncStrategy', 'validation', 1),
+        ])
+
+    def test_load_async_failure_finishes_instrumentation(self):
+        class FailingStrategy(object):
+            def process(self, config):
+                raise ValueError('failed')
+
+        profiler = LoadProfiler()
+        cl = ConfigLoader([AsyncStrategy('a', 1)], validation_strategies=[FailingStrategy()],
+                          instrumentation=profiler)
+
+        self.assertRaises(ValueError, self.run_async, cl.load_async())
+        self.assertEqual([t.failed for t in profiler.report.timings], [False, True])
+        self.assertIsNotNone(profiler.report.wall_time)
+
+    def test_load_async_passes_executor_to_remote_strategies(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                self.submitted += 1
+                return super(CountingExecutor, self).submit(*args, **kwargs)
+
+        api = FakeAPI()
+        cl = ConfigLoader([ExtendConfigStrategy({'application': {'href': api.application_href(0)}})],
+                          validation_strategies=[EnrichIntegrationFromRemoteConfigStrategy(api.client)])
+
+        with CountingExecutor(max_workers=2) as executor:
+            config = self.run_async(cl.load_async(executor))
+
+        self.assertEqual(config['application']['oAuthPolicy']['accessTokenTtl'], 3600)
+        self.assertEqual(executor.submitted, 3)
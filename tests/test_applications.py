@@ -0,0 +1,79 @@
+"""Tests for the ApplicationIndex class."""
+
+
+import os
+from shutil import rmtree
+import stat
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from stormpath_config.applications import ApplicationIndex
+
+
+def _config(api_key_id='id'):
+    return {'client': {'apiKey': {'id': api_key_id}, 'baseUrl': 'https://api.stormpath.com/v1'}}
+
+
+class ApplicationIndexTest(TestCase):
+    def setUp(self):
+        self.now = 0
+        self.tmp_dir = mkdtemp()
+        self.path = self.tmp_dir + '/applications.json'
+        self.index = ApplicationIndex(ttl=60, path=self.path, timer=lambda: self.now)
+
+    def tearDown(self):
+        rmtree(self.tmp_dir)
+
+    def test_add(self):
+        self.assertIsNone(self.index.href(_config(), 'app'))
+        self.index.add(_config(), 'app', 'https://api.stormpath.com/v1/applications/a')
+
+        self.assertEqual(self.index.href(_config(), 'app'), 'https://api.stormpath.com/v1/applications/a')
+        self.assertIsNone(self.index.href(_config('other'), 'app'))
+        self.assertFalse(self.index.is_complete(_config()))
+
+    def test_default(self):
+        self.assertIsNone(self.index.default(_config()))
+
+        self.index.set_default(_config(), ('app', 'href'), complete=True)
+        self.assertEqual(self.index.default(_config()), ('app', 'href'))
+        self.assertTrue(self.index.is_complete(_config()))
+
+        self.index.set_default(_config('other'), ())
+        self.assertEqual(self.index.default(_config('other')), ())
+        self.assertFalse(self.index.is_complete(_config('other')))
+
+    def test_entries_expire(self):
+        self.index.add(_config(), 'app', 'href')
+        self.now = 60
+
+        self.assertIsNone(self.index.href(_config(), 'app'))
+
+    def test_persistence(self):
+        self.index.add(_config(), 'app', 'href')
+        self.index.set_default(_config(), ('app', 'href'), complete=True)
+
+        index = ApplicationIndex(ttl=60, path=self.path, timer=lambda: self.now)
+        self.assertEqual(index.href(_config(), 'app'), 'href')
+        self.assertEqual(index.default(_config()), ('app', 'href'))
+
+    def test_file_mode(self):
+        self.index.add(_config(), 'app', 'href')
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o666 & ~self.umask())
+
+    def umask(self):
+        umask = os.umask(0o022)
+        os.umask(umask)
+        return umask
+
+    def test_invalidate(self):
+        self.index.add(_config(), 'app', 'href')
+        self.index.add(_config('other'), 'app', 'href')
+
+        self.index.invalidate(_config())
+        self.assertIsNone(self.index.href(_config(), 'app'))
+        self.assertEqual(self.index.href(_config('other'), 'app'), 'href')
+
+        self.index.invalidate()
+        self.assertIsNone(ApplicationIndex(path=self.path).href(_config('other'), 'app'))
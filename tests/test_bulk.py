@@ -0,0 +1,68 @@
+"""Tests for loading the configuration of many tenants."""
+
+
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config.bulk import load_many
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.overlay import OverlayConfig
+from stormpath_config.strategies import ExtendConfigStrategy, \
+    LoadFileConfigStrategy, \
+    ValidateClientConfigStrategy
+
+
+def _tenant_loader(tenant):
+    return ConfigLoader([
+        ExtendConfigStrategy(extend_with={
+            'client': {'apiKey': {'id': '%s id' % tenant, 'secret': '%s secret' % tenant}},
+            'application': {'name': tenant},
+        }),
+    ], validation_strategies=[ValidateClientConfigStrategy()])
+
+
+class LoadManyTest(TestCase):
+    def setUp(self):
+        self.base_loader = ConfigLoader([LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True)])
+
+    def test_load_many(self):
+        loaders = dict((tenant, _tenant_loader(tenant)) for tenant in ['a', 'b', 'c'])
+
+        with patch.object(LoadFileConfigStrategy, '_process_file_path',
+                          wraps=self.base_loader.load_strategies[0]._process_file_path) as process_file_path:
+            result = load_many(loaders, self.base_loader, max_workers=2)
+
+        self.assertEqual(process_file_path.call_count, 1)
+        self.assertEqual(result.errors, {})
+        self.assertEqual(sorted(result.configs), ['a', 'b', 'c'])
+        self.assertEqual(result.configs['b']['client']['apiKey']['id'], 'b id')
+        self.assertEqual(result.configs['b']['application']['name'], 'b')
+        self.assertEqual(result.configs['b']['client']['cacheManager']['defaultTtl'], 300)
+        self.assertIsNot(result.configs['a']['client'], result.configs['b']['client'])
+        self.assertGreater(result.tenants_per_second, 0)
+
+    def test_load_many_reports_errors_per_tenant(self):
+        loaders = {
+            'good': _tenant_loader('good'),
+            'bad': ConfigLoader(validation_strategies=[ValidateClientConfigStrategy()]),
+        }
+        result = load_many(loaders, self.base_loader)
+
+        self.assertEqual(list(result.configs), ['good'])
+        self.assertEqual(list(result.errors), ['bad'])
+        self.assertIsInstance(result.errors['bad'], ValueError)
+
+    def test_load_many_without_base_loader(self):
+        result = load_many({'a': _tenant_loader('a')})
+
+        self.assertNotIn('baseUrl', result.configs['a']['client'])
+
+    def test_load_many_with_overlay(self):
+        loaders = dict((tenant, _tenant_loader(tenant)) for tenant in ['a', 'b'])
+        result = load_many(loaders, self.base_loader, overlay=True)
+        expected = load_many(loaders, self.base_loader)
+
+        self.assertIsInstance(result.configs['a'], OverlayConfig)
+        self.assertEqual(result.configs['a'], expected.configs['a'])
+        self.assertIs(result.configs['a']['client']['proxy']._base, result.configs['b']['client']['proxy']._base)
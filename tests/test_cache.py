@@ -0,0 +1,192 @@
+"""Tests for the caches used while loading configuration."""
+
+
+from datetime import date
+from os import utime
+from os.path import abspath
+from shutil import copy, rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from mock import mock_open, patch
+
+from stormpath_config import cache
+from stormpath_config.cache import ParsedFileCache, TTLCache, _default_file_mode
+
+
+class ParsedFileCacheTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.cache_dir = self.tmp_dir + '/cache'
+        self.file_path = abspath(self.tmp_dir + '/stormpath.yml')
+        copy('tests/assets/stormpath.yml', self.file_path)
+        self.parsed = []
+
+    def tearDown(self):
+        rmtree(self.tmp_dir)
+
+    def _parse(self, file_path):
+        self.parsed.append(file_path)
+        return {'parsed': len(self.parsed)}
+
+    def test_miss_then_hit(self):
+        cache = ParsedFileCache(self.cache_dir)
+
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 1})
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 1})
+        self.assertEqual(len(self.parsed), 1)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'entries': 1})
+
+    def test_hit_across_instances(self):
+        ParsedFileCache(self.cache_dir).get(self.file_path, self._parse)
+
+        cache = ParsedFileCache(self.cache_dir)
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 1})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 0)
+
+    def test_changed_file_is_parsed_again(self):
+        cache = ParsedFileCache(self.cache_dir)
+        cache.get(self.file_path, self._parse)
+
+        with open(self.file_path, 'a') as f:
+            f.write('\nextra: true\n')
+
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 2})
+        self.assertEqual(cache.misses, 2)
+
+    def test_hash_contents_detects_same_size_changes(self):
+        cache = ParsedFileCache(self.cache_dir, hash_contents=True)
+        utime(self.file_path, (0, 0))
+        cache.get(self.file_path, self._parse)
+
+        with open(self.file_path, 'r') as f:
+            contents = f.read()
+        with open(self.file_path, 'w') as f:
+            f.write(contents.replace('MY_APP', 'MY_APQ'))
+        utime(self.file_path, (0, 0))
+
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 2})
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = ParsedFileCache(self.cache_dir, max_entries=2)
+
+        paths = []
+        for i in range(3):
+            path = abspath('%s/%d.yml' % (self.tmp_dir, i))
+            copy(self.file_path, path)
+            cache.get(path, self._parse)
+            utime(cache._entry_path(path), (i, i))
+            paths.append(path)
+
+        self.assertEqual(cache.stats()['entries'], 2)
+        cache.get(paths[0], self._parse)
+        self.assertEqual(cache.misses, 4)
+
+    def test_nested_values_are_preserved(self):
+        value = {'web': {'social': {'google': {'scope': ['email', 'profile']}}}, 'ttl': 3.5, 'on': True}
+        ParsedFileCache(self.cache_dir).get(self.file_path, lambda file_path: value)
+
+        cache = ParsedFileCache(self.cache_dir)
+        self.assertEqual(cache.get(self.file_path, self._parse), value)
+        self.assertEqual(cache.hits, 1)
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = ParsedFileCache(self.cache_dir)
+        cache.get(self.file_path, self._parse)
+
+        with open(cache._entry_path(self.file_path), 'r+b') as f:
+            f.seek(-1, 2)
+            last = f.read(1)
+            f.seek(-1, 2)
+            f.write(b'x' if last != b'x' else b'y')
+
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 2})
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 2})
+
+    def test_unserializable_values_arent_cached(self):
+        cache = ParsedFileCache(self.cache_dir)
+
+        self.assertEqual(cache.get(self.file_path, lambda file_path: {'day': date(2016, 1, 1)}),
+                         {'day': date(2016, 1, 1)})
+        self.assertEqual(cache.stats()['entries'], 0)
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 1})
+
+    def test_unwritable_cache_dir(self):
+        with open(self.cache_dir, 'w') as f:
+            f.write('not a directory')
+        cache = ParsedFileCache(self.cache_dir + '/entries')
+
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 1})
+        self.assertEqual(cache.get(self.file_path, self._parse), {'parsed': 2})
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 2, 'entries': 0})
+
+    def test_clear(self):
+        cache = ParsedFileCache(self.cache_dir)
+        cache.get(self.file_path, self._parse)
+        cache.clear()
+
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+class DefaultFileModeTest(TestCase):
+    def setUp(self):
+        patcher = patch.object(cache, '_file_mode', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_umask_is_read_without_changing_it(self):
+        status = 'Name:\tpython\nUmask:\t0027\nState:\tR (running)\n'
+        with patch.object(cache.os, 'umask') as umask, \
+                patch.object(cache, 'open', mock_open(read_data=status), create=True):
+            self.assertEqual(_default_file_mode(), 0o640)
+
+        self.assertFalse(umask.called)
+
+    def test_owner_only_without_proc(self):
+        with patch.object(cache, 'open', side_effect=IOError, create=True):
+            self.assertEqual(_default_file_mode(), 0o600)
+
+
+class TTLCacheTest(TestCase):
+    def setUp(self):
+        self.now = 0
+        self.cache = TTLCache(ttl=10, max_entries=2, timer=lambda: self.now)
+
+    def test_get_and_set(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.set('a', 1)
+
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.get('b', 'default'), 'default')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_entries_expire(self):
+        self.cache.set('a', 1)
+        self.now = 9.9
+        self.assertEqual(self.cache.get('a'), 1)
+
+        self.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('c'), 3)
+
+    def test_invalidate(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+
+        self.cache.invalidate('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('b'), 2)
+
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
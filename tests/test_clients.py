@@ -0,0 +1,74 @@
+"""Tests for the ClientProvider class."""
+
+
+from unittest import TestCase
+
+from stormpath_config.clients import ClientProvider
+from stormpath_config.loader import ConfigLoader
+
+
+def _config(api_key_id='id', base_url='https://api.stormpath.com/v1'):
+    return {'client': {'apiKey': {'id': api_key_id, 'secret': 'secret'}, 'baseUrl': base_url}}
+
+
+class RemoteStrategy(object):
+    def __init__(self, client_factory=None):
+        self.client_factory = client_factory
+        self.clients = []
+
+    def process(self, config):
+        self.clients.append(self.client_factory(config))
+        return config
+
+
+class ClientProviderTest(TestCase):
+    def setUp(self):
+        self.provider = ClientProvider(lambda config: object())
+
+    def test_same_credentials_share_a_client(self):
+        self.assertIs(self.provider(_config()), self.provider(_config()))
+        self.assertEqual(self.provider.created, 1)
+
+    def test_different_credentials_get_different_clients(self):
+        self.assertIsNot(self.provider(_config()), self.provider(_config(api_key_id='other')))
+        self.assertIsNot(self.provider(_config()), self.provider(_config(base_url='https://other/v1')))
+        self.assertEqual(self.provider.created, 3)
+
+    def test_clear(self):
+        client = self.provider(_config())
+        self.provider.clear()
+
+        self.assertIsNot(self.provider(_config()), client)
+
+    def test_config_loader_hands_provider_to_strategies(self):
+        def load(config):
+            config.update(_config())
+            return config
+
+        loader_strategy = RemoteStrategy()
+        loader_strategy.process = load
+        first, second = RemoteStrategy(), RemoteStrategy()
+        own_factory = RemoteStrategy(client_factory=lambda config: 'own client')
+
+        cl = ConfigLoader([loader_strategy], [first], [second, own_factory], client_provider=self.provider)
+        cl.load()
+        cl.reload()
+
+        self.assertIs(first.client_factory, self.provider)
+        self.assertIs(second.client_factory, self.provider)
+        self.assertEqual(own_factory.clients, ['own client', 'own client'])
+        self.assertEqual(self.provider.created, 1)
+        self.assertIs(first.clients[0], second.clients[1])
+
+    def test_config_loader_wraps_client_factories(self):
+        strategy = RemoteStrategy()
+        cl = ConfigLoader(validation_strategies=[strategy], client_provider=lambda config: object())
+
+        self.assertIsInstance(cl.client_provider, ClientProvider)
+        self.assertIs(strategy.client_factory, cl.client_provider)
+
+    def test_config_loader_with_tuples(self):
+        strategy = RemoteStrategy()
+        ConfigLoader((), (), (strategy,), client_provider=self.provider)
+
+        self.assertIs(strategy.client_factory, self.provider)
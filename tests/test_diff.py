@@ -0,0 +1,141 @@
+"""Tests for configuration diffs and subscriptions."""
+
+
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config.diff import ConfigDiff, Subscriptions, diff_configs
+from stormpath_config.frozen import freeze
+from stormpath_config.holder import ConfigHolder
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import ExtendConfigStrategy
+
+
+class Unequal(dict):
+    def __eq__(self, other):
+        raise AssertionError('compared')
+
+    __hash__ = None
+
+
+class DiffConfigsTest(TestCase):
+    def setUp(self):
+        self.old = {
+            'client': {'apiKey': {'id': 'id', 'secret': 'secret'}},
+            'web': {'social': {'google': {'enabled': False}}, 'basePath': '/'},
+        }
+        self.new = {
+            'client': {'apiKey': {'id': 'id', 'secret': 'other'}},
+            'web': {'social': {'google': {'enabled': False}}, 'oauth2': {'enabled': True}},
+        }
+
+    def test_diff_configs(self):
+        diff = diff_configs(self.old, self.new)
+
+        self.assertTrue(diff)
+        self.assertEqual(diff.added, {'web.oauth2': {'enabled': True}})
+        self.assertEqual(diff.removed, {'web.basePath': '/'})
+        self.assertEqual(diff.changed, {'client.apiKey.secret': ('secret', 'other')})
+        self.assertEqual(diff.paths, ['client.apiKey.secret', 'web.basePath', 'web.oauth2'])
+
+    def test_diff_configs_prefix(self):
+        self.assertEqual(diff_configs(self.old, self.new, 'client.apiKey').changed,
+                         {'client.apiKey.secret': ('secret', 'other')})
+        self.assertFalse(diff_configs(self.old, self.new, 'web.social'))
+        self.assertEqual(diff_configs(self.old, self.new, 'web.oauth2.enabled').added, {'web.oauth2.enabled': True})
+        self.assertEqual(diff_configs(self.old, self.new, 'web.basePath').removed, {'web.basePath': '/'})
+        self.assertFalse(diff_configs(self.old, self.new, 'missing'))
+
+    def test_diff_configs_without_previous_config(self):
+        self.assertEqual(diff_configs(None, self.new).added, self.new)
+        self.assertEqual(diff_configs(None, self.new, 'client').added, {'client': self.new['client']})
+
+    def test_diff_configs_skips_shared_subtrees(self):
+        shared = Unequal(google={'enabled': False})
+        self.old['web']['social'] = self.new['web']['social'] = shared
+
+        self.assertNotIn('web.social', diff_configs(self.old, self.new).paths)
+        self.assertFalse(diff_configs(self.old, self.new, 'web.social'))
+
+    def test_diff_frozen_configs(self):
+        old = freeze(self.old)
+        new = old.merge({'client': {'apiKey': {'secret': 'other'}}})
+
+        self.assertIs(new['web'], old['web'])
+        self.assertEqual(diff_configs(old, new).paths, ['client.apiKey.secret'])
+
+    def test_affects_and_under(self):
+        diff = ConfigDiff(added={'web': {'social': {}}}, changed={'client.apiKey.id': ('a', 'b')})
+
+        self.assertTrue(diff.affects('web.social'))
+        self.assertTrue(diff.affects('client'))
+        self.assertTrue(diff.affects('client.apiKey.id'))
+        self.assertFalse(diff.affects('client.apiKey.secret'))
+        self.assertFalse(diff.affects('clientId'))
+        self.assertEqual(diff.under('client').paths, ['client.apiKey.id'])
+        self.assertFalse(ConfigDiff())
+
+
+class SubscriptionsTest(TestCase):
+    def setUp(self):
+        self.subscriptions = Subscriptions()
+        self.calls = []
+
+        for prefix in ('web.social', 'client.apiKey', ''):
+            self.subscriptions.subscribe(prefix, self.callback(prefix))
+
+    def callback(self, prefix):
+        return lambda config, diff: self.calls.append((prefix, diff.paths))
+
+    def test_notify(self):
+        old = freeze({'client': {'apiKey': {'id': 'id'}}, 'web': {'social': {'google': {'enabled': False}}}})
+        new = old.merge({'web': {'social': {'google': {'enabled': True}}}})
+
+        self.assertEqual(self.subscriptions.notify(old, new), 2)
+        self.assertEqual(self.calls, [
+            ('web.social', ['web.social.google.enabled']),
+            ('', ['web.social.google.enabled']),
+        ])
+
+        self.assertEqual(self.subscriptions.notify(new, new), 0)
+        self.assertEqual(self.subscriptions.notify(new, new.merge({})), 0)
+
+    def test_notify_without_previous_config(self):
+        self.subscriptions.notify(None, {'client': {'apiKey': {'id': 'id'}}})
+
+        self.assertEqual(self.calls, [('client.apiKey', ['client.apiKey']), ('', ['client'])])
+
+    def test_unsubscribe(self):
+        callback = self.subscriptions.subscribe('client', lambda config, diff: self.calls.append('client'))
+        self.subscriptions.unsubscribe('client', callback)
+
+        self.assertEqual(len(self.subscriptions), 3)
+        self.assertRaises(ValueError, self.subscriptions.unsubscribe, 'client', callback)
+
+    @patch('stormpath_config.diff.log')
+    def test_failing_callback(self, log):
+        def fail(config, diff):
+            raise ValueError('failed')
+
+        subscriptions = Subscriptions()
+        subscriptions.subscribe('a', fail)
+        subscriptions.subscribe('a', self.callback('a'))
+
+        self.assertEqual(subscriptions.notify({'a': 1}, {'a': 2}), 2)
+        self.assertEqual(self.calls, [('a', ['a'])])
+        self.assertEqual(log.exception.call_count, 1)
+
+
+class ConfigHolderSubscriptionsTest(TestCase):
+    def test_subscribe(self):
+        strategy = ExtendConfigStrategy({'client': {'apiKey': {'id': 'id'}}, 'web': {'social': {}}})
+        holder = ConfigHolder(ConfigLoader([strategy], frozen=True))
+        calls = []
+        holder.subscribe('client.apiKey', lambda config, diff: calls.append((config, diff.changed)))
+        holder.subscribe('web.social', lambda config, diff: calls.append('web.social'))
+
+        strategy.extend_with = {'client': {'apiKey': {'id': 'other'}}, 'web': {'social': {}}}
+        config = holder.reload()
+
+        self.assertEqual(calls, [(config, {'client.apiKey.id': ('id', 'other')})])
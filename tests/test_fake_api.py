@@ -0,0 +1,150 @@
+"""Tests running the remote strategies against the fake Stormpath API."""
+
+
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config.applications import ApplicationIndex
+from stormpath_config.cache import TTLCache
+from stormpath_config.strategies import EnrichClientFromRemoteConfigStrategy, \
+    EnrichIntegrationFromRemoteConfigStrategy
+
+from .fake_api import FakeAPI, FakeAPIError
+
+
+class FakeAPITest(TestCase):
+    def test_collections_are_paginated(self):
+        api = FakeAPI(applications=5, page_size=2)
+
+        names = [app.name for app in api.client().applications]
+
+        self.assertEqual(names, ['Stormpath'] + ['Application %d' % i for i in range(5)])
+        self.assertEqual(api.requests, 3)
+
+    def test_links_are_fetched_once(self):
+        api = FakeAPI()
+        application = api.client().applications.get(api.application_href(0))
+
+        application.oauth_policy
+        application.oauth_policy
+
+        self.assertEqual(api.requested, [api.application_href(0), 'https://api.stormpath.com/v1/oAuthPolicies/0'])
+
+    def test_missing_resources(self):
+        api = FakeAPI()
+
+        with self.assertRaises(FakeAPIError) as cm:
+            api.client().applications.get('https://api.stormpath.com/v1/applications/missing')
+
+        self.assertEqual(cm.exception.status, 404)
+
+    @patch('tests.fake_api.sleep')
+    def test_latency(self, sleep_mock):
+        api = FakeAPI(latency=0.25)
+        list(api.client().applications)
+
+        sleep_mock.assert_called_once_with(0.25)
+
+
+class RemoteStrategiesTest(TestCase):
+    def test_enrich_client_resolves_by_name(self):
+        api = FakeAPI(applications=60, page_size=25)
+        strategy = EnrichClientFromRemoteConfigStrategy(api.client)
+
+        config = strategy.process({'application': {'name': 'Application 59'}})
+
+        self.assertEqual(config['application']['href'], api.application_href(59))
+        self.assertEqual(api.requests, 1)
+
+    def test_enrich_client_resolves_default_application(self):
+        api = FakeAPI(applications=1)
+        strategy = EnrichClientFromRemoteConfigStrategy(api.client)
+
+        config = strategy.process({'application': {}})
+
+        self.assertEqual(config['application'], {'name': 'Application 0', 'href': api.application_href(0)})
+
+    def test_enrich_client_with_ambiguous_default_application(self):
+        api = FakeAPI(applications=100, page_size=10)
+        strategy = EnrichClientFromRemoteConfigStrategy(api.client)
+
+        with self.assertRaises(Exception):
+            strategy.process({'application': {}})
+
+        # Listing stops at the second non-Stormpath application.
+        self.assertEqual(api.requests, 1)
+
+    def test_enrich_client_with_index_known_failures(self):
+        clients = []
+
+        def strategy(api):
+            def client_factory(config):
+                clients.append(config)
+                return api.client(config)
+
+            return EnrichClientFromRemoteConfigStrategy(client_factory, application_index=ApplicationIndex())
+
+        ambiguous = strategy(FakeAPI(applications=2))
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                ambiguous.process({'application': {}})
+        self.assertEqual(len(clients), 1)
+
+        unique = strategy(FakeAPI(applications=1))
+        unique.process({'application': {}})
+        unique.process({'application': {}})
+        self.assertEqual(len(clients), 2)
+
+    def test_enrich_client_with_index_queries_unknown_names(self):
+        api = FakeAPI(applications=1)
+        index = ApplicationIndex()
+        strategy = EnrichClientFromRemoteConfigStrategy(api.client, application_index=index)
+        strategy.process({'application': {}})
+        self.assertTrue(index.is_complete({'application': {}}))
+
+        # Renamed after the Applications were listed.
+        api.update(api.application_href(0), name='Renamed')
+        config = strategy.process({'application': {'name': 'Renamed'}})
+
+        self.assertEqual(config['application']['href'], api.application_href(0))
+        self.assertEqual(index.href({}, 'Renamed'), api.application_href(0))
+        with self.assertRaises(Exception):
+            strategy.process({'application': {'name': 'Missing'}})
+
+    @patch.object(ApplicationIndex, '_save')
+    def test_enrich_client_saves_index_once(self, save):
+        api = FakeAPI(applications=1)
+        index = ApplicationIndex()
+
+        EnrichClientFromRemoteConfigStrategy(api.client, application_index=index).process({'application': {}})
+
+        self.assertEqual(index.href({}, 'Application 0'), api.application_href(0))
+        self.assertEqual(save.call_count, 1)
+
+    def test_enrich_integration(self):
+        api = FakeAPI(account_store_mappings=5, page_size=2)
+        strategy = EnrichIntegrationFromRemoteConfigStrategy(api.client)
+
+        config = strategy.process({'application': {'href': api.application_href(0)}})
+
+        self.assertEqual(sorted(config['web']['social']), ['facebook', 'github', 'google', 'linkedin'])
+        self.assertEqual(config['application']['oAuthPolicy']['accessTokenTtl'], 3600.0)
+        self.assertEqual(config['passwordPolicy']['minLength'], 8)
+        self.assertEqual(config['web']['verifyEmail'], {'enabled': False})
+        # The application, its OAuth policy, 3 pages of mappings, 2
+        # requests per mapping and 5 for the default directory's policies.
+        self.assertEqual(api.requests, 1 + 1 + 3 + 2 * 5 + 5)
+
+    def test_enrich_integration_concurrently_and_cached(self):
+        api = FakeAPI(account_store_mappings=3)
+        strategy = EnrichIntegrationFromRemoteConfigStrategy(api.client, cache=TTLCache(), max_workers=3)
+        expected = EnrichIntegrationFromRemoteConfigStrategy(FakeAPI(account_store_mappings=3).client).process(
+            {'application': {'href': api.application_href(0)}})
+
+        config = strategy.process({'application': {'href': api.application_href(0)}})
+        requests = api.requests
+        strategy.process({'application': {'href': api.application_href(0)}})
+
+        self.assertEqual(config, expected)
+        self.assertEqual(api.requests, requests)
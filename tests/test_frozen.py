@@ -0,0 +1,80 @@
+"""Tests for frozen configurations."""
+
+
+from unittest import TestCase
+
+from stormpath_config.frozen import FrozenConfig, freeze, thaw
+
+
+CONFIG = {
+    'client': {
+        'apiKey': {'id': 'id', 'secret': 'secret'},
+        'cacheManager': {'defaultTtl': 300, 'caches': {'account': {'ttl': 300}}},
+    },
+    'application': {'name': 'My app', 'href': None},
+    'key': ['value1', {'nested': True}],
+}
+
+
+class FreezeTest(TestCase):
+    def test_freeze(self):
+        frozen = freeze(CONFIG)
+
+        self.assertIsInstance(frozen, FrozenConfig)
+        self.assertIsInstance(frozen['client']['apiKey'], FrozenConfig)
+        self.assertEqual(frozen['key'], ('value1', FrozenConfig({'nested': True})))
+        self.assertEqual(frozen['client']['cacheManager']['caches']['account']['ttl'], 300)
+        self.assertEqual(thaw(frozen), CONFIG)
+
+    def test_frozen_config_is_immutable(self):
+        frozen = freeze(CONFIG)
+
+        with self.assertRaises(TypeError):
+            frozen['client'] = {}
+        with self.assertRaises(AttributeError):
+            frozen.update({})
+        self.assertEqual(hash(frozen), hash(freeze(CONFIG)))
+
+    def test_freeze_reuses_unchanged_subtrees(self):
+        previous = freeze(CONFIG)
+        config = thaw(previous)
+        config['client']['apiKey']['id'] = 'other id'
+        frozen = freeze(config, previous)
+
+        self.assertIsNot(frozen, previous)
+        self.assertIsNot(frozen['client'], previous['client'])
+        self.assertIsNot(frozen['client']['apiKey'], previous['client']['apiKey'])
+        self.assertIs(frozen['client']['cacheManager'], previous['client']['cacheManager'])
+        self.assertIs(frozen['application'], previous['application'])
+        self.assertIs(frozen['key'], previous['key'])
+        self.assertIs(freeze(thaw(previous), previous), previous)
+
+    def test_freeze_detects_removed_keys(self):
+        previous = freeze(CONFIG)
+        config = thaw(previous)
+        del config['application']['href']
+        config['application']['other'] = None
+
+        self.assertEqual(freeze(config, previous)['application'], {'name': 'My app', 'other': None})
+
+
+class MergeTest(TestCase):
+    def test_merge_copies_only_changed_paths(self):
+        frozen = freeze(CONFIG)
+        merged = frozen.merge({'client': {'apiKey': {'id': 'other id'}}, 'web': {'enabled': True}})
+
+        self.assertEqual(merged['client']['apiKey'], {'id': 'other id', 'secret': 'secret'})
+        self.assertEqual(merged['web'], {'enabled': True})
+        self.assertEqual(frozen['client']['apiKey']['id'], 'id')
+        self.assertIs(merged['client']['cacheManager'], frozen['client']['cacheManager'])
+        self.assertIs(merged['application'], frozen['application'])
+
+    def test_merge_without_changes(self):
+        frozen = freeze(CONFIG)
+
+        self.assertIs(frozen.merge({'client': {'apiKey': {'id': 'id'}}}), frozen)
+
+    def test_merge_replaces_leaves_with_dicts(self):
+        merged = freeze(CONFIG).merge({'application': {'href': {'a': [1]}}})
+
+        self.assertEqual(merged['application']['href'], FrozenConfig({'a': (1,)}))
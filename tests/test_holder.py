@@ -0,0 +1,66 @@
+"""Tests for the configuration holder."""
+
+
+from threading import Thread
+from unittest import TestCase
+
+from stormpath_config.holder import ConfigHolder
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import ExtendConfigStrategy
+
+
+class ConfigHolderTest(TestCase):
+    def setUp(self):
+        self.strategy = ExtendConfigStrategy({'application': {'name': 'First'}, 'client': {'apiKey': {'id': 'id'}}})
+        self.loader = ConfigLoader([self.strategy], frozen=True)
+
+    def test_initial_config(self):
+        holder = ConfigHolder(self.loader)
+
+        self.assertEqual(holder.get()['application']['name'], 'First')
+        self.assertEqual(holder.version, 0)
+        self.assertEqual(ConfigHolder(self.loader, {'a': 1}).get(), {'a': 1})
+
+    def test_reload(self):
+        holder = ConfigHolder(self.loader)
+        old = holder.get()
+
+        self.strategy.extend_with = {'application': {'name': 'Second'}}
+        new = holder.reload()
+
+        self.assertIs(holder.get(), new)
+        self.assertEqual(holder.version, 1)
+        self.assertEqual(new['application']['name'], 'Second')
+        self.assertEqual(old['application']['name'], 'First')
+
+    def test_publish(self):
+        holder = ConfigHolder(self.loader)
+        holder.publish({'application': {'name': 'Published'}})
+
+        self.assertEqual(holder.get(), {'application': {'name': 'Published'}})
+        self.assertEqual(holder.version, 1)
+
+    def test_concurrent_readers(self):
+        loader = ConfigLoader([ExtendConfigStrategy({'a': {'value': 0}, 'b': {'value': 0}})])
+        holder = ConfigHolder(loader)
+        errors = []
+
+        def read():
+            for _ in range(20000):
+                config = holder.get()
+                if config['a']['value'] != config['b']['value']:
+                    errors.append(config)
+
+        readers = [Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+
+        for i in range(1, 200):
+            loader.load_strategies[0].extend_with = {'a': {'value': i}, 'b': {'value': i}}
+            holder.reload()
+
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(holder.version, 199)
@@ -0,0 +1,70 @@
+"""Import time regression tests."""
+
+
+from subprocess import PIPE, Popen
+import sys
+from unittest import TestCase, skipIf
+
+
+HEAVY_MODULES = ('yaml', 'path', 'concurrent.futures', 'flatdict')
+
+
+def imported_modules(code):
+    """Run code in a new interpreter, and return the modules it imported."""
+    process = Popen([sys.executable, '-X', 'importtime', '-c', code], stdout=PIPE, stderr=PIPE)
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise AssertionError(stderr.decode('utf-8', 'replace'))
+
+    modules = set()
+    for line in stderr.decode('utf-8').splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            modules.add(line.rsplit('|', 1)[1].strip())
+
+    return modules
+
+
+@skipIf(sys.version_info < (3, 7), 'Strategies are only imported lazily on Python 3.7+.')
+class ImportTimeTest(TestCase):
+    def assertNotImported(self, modules, names):
+        self.assertEqual([name for name in names if name in modules], [])
+
+    def test_import_strategies(self):
+        modules = imported_modules('import stormpath_config.strategies')
+
+        self.assertIn('stormpath_config.strategies', modules)
+        self.assertNotImported(modules, HEAVY_MODULES)
+        self.assertNotIn('stormpath_config.strategies.load_file_config', modules)
+
+    def test_light_strategies(self):
+        modules = imported_modules(
+            'from stormpath_config.loader import ConfigLoader\n'
+            'from stormpath_config.strategies import ExtendConfigStrategy, ValidateClientConfigStrategy\n'
+            'ConfigLoader([ExtendConfigStrategy({"client": {"apiKey": {"id": "id", "secret": "secret"}}, '
+            '"application": {"name": "app"}})], validation_strategies=[ValidateClientConfigStrategy()]).load()\n')
+
+        self.assertIn('stormpath_config.strategies.extend_config', modules)
+        self.assertNotImported(modules, HEAVY_MODULES)
+
+    def test_yaml_is_imported_by_the_first_yaml_file(self):
+        modules = imported_modules(
+            'from stormpath_config.strategies import LoadFileConfigStrategy\n'
+            'strategy = LoadFileConfigStrategy("tests/assets/default_config.yml")\n'
+            'import sys; assert "yaml" not in sys.modules\n'
+            'strategy.process({})\n')
+
+        self.assertIn('yaml', modules)
+
+    def test_unknown_strategy(self):
+        import stormpath_config.strategies as strategies
+
+        with self.assertRaises(AttributeError):
+            strategies.MissingStrategy
+        self.assertIn('LoadEnvConfigStrategy', dir(strategies))
+
+    def test_every_strategy_is_exported(self):
+        import stormpath_config.strategies as strategies
+
+        self.assertEqual(sorted(strategies.__all__), sorted(strategies._STRATEGY_MODULES))
+        for name in strategies.__all__:
+            getattr(strategies, name)
@@ -0,0 +1,115 @@
+"""Tests for the loader instrumentation."""
+
+
+from unittest import TestCase, skipIf
+
+from stormpath_config.instrumentation import LoadProfiler, StrategyTiming, tracemalloc
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import ExtendConfigStrategy, \
+    LoadAPIKeyFromConfigStrategy, \
+    LoadFileConfigStrategy, \
+    ValidateClientConfigStrategy
+
+
+class AllocatingStrategy(object):
+    def process(self, config):
+        config['blob'] = 'x' * 100000
+        return config
+
+
+class FailingStrategy(object):
+    def process(self, config):
+        raise ValueError('failed')
+
+
+class LoadProfilerTest(TestCase):
+    def loader(self, instrumentation):
+        return ConfigLoader([
+            LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True),
+            ExtendConfigStrategy(extend_with={
+                'application': {'name': 'My app'},
+                'client': {'apiKey': {'id': 'id', 'secret': 'secret'}},
+            }),
+        ], [LoadAPIKeyFromConfigStrategy()], [ValidateClientConfigStrategy()], instrumentation=instrumentation)
+
+    def test_report(self):
+        timings = []
+        profiler = LoadProfiler(callback=timings.append)
+        config = self.loader(profiler).load()
+        report = profiler.report
+
+        self.assertEqual(config, self.loader(None).load())
+        self.assertEqual(timings, report.timings)
+        self.assertEqual([(t.name, t.stage) for t in report.timings], [
+            ('LoadFileConfigStrategy', 'load'),
+            ('LoadAPIKeyFromConfigStrategy', 'post_processing'),
+            ('ExtendConfigStrategy', 'load'),
+            ('LoadAPIKeyFromConfigStrategy', 'post_processing'),
+            ('ValidateClientConfigStrategy', 'validation'),
+        ])
+        self.assertEqual([t.keys_changed for t in report.timings], [2, 0, 3, 0, 0])
+        self.assertTrue(all(t.wall_time >= 0 and t.cpu_time >= 0 for t in report.timings))
+        self.assertTrue(all(t.allocated is None for t in report.timings))
+        self.assertGreaterEqual(report.wall_time, sum(t.wall_time for t in report.timings))
+        self.assertEqual(len(report.slowest(2)), 2)
+        self.assertEqual(report.as_dicts()[0]['strategy'], 'LoadFileConfigStrategy')
+
+    def test_without_counting_changes(self):
+        profiler = LoadProfiler(count_changes=False)
+        self.loader(profiler).load()
+
+        self.assertTrue(all(t.keys_changed is None for t in profiler.report.timings))
+
+    @skipIf(tracemalloc is None, 'tracemalloc is not available.')
+    def test_trace_allocations(self):
+        profiler = LoadProfiler(trace_allocations=True)
+        ConfigLoader([AllocatingStrategy()], instrumentation=profiler).load()
+
+        timing, = profiler.report.timings
+        self.assertGreaterEqual(timing.allocated, 100000)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    @skipIf(tracemalloc is None, 'tracemalloc is not available.')
+    def test_failed_load(self):
+        profiler = LoadProfiler(trace_allocations=True)
+        loader = ConfigLoader([AllocatingStrategy(), FailingStrategy()], instrumentation=profiler)
+
+        for load in (loader.load, loader.reload):
+            self.assertRaises(ValueError, load)
+
+            self.assertFalse(tracemalloc.is_tracing())
+            self.assertEqual([(t.name, t.failed) for t in profiler.report.timings], [
+                ('AllocatingStrategy', False),
+                ('FailingStrategy', True),
+            ])
+            self.assertIsNone(profiler.report.timings[1].keys_changed)
+            self.assertIsNotNone(profiler.report.wall_time)
+
+    def test_custom_hooks(self):
+        calls = []
+
+        class Hooks(object):
+            def start_load(self):
+                calls.append('start')
+
+            def before(self, strategy, stage, config):
+                calls.append(('before', stage))
+                return stage
+
+            def after(self, strategy, stage, config, state):
+                calls.append(('after', state))
+
+            def finish_load(self):
+                calls.append('finish')
+
+        ConfigLoader([ExtendConfigStrategy({'a': 1})], instrumentation=Hooks()).reload()
+
+        self.assertEqual(calls, ['start', ('before', 'load'), ('after', 'load'), 'finish'])
+
+    def test_timing_as_dict(self):
+        timing = StrategyTiming(AllocatingStrategy(), 'load', 0.5, 0.25, keys_changed=1)
+
+        self.assertEqual(timing.as_dict(), {
+            'strategy': 'AllocatingStrategy', 'stage': 'load', 'wall_time': 0.5,
+            'cpu_time': 0.25, 'allocated': None, 'keys_changed': 1, 'failed': False,
+        })
@@ -6,6 +6,7 @@ from unittest import TestCase
 
 from mock import patch
 
+from stormpath_config.frozen import FrozenConfig, thaw
 from stormpath_config.loader import ConfigLoader
 from stormpath_config.strategies import ExtendConfigStrategy, \
     LoadAPIKeyConfigStrategy, \
@@ -70,6 +71,10 @@ class ConfigLoaderTest(TestCase):
         cl = ConfigLoader()
         self.assertEqual(len(cl.load().keys()), 0)
 
+    def test_config_loader_with_tuples(self):
+        cl = ConfigLoader((ExtendConfigStrategy(extend_with={'a': 1}),))
+        self.assertEqual(cl.load(), {'a': 1})
+
     @patch.dict(environ, {
         'STORMPATH_CLIENT_APIKEY_ID': 'env api key id',
         'STORMPATH_CLIENT_APIKEY_SECRET': 'env api key secret',
@@ -85,3 +90,198 @@ class ConfigLoaderTest(TestCase):
         self.assertEqual(config['client']['cacheManager']['defaultTtl'], 302)
         self.assertEqual(config['client']['cacheManager']['defaultTti'], 303)
         self.assertEqual(config['application']['name'], 'CLIENT_CONFIG_APP')
+
+    @patch.dict(environ, {
+        'STORMPATH_CLIENT_APIKEY_ID': 'env api key id',
+        'STORMPATH_APPLICATION_NAME': 'My app',
+    })
+    def test_config_loader_with_dirty_tracking(self):
+        config = ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                              self.validation_strategies).load()
+
+        cl = ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                          self.validation_strategies, dirty_tracking=True)
+
+        self.assertEqual(cl.load(), config)
+        self.assertEqual(cl.stats, {'post_processing_runs': 2, 'post_processing_skipped': 5})
+
+    def test_config_loader_stats_without_dirty_tracking(self):
+        cl = ConfigLoader(self.load_strategies, self.post_processing_strategies, self.validation_strategies)
+        cl.load()
+
+        self.assertEqual(cl.stats, {'post_processing_runs': 7, 'post_processing_skipped': 0})
+
+    def test_dirty_tracking_runs_strategies_without_watched_paths(self):
+        post_processing = CountingStrategy('post', 0)
+        cl = ConfigLoader(self.load_strategies, [post_processing], dirty_tracking=True)
+        cl.load()
+
+        self.assertEqual(post_processing.calls, 7)
+
+    def test_dirty_tracking_detects_in_place_changes(self):
+        def set_file(config):
+            config.setdefault('client', {}).setdefault('apiKey', {})['file'] = 'tests/assets/apiKey.properties'
+            return config
+
+        strategy = CountingStrategy('post', 0)
+        strategy.watched_paths = ('client.apiKey.file',)
+        first, second = CountingStrategy('first', 1), CountingStrategy('second', 2)
+        second.process = set_file
+
+        cl = ConfigLoader([first, second, first], [strategy], dirty_tracking=True)
+        cl.load()
+
+        self.assertEqual(strategy.calls, 1)
+        self.assertEqual(cl.stats, {'post_processing_runs': 1, 'post_processing_skipped': 2})
+
+    def test_config_loader_frozen(self):
+        cl = ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                          self.validation_strategies, frozen=True)
+        first = cl.load()
+        second = cl.reload()
+
+        self.assertIsInstance(first, FrozenConfig)
+        self.assertEqual(thaw(first), ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                                                   self.validation_strategies).load())
+        self.assertIs(second, first)
+
+        self.load_strategies[-1].extend_with = {'application': {'name': 'Other app'}}
+        third = cl.reload()
+
+        self.assertEqual(third['application']['name'], 'Other app')
+        self.assertIsNot(third['application'], first['application'])
+        self.assertIs(third['client']['cacheManager'], first['client']['cacheManager'])
+
+    def test_config_loader_index_paths(self):
+        cl = ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                          self.validation_strategies, index_paths=True)
+        config = cl.load()
+
+        self.assertEqual(config.get_path('application.name'), config['application']['name'])
+        self.assertEqual(config.get_path('client.apiKey.id'), 'CLIENT_CONFIG_API_KEY_ID')
+        self.assertEqual(dict(config.iter_prefix('client.apiKey')), {
+            'client.apiKey.id': config['client']['apiKey']['id'],
+            'client.apiKey.secret': config['client']['apiKey']['secret'],
+        })
+
+    def test_config_loader_index_paths_after_in_place_changes(self):
+        shared = {'web': {'login': {'enabled': True}}}
+        cl = ConfigLoader([ExtendConfigStrategy(extend_with=shared)], index_paths=True)
+        cl.load()
+        shared['web']['login']['enabled'] = False
+        config = cl.load()
+
+        self.assertIs(config['web']['login']['enabled'], False)
+        self.assertIs(config.get_path('web.login.enabled'), False)
+
+    def test_config_loader_index_paths_frozen(self):
+        cl = ConfigLoader(self.load_strategies, self.post_processing_strategies,
+                          self.validation_strategies, frozen=True, index_paths=True)
+        first = cl.load()
+        self.load_strategies[-1].extend_with = {'application': {'name': 'Other app'}}
+        second = cl.reload()
+
+        self.assertEqual(first.get_path('application.name'), 'CLIENT_CONFIG_APP')
+        self.assertEqual(second.get_path('application.name'), 'Other app')
+        self.assertIs(second.get_path('client.cacheManager'), first.get_path('client.cacheManager'))
+
+
+class CountingStrategy(object):
+    def __init__(self, key, value, fingerprint=True):
+        self.key = key
+        self.value = value
+        self.calls = 0
+        if fingerprint:
+            self.fingerprint = lambda: self.value
+
+    def process(self, config):
+        self.calls += 1
+        config[self.key] = self.value
+        return config
+
+
+class ConfigLoaderReloadTest(TestCase):
+    def setUp(self):
+        self.first = CountingStrategy('first', 1)
+        self.second = CountingStrategy('second', 2)
+        self.third = CountingStrategy('third', 3)
+        self.cl = ConfigLoader([self.first, self.second, self.third])
+
+    def calls(self):
+        return [self.first.calls, self.second.calls, self.third.calls]
+
+    def test_reload_without_changes_reuses_every_layer(self):
+        self.assertEqual(self.cl.reload(), {'first': 1, 'second': 2, 'third': 3})
+        self.assertEqual(self.cl.reload(), {'first': 1, 'second': 2, 'third': 3})
+        self.assertEqual(self.calls(), [1, 1, 1])
+
+    def test_reload_recomputes_from_first_changed_layer(self):
+        self.cl.reload()
+        self.second.value = 22
+
+        self.assertEqual(self.cl.reload(), {'first': 1, 'second': 22, 'third': 3})
+        self.assertEqual(self.calls(), [1, 2, 2])
+
+    def test_reload_returns_a_fresh_config(self):
+        config = self.cl.reload()
+        config['first'] = 'mutated'
+
+        self.assertEqual(self.cl.reload()['first'], 1)
+
+    def test_reload_always_runs_strategies_without_fingerprint(self):
+        self.cl.load_strategies[1] = second = CountingStrategy('second', 2, fingerprint=False)
+        self.cl.reload()
+        self.cl.reload()
+
+        self.assertEqual([self.first.calls, second.calls, self.third.calls], [1, 2, 2])
+
+    def test_reload_with_post_processing_without_fingerprint(self):
+        post_processing = CountingStrategy('post', 0, fingerprint=False)
+        self.cl.post_processing_strategies.append(post_processing)
+        self.cl.reload()
+        self.cl.reload()
+
+        self.assertEqual(self.calls(), [2, 2, 2])
+        self.assertEqual(post_processing.calls, 6)
+
+    def test_reload_with_replaced_extend_config(self):
+        extend = ExtendConfigStrategy(extend_with={'extended': 1})
+        self.cl.load_strategies.insert(1, extend)
+        self.cl.reload()
+
+        extend.extend_with = {'extended': 1}
+        self.assertEqual(self.cl.reload()['extended'], 1)
+        self.assertEqual(self.calls(), [1, 1, 1])
+
+        extend.extend_with = {'extended': 2}
+        self.assertEqual(self.cl.reload()['extended'], 2)
+        self.assertEqual(self.calls(), [1, 2, 2])
+
+    def test_reload_runs_validation_strategies(self):
+        validation = CountingStrategy('valid', True)
+        self.cl.validation_strategies.append(validation)
+        self.cl.reload()
+        self.cl.reload()
+
+        self.assertEqual(validation.calls, 2)
+
+    def test_reload_detects_environment_changes(self):
+        cl = ConfigLoader(self.load_strategies(), [LoadAPIKeyFromConfigStrategy()], [])
+        with patch.dict(environ, {'STORMPATH_CLIENT_BASEURL': 'https://one.example.com'}):
+            self.assertEqual(cl.reload()['client']['baseUrl'], 'https://one.example.com')
+
+        with patch.object(LoadFileConfigStrategy, '_process_file_path') as process_file_path:
+            with patch.dict(environ, {'STORMPATH_CLIENT_BASEURL': 'https://two.example.com'}):
+                config = cl.reload()
+
+        self.assertFalse(process_file_path.called)
+        self.assertEqual(config['client']['baseUrl'], 'https://two.example.com')
+        self.assertEqual(config['application']['name'], 'CLIENT_CONFIG_APP')
+
+    def load_strategies(self):
+        return [
+            LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True),
+            LoadFileConfigStrategy('tests/assets/stormpath.yml'),
+            LoadEnvConfigStrategy(prefix='STORMPATH'),
+            ExtendConfigStrategy(extend_with={'application': {'name': 'CLIENT_CONFIG_APP'}}),
+        ]
@@ -0,0 +1,115 @@
+"""Tests for the OverlayConfig class."""
+
+
+from copy import deepcopy
+from unittest import TestCase
+
+from stormpath_config.overlay import OverlayConfig, ValuePool
+
+
+BASE = {
+    'client': {
+        'apiKey': {'id': None, 'secret': None},
+        'cacheManager': {'defaultTtl': 300, 'defaultTti': 300},
+        'baseUrl': 'https://api.stormpath.com/v1',
+    },
+    'application': {'name': None, 'href': None},
+    'web': {'login': {'enabled': True}, 'register': {'enabled': True}},
+    'key': ['value1', 'value2'],
+}
+
+
+def _tenant_config():
+    config = deepcopy(BASE)
+    config['client']['apiKey'] = {'id': 'id', 'secret': 'secret'}
+    config['client']['cacheManager']['defaultTtl'] = 301
+    config['application']['name'] = 'My app'
+    config['application']['href'] = {'replaced': 'by a dict'}
+    config['web']['register'] = False
+    del config['web']['login']
+    config['extra'] = {'a': 1}
+    config['key'] = ['value1', 'value2']
+
+    return config
+
+
+class OverlayConfigTest(TestCase):
+    def setUp(self):
+        self.config = _tenant_config()
+        self.overlay = OverlayConfig.from_config(BASE, self.config)
+
+    def test_lookups_resolve_through_overlay(self):
+        self.assertEqual(self.overlay['client']['apiKey']['id'], 'id')
+        self.assertEqual(self.overlay['client']['cacheManager']['defaultTtl'], 301)
+        self.assertEqual(self.overlay['client']['cacheManager']['defaultTti'], 300)
+        self.assertEqual(self.overlay['client']['baseUrl'], 'https://api.stormpath.com/v1')
+        self.assertEqual(self.overlay['application']['href'], {'replaced': 'by a dict'})
+        self.assertEqual(self.overlay['web']['register'], False)
+        self.assertEqual(self.overlay['extra']['a'], 1)
+        self.assertNotIn('login', self.overlay['web'])
+        self.assertIn('register', self.overlay['web'])
+        self.assertEqual(self.overlay.get('missing', 'default'), 'default')
+
+        with self.assertRaises(KeyError):
+            self.overlay['web']['login']
+
+    def test_equals_the_materialized_config(self):
+        self.assertEqual(self.overlay.to_dict(), self.config)
+        self.assertEqual(self.overlay, self.config)
+        self.assertEqual(len(self.overlay), len(self.config))
+        self.assertEqual(sorted(self.overlay), sorted(self.config))
+
+    def test_overlay_holds_only_differences(self):
+        self.assertEqual(sorted(self.overlay._overlay), ['application', 'client', 'extra', 'web'])
+        self.assertEqual(sorted(self.overlay._overlay['client']), ['apiKey', 'cacheManager'])
+        self.assertEqual(OverlayConfig.from_config(BASE, deepcopy(BASE))._overlay, {})
+
+    def test_base_is_shared(self):
+        other = OverlayConfig.from_config(BASE, deepcopy(BASE))
+
+        self.assertEqual(other['key'], ('value1', 'value2'))
+        self.assertIs(other['client']._base, self.overlay['client']._base)
+
+    def test_lists_cant_be_modified(self):
+        pool = ValuePool()
+        shared = pool.config(BASE)
+        config = _tenant_config()
+        config['web']['produces'] = ['application/json']
+        overlay = OverlayConfig.from_config(shared, config, pool)
+
+        self.assertEqual(overlay['key'], ('value1', 'value2'))
+        self.assertEqual(overlay['web']['produces'], ('application/json',))
+        self.assertNotIn('key', overlay._overlay)
+        with self.assertRaises(AttributeError):
+            overlay['key'].append('value3')
+
+        self.assertEqual(self.overlay['key'], ('value1', 'value2'))
+        self.assertEqual(BASE['key'], ['value1', 'value2'])
+        self.assertEqual(overlay.to_dict()['web']['produces'], ['application/json'])
+
+    def test_dicts_in_lists_cant_be_modified(self):
+        base = {'web': {'fields': [{'name': 'email'}, {'name': 'password'}]}}
+        config = {'web': {'fields': [{'name': 'email'}], 'other': [[{'name': 'nested'}]]}}
+
+        for shared in (base, ValuePool().config(base)):
+            first = OverlayConfig(shared)
+            second = OverlayConfig.from_config(shared, config)
+
+            with self.assertRaises(TypeError):
+                first['web']['fields'][0]['name'] = 'x'
+            with self.assertRaises(TypeError):
+                second['web']['fields'][0]['name'] = 'x'
+            with self.assertRaises(TypeError):
+                second['web']['other'][0][0]['name'] = 'x'
+
+            self.assertEqual(first['web']['fields'][1]['name'], 'password')
+            self.assertEqual(second.to_dict(), config)
+            self.assertEqual(first, base)
+
+    def test_value_pool_deduplicates_values(self):
+        pool = ValuePool()
+        first = OverlayConfig.from_config(BASE, {'name': ''.join(['My', ' app'])}, pool)
+        second = OverlayConfig.from_config(BASE, {'name': ''.join(['My ', 'app'])}, pool)
+
+        self.assertIs(first['name'], second['name'])
+        self.assertEqual(pool.config({'a': [1], 'b': 1}), {'a': (1,), 'b': 1})
@@ -0,0 +1,56 @@
+"""Tests for the configuration file parsers."""
+
+
+import sys
+from types import ModuleType
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from stormpath_config import parsers
+from stormpath_config.parsers import JSON, YAML, detect_format, parse_config
+
+
+class DetectFormatTest(TestCase):
+    def test_detect_by_extension(self):
+        self.assertEqual(detect_format('stormpath.json'), JSON)
+        self.assertEqual(detect_format('stormpath.JSON'), JSON)
+        self.assertEqual(detect_format('stormpath.yml'), YAML)
+        self.assertEqual(detect_format('stormpath.yaml', '{"a": 1}'), YAML)
+
+    def test_detect_by_sniffing(self):
+        self.assertEqual(detect_format('stormpath', '  \n{"a": 1}'), JSON)
+        self.assertEqual(detect_format(None, '[1, 2]'), JSON)
+        self.assertEqual(detect_format('stormpath.conf', 'a: 1'), YAML)
+        self.assertEqual(detect_format(), YAML)
+
+
+class ParseConfigTest(TestCase):
+    def test_parse_json(self):
+        with patch.object(parsers, 'parse_yaml') as parse_yaml:
+            self.assertEqual(parse_config('{"a": {"b": null}}', 'stormpath.json'), {'a': {'b': None}})
+            self.assertFalse(parse_yaml.called)
+
+    def test_parse_invalid_json_falls_back_to_yaml(self):
+        self.assertEqual(parse_config("{'a': 1}", 'stormpath.json'), {'a': 1})
+
+    def test_parse_yaml(self):
+        self.assertEqual(parse_config('a:\n  b: 1\n', 'stormpath.yml'), {'a': {'b': 1}})
+
+    def test_parse_yaml_is_safe(self):
+        with self.assertRaises(Exception):
+            parse_config('a: !!python/object/apply:os.getcwd []', 'stormpath.yml')
+
+    def test_parse_without_libyaml(self):
+        import yaml
+
+        # PyYAML built without the LibYAML bindings has no CSafeLoader.
+        pure_yaml = ModuleType('yaml')
+        pure_yaml.SafeLoader = yaml.SafeLoader
+        pure_yaml.load = Mock(wraps=yaml.load)
+
+        with patch.object(parsers, 'SafeLoader', None), patch.dict(sys.modules, {'yaml': pure_yaml}):
+            self.assertEqual(parse_config('a: 1', 'stormpath.yml'), {'a': 1})
+            self.assertIs(parsers.SafeLoader, yaml.SafeLoader)
+
+        pure_yaml.load.assert_called_once_with('a: 1', Loader=yaml.SafeLoader)
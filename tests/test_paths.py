@@ -0,0 +1,76 @@
+"""Tests for dotted key path lookups."""
+
+
+from unittest import TestCase
+
+from stormpath_config.frozen import freeze
+from stormpath_config.paths import IndexedConfig, PathIndex
+
+
+CONFIG = {
+    'client': {'apiKey': {'id': 'id', 'secret': 'secret'}},
+    'web': {
+        'oauth2': {'enabled': True},
+        'social': {
+            'facebook': {'scope': 'email'},
+            'google': {'scope': 'email profile'},
+        },
+        'socialite': False,
+    },
+}
+
+
+class PathIndexTest(TestCase):
+    def test_get(self):
+        index = PathIndex(CONFIG)
+
+        self.assertEqual(index.get('web.oauth2.enabled'), True)
+        self.assertEqual(index.get('client.apiKey'), {'id': 'id', 'secret': 'secret'})
+        self.assertIsNone(index.get('web.oauth2.missing'))
+        self.assertEqual(index.get('web.oauth2.missing', 'default'), 'default')
+        self.assertIn('client.apiKey.id', index)
+        self.assertEqual(len(index), 13)
+
+    def test_iter_prefix(self):
+        index = PathIndex(CONFIG)
+
+        self.assertEqual(list(index.iter_prefix('web.social')), [
+            ('web.social.facebook', {'scope': 'email'}),
+            ('web.social.facebook.scope', 'email'),
+            ('web.social.google', {'scope': 'email profile'}),
+            ('web.social.google.scope', 'email profile'),
+        ])
+        self.assertEqual(list(index.iter_prefix('web.missing')), [])
+
+    def test_unchanged_subtrees_are_reused(self):
+        first = freeze(CONFIG)
+        second = first.merge({'client': {'apiKey': {'id': 'other'}}})
+        previous = PathIndex(first)
+
+        class Recorder(PathIndex):
+            def _index(self, config, prefix, previous):
+                self.prefixes.append(prefix)
+                super(Recorder, self)._index(config, prefix, previous)
+
+        Recorder.prefixes = []
+        index = Recorder(second, previous)
+
+        self.assertEqual(Recorder.prefixes, ['', 'client.', 'client.apiKey.'])
+        self.assertEqual(index.get('client.apiKey.id'), 'other')
+        self.assertIs(index.get('web.social'), second['web']['social'])
+        self.assertEqual(list(index.iter_prefix('web')), list(previous.iter_prefix('web')))
+
+
+class IndexedConfigTest(TestCase):
+    def test_get_path(self):
+        config = IndexedConfig(CONFIG)
+
+        self.assertEqual(config, CONFIG)
+        self.assertEqual(config.get_path('web.social.google.scope'), 'email profile')
+        self.assertEqual(dict(config.iter_prefix('client'))['client.apiKey.secret'], 'secret')
+
+    def test_frozen_config_get_path(self):
+        config = freeze(CONFIG)
+
+        self.assertEqual(config.get_path('web.oauth2.enabled'), True)
+        self.assertEqual(config['web'].get_path('oauth2.enabled'), True)
@@ -0,0 +1,104 @@
+"""Tests for the background refresh of remote settings."""
+
+
+from datetime import timedelta
+from threading import Event
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config.holder import ConfigHolder
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.refresh import BackgroundRefresher
+from stormpath_config.strategies import EnrichClientFromRemoteConfigStrategy, \
+    EnrichIntegrationFromRemoteConfigStrategy, \
+    ExtendConfigStrategy
+
+from .fake_api import BASE_URL, FakeAPI
+
+
+class BackgroundRefresherTest(TestCase):
+    def setUp(self):
+        self.api = FakeAPI()
+        self.refresher = BackgroundRefresher([
+            EnrichClientFromRemoteConfigStrategy(),
+            EnrichIntegrationFromRemoteConfigStrategy(),
+        ], interval=3600)
+        self.strategy = ExtendConfigStrategy({'application': {'name': 'Application 0'}})
+        self.loader = ConfigLoader([self.strategy], validation_strategies=[self.refresher],
+                                   client_provider=self.api.client, frozen=True)
+
+    def tearDown(self):
+        self.refresher.stop()
+
+    def test_serves_last_output(self):
+        config = self.loader.reload()
+        self.assertEqual(config['application']['href'], self.api.application_href(0))
+        self.assertEqual(config['application']['oAuthPolicy']['accessTokenTtl'], 3600)
+
+        self.api.reset()
+        self.assertEqual(self.loader.reload(), config)
+        self.assertEqual(self.api.requests, 0)
+
+    def test_processes_changed_configurations(self):
+        self.loader.reload()
+        self.api.reset()
+
+        self.strategy.extend_with = {'application': {'href': self.api.application_href(0)}}
+        config = self.loader.reload()
+
+        self.assertEqual(config['application']['name'], 'Application 0')
+        self.assertNotEqual(self.api.requests, 0)
+
+    def test_refresh(self):
+        holder = ConfigHolder(self.loader)
+        calls = []
+        self.refresher.callback = lambda: calls.append(holder.reload())
+
+        self.assertFalse(self.refresher.refresh())
+        self.assertEqual(calls, [])
+
+        self.api.update('%s/oAuthPolicies/0' % BASE_URL, access_token_ttl=timedelta(minutes=5))
+        self.assertTrue(self.refresher.refresh())
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(holder.get(), calls[0])
+        self.assertEqual(holder.get()['application']['oAuthPolicy']['accessTokenTtl'], 300)
+
+    def test_refresh_without_configuration(self):
+        self.assertFalse(self.refresher.refresh())
+
+    def test_background_refresh(self):
+        refreshed = Event()
+        self.refresher.interval = 0.01
+        self.refresher.callback = refreshed.set
+
+        self.loader.reload()
+        self.api.update('%s/oAuthPolicies/0' % BASE_URL, access_token_ttl=timedelta(minutes=5))
+
+        self.assertTrue(refreshed.wait(5))
+        self.assertEqual(self.loader.reload()['application']['oAuthPolicy']['accessTokenTtl'], 300)
+
+    @patch('stormpath_config.refresh.log')
+    def test_failed_refresh_keeps_last_output(self, log):
+        failed = Event()
+        log.exception.side_effect = lambda *args: failed.set()
+
+        self.refresher.interval = 0.01
+        config = self.loader.reload()
+        del self.api._resources['%s/oAuthPolicies/0' % BASE_URL]
+
+        self.assertTrue(failed.wait(5))
+        self.assertEqual(self.loader.reload(), config)
+        self.assertGreater(self.refresher.failures, 0)
+
+    @patch('stormpath_config.refresh.uniform', return_value=0.1)
+    def test_jitter(self, uniform):
+        self.refresher.jitter = 0.2
+
+        self.assertAlmostEqual(self.refresher._delay(), 3960)
+        uniform.assert_called_once_with(-0.2, 0.2)
+
+    def test_client_factory(self):
+        self.assertIs(self.refresher.strategies[0].client_factory, self.loader.client_provider)
+        self.assertFalse(self.refresher.client_factory)
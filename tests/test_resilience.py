@@ -0,0 +1,167 @@
+"""Tests for the deadline, circuit breaker and fallback of remote strategies."""
+
+
+from json import load
+import os
+from os.path import join
+from shutil import rmtree
+import stat
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.resilience import CircuitBreaker, LastKnownGood, RemoteConfigUnavailable, \
+    ResilientStrategy, _enrichment
+from stormpath_config.strategies import EnrichIntegrationFromRemoteConfigStrategy
+
+from .fake_api import BASE_URL, FakeAPI
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTest(TestCase):
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, timer=self.timer)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_half_open(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.timer.now = 10
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+
+        self.timer.now = 20
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+
+class EnrichmentTest(TestCase):
+    def test_enrichment(self):
+        original = {'application': {'href': 'href'}, 'web': {'social': {}, 'basePath': '/'}}
+        enriched = {'application': {'href': 'href', 'name': 'name'}, 'web': {'social': {'google': {}}, 'basePath': '/'}}
+
+        self.assertEqual(_enrichment(original, enriched), {'application': {'name': 'name'},
+                                                           'web': {'social': {'google': {}}}})
+
+
+class ResilientStrategyTest(TestCase):
+    def setUp(self):
+        self.api = FakeAPI()
+        self.tmp_dir = mkdtemp()
+        self.path = join(self.tmp_dir, 'last_known_good.json')
+        self.timer = FakeTimer()
+        self.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, timer=self.timer)
+        self.strategy = self.resilient_strategy()
+
+    def tearDown(self):
+        rmtree(self.tmp_dir)
+
+    def resilient_strategy(self, timeout=1.0):
+        return ResilientStrategy(EnrichIntegrationFromRemoteConfigStrategy(self.api.client), timeout=timeout,
+                                 breaker=self.breaker, last_known_good=LastKnownGood(self.path))
+
+    def config(self):
+        return {'application': {'href': self.api.application_href(0)}, 'client': {'apiKey': {'id': 'id'}}}
+
+    def test_success(self):
+        config = self.strategy.process(self.config())
+
+        self.assertEqual(config['application']['oAuthPolicy']['accessTokenTtl'], 3600)
+        self.assertNotIn('remoteConfigDegraded', config)
+
+        with open(self.path) as f:
+            persisted = load(f)
+        self.assertEqual(list(persisted.values())[0]['application']['oAuthPolicy']['accessTokenTtl'], 3600)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_file_mode(self):
+        self.strategy.last_known_good = LastKnownGood(self.path, mode=0o640)
+        self.strategy.process(self.config())
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_timeout_falls_back(self):
+        expected = self.strategy.process(self.config())
+
+        self.api.latency = 0.5
+        strategy = self.resilient_strategy(timeout=0.05)
+        config = strategy.process(self.config())
+
+        self.assertTrue(config.pop('remoteConfigDegraded'))
+        self.assertEqual(config, expected)
+        self.assertEqual(strategy.fallbacks, 1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+    def test_open_circuit_falls_back_without_api_calls(self):
+        self.strategy.process(self.config())
+        self.breaker.record_failure()
+        self.api.reset()
+
+        config = self.strategy.process(self.config())
+
+        self.assertTrue(config['remoteConfigDegraded'])
+        self.assertEqual(self.api.requests, 0)
+
+    def test_failure_falls_back(self):
+        self.strategy.process(self.config())
+        del self.api._resources['%s/oAuthPolicies/0' % BASE_URL]
+
+        config = self.strategy.process(self.config())
+
+        self.assertTrue(config['remoteConfigDegraded'])
+        self.assertEqual(config['application']['oAuthPolicy']['accessTokenTtl'], 3600)
+
+    def test_without_last_known_good(self):
+        self.api.latency = 0.5
+
+        with self.assertRaises(RemoteConfigUnavailable):
+            self.resilient_strategy(timeout=0.05).process(self.config())
+
+        with self.assertRaises(RemoteConfigUnavailable):
+            self.resilient_strategy().process(self.config())
+
+    def test_skip_remote_config(self):
+        config = dict(self.config(), skipRemoteConfig=True)
+
+        self.assertEqual(self.strategy.process(config), config)
+        self.assertEqual(self.api.requests, 0)
+
+    def test_client_provider(self):
+        strategy = ResilientStrategy(EnrichIntegrationFromRemoteConfigStrategy())
+        loader = ConfigLoader(validation_strategies=[strategy], client_provider=self.api.client)
+
+        self.assertIs(strategy.strategy.client_factory, loader.client_provider)
+
+
+class LastKnownGoodTest(TestCase):
+    def test_unwritable_path(self):
+        store = LastKnownGood('/nonexistent/directory/last_known_good.json')
+        store.set('key', {'a': 1})
+
+        self.assertEqual(store.get('key'), {'a': 1})
+        self.assertIsNone(LastKnownGood('/nonexistent/directory/last_known_good.json').get('key'))
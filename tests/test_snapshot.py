@@ -0,0 +1,81 @@
+"""Tests for configuration snapshots."""
+
+
+from datetime import datetime
+import os
+from os.path import join
+from shutil import rmtree
+import stat
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from mock import patch
+
+from stormpath_config import snapshot
+from stormpath_config.frozen import freeze
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.snapshot import SnapshotError, build_snapshot, dumps, loads, read_snapshot, \
+    write_snapshot
+from stormpath_config.strategies import ExtendConfigStrategy, LoadFileConfigStrategy
+
+
+CONFIG = {
+    'client': {'apiKey': {'id': 'id', 'secret': 'secret'}, 'cacheManager': {'defaultTtl': 300}},
+    'application': {'name': 'My app', 'href': None, 'oAuthPolicy': {'accessTokenTtl': 3600.0}},
+    'web': {'produces': ['application/json', 'text/html'], 'login': {'enabled': True}},
+}
+
+
+class SnapshotTest(TestCase):
+    def setUp(self):
+        self.dir = mkdtemp()
+        self.addCleanup(rmtree, self.dir)
+        self.path = join(self.dir, 'config.snapshot')
+
+    def test_round_trip(self):
+        write_snapshot(CONFIG, self.path)
+
+        self.assertEqual(read_snapshot(self.path), CONFIG)
+
+    def test_frozen_config(self):
+        self.assertEqual(loads(dumps(freeze(CONFIG))), CONFIG)
+
+    def test_unserializable_values(self):
+        with self.assertRaises(SnapshotError):
+            dumps({'createdAt': datetime(2016, 1, 1)})
+
+    def test_corrupt_snapshot(self):
+        data = dumps(CONFIG)
+
+        with self.assertRaises(SnapshotError):
+            loads(data[:-1] + b'!')
+        with self.assertRaises(SnapshotError):
+            loads(data[:len(snapshot.MAGIC) + 4])
+        with self.assertRaises(SnapshotError):
+            loads(b'{"client": {}}')
+
+    def test_other_versions(self):
+        data = dumps(CONFIG)
+
+        with patch.object(snapshot, 'VERSION', snapshot.VERSION + 1), self.assertRaises(SnapshotError):
+            loads(data)
+        with patch.object(snapshot, '_interpreter', lambda: 'otherpython-1.0'), self.assertRaises(SnapshotError):
+            loads(data)
+
+    def test_build_snapshot(self):
+        loader = ConfigLoader([
+            LoadFileConfigStrategy('tests/assets/default_config.yml', must_exist=True),
+            ExtendConfigStrategy(extend_with={'application': {'name': 'My app'}}),
+        ])
+
+        config = build_snapshot(loader, self.path)
+
+        self.assertEqual(read_snapshot(self.path), config)
+        self.assertEqual(config['application']['name'], 'My app')
+
+    def test_file_mode(self):
+        write_snapshot(CONFIG, self.path)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        write_snapshot(CONFIG, self.path, mode=0o640)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
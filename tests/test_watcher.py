@@ -0,0 +1,114 @@
+"""Tests for configuration file watching."""
+
+
+from os import makedirs
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import sleep
+from unittest import TestCase, skipIf
+
+from stormpath_config.loader import ConfigLoader
+from stormpath_config.strategies import ExtendConfigStrategy, LoadAPIKeyFromConfigStrategy, \
+    LoadFileConfigStrategy
+from stormpath_config.watcher import ConfigWatcher, InotifyBackend, PollingBackend
+
+try:
+    InotifyBackend().close()
+    inotify = True
+except OSError:
+    inotify = False
+
+
+def wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return True
+        sleep(0.01)
+
+    return False
+
+
+class ConfigWatcherTest(TestCase):
+    use_inotify = False
+
+    def setUp(self):
+        self.dir = mkdtemp()
+        self.addCleanup(rmtree, self.dir)
+        self.published = []
+
+    def write(self, path, data):
+        with open(join(self.dir, path), 'w') as f:
+            f.write(data)
+
+    def watch(self, *load_strategies):
+        loader = ConfigLoader(load_strategies, (LoadAPIKeyFromConfigStrategy(),))
+        watcher = ConfigWatcher(loader, self.published.append, debounce=0.1,
+                                use_inotify=self.use_inotify, poll_interval=0.02)
+        watcher.start()
+        self.addCleanup(watcher.stop)
+
+        return watcher
+
+    def test_backend(self):
+        watcher = self.watch()
+
+        self.assertIsInstance(watcher.backend, InotifyBackend if self.use_inotify else PollingBackend)
+
+    def test_reload_on_change(self):
+        self.write('stormpath.yml', 'application:\n  name: First\n')
+        watcher = self.watch(LoadFileConfigStrategy(join(self.dir, 'stormpath.yml')),
+                             ExtendConfigStrategy({'client': {'apiKey': {'id': 'id'}}}))
+
+        self.assertEqual(watcher.config['application']['name'], 'First')
+        self.write('stormpath.yml', 'application:\n  name: Second\n')
+
+        self.assertTrue(wait_for(lambda: watcher.reloads == 1))
+        self.assertEqual(watcher.config['application']['name'], 'Second')
+        self.assertEqual(self.published, [self.published[0], watcher.config])
+
+    def test_files_that_do_not_exist_yet(self):
+        path = join(self.dir, 'missing', 'stormpath.yml')
+        watcher = self.watch(LoadFileConfigStrategy(path))
+
+        self.assertEqual(watcher.config, {})
+        makedirs(join(self.dir, 'missing'))
+        self.write(path, 'application:\n  name: Created\n')
+
+        self.assertTrue(wait_for(lambda: watcher.config.get('application') == {'name': 'Created'}))
+
+    def test_api_key_files(self):
+        self.write('apiKey.properties', 'apiKey.id = first\napiKey.secret = secret\n')
+        self.write('stormpath.yml', 'client:\n  apiKey:\n    file: %s\n' % join(self.dir, 'apiKey.properties'))
+        watcher = self.watch(LoadFileConfigStrategy(join(self.dir, 'stormpath.yml')))
+
+        self.assertIn(join(self.dir, 'apiKey.properties'), watcher.files)
+        self.write('apiKey.properties', 'apiKey.id = second\napiKey.secret = secret\n')
+
+        self.assertTrue(wait_for(lambda: watcher.config['client']['apiKey']['id'] == 'second'))
+
+    def test_bursts_are_debounced(self):
+        self.write('stormpath.yml', 'application:\n  name: App 0\n')
+        watcher = self.watch(LoadFileConfigStrategy(join(self.dir, 'stormpath.yml')))
+
+        for i in range(1, 6):
+            self.write('stormpath.yml', 'application:\n  name: App %d%s\n' % (i, ' ' * i))
+            sleep(0.01)
+
+        self.assertTrue(wait_for(lambda: watcher.config['application']['name'] == 'App 5'))
+        sleep(0.3)
+        self.assertEqual(watcher.reloads, 1)
+
+    def test_failed_reload_keeps_config(self):
+        self.write('stormpath.yml', 'application:\n  name: First\n')
+        watcher = self.watch(LoadFileConfigStrategy(join(self.dir, 'stormpath.yml')))
+        self.write('stormpath.yml', 'application: [\n')
+
+        sleep(0.5)
+        self.assertEqual(watcher.reloads, 0)
+        self.assertEqual(watcher.config['application']['name'], 'First')
+
+
+@skipIf(not inotify, 'inotify is not available.')
+class InotifyConfigWatcherTest(ConfigWatcherTest):
+    use_inotify = True